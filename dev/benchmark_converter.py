@@ -0,0 +1,59 @@
+# SPDX-FileCopyrightText: 2023 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+"""
+Prints the time the package converter needs for 100k packages with the conversion table and with the dispatch on each
+property the converters used before. Run from the repository root with: PYTHONPATH=. python dev/benchmark_converter.py
+"""
+
+import time
+
+from spdx_tools.spdx.casing_tools import snake_case_to_camel_case
+from spdx_tools.spdx.jsonschema.conversion_context import ConversionContext, active_conversion_context
+from spdx_tools.spdx.jsonschema.package_converter import PackageConverter
+from spdx_tools.spdx.jsonschema.package_properties import PackageProperty
+from spdx_tools.spdx.model import Package, SpdxNoAssertion
+from tests.spdx.fixtures import document_fixture
+
+NUMBER_OF_PACKAGES = 100_000
+
+
+def main():
+    converter = PackageConverter()
+    document = document_fixture()
+    packages = [Package("SPDXRef-Package", "package", SpdxNoAssertion())] * NUMBER_OF_PACKAGES
+    property_accessors = converter._get_property_accessors()
+
+    def convert_per_property(package: Package) -> dict:
+        # resolves the name and the accessor of every property for every package, like the converters used to
+        result = {}
+        for package_property in PackageProperty:
+            property_accessor = property_accessors.get(package_property)
+            property_value = property_accessor(package, document) if property_accessor else None
+            if property_value is None:
+                continue
+            if package_property == PackageProperty.SPDX_ID:
+                result["SPDXID"] = property_value
+            else:
+                result[snake_case_to_camel_case.__wrapped__(package_property.name)] = property_value
+        return result
+
+    with active_conversion_context(ConversionContext(document)):
+        start = time.perf_counter()
+        expected_packages = [convert_per_property(package) for package in packages]
+        per_property_duration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        converted_packages = [converter.convert(package, document) for package in packages]
+        table_driven_duration = time.perf_counter() - start
+
+    if converted_packages != expected_packages:
+        raise RuntimeError("The conversion table produces a different result than the dispatch on each property.")
+    print(
+        f"{NUMBER_OF_PACKAGES} packages: per property dispatch: {per_property_duration:.2f} s, "
+        f"conversion table: {table_driven_duration:.2f} s"
+    )
+
+
+if __name__ == "__main__":
+    main()
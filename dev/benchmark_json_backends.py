@@ -0,0 +1,62 @@
+# SPDX-FileCopyrightText: 2023 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+"""
+Prints the throughput of the available JSON backends on the JSON test data.
+Run from the repository root with: python dev/benchmark_json_backends.py
+"""
+
+import json
+import os
+import time
+from glob import glob
+
+from spdx_tools.common.json_backend import get_json_backend, get_json_backend_names
+from spdx_tools.spdx.parser.json import json_parser
+
+ITERATIONS = 20
+JSON_FILES = [
+    file_name
+    for file_name in sorted(glob(os.path.join(os.path.dirname(__file__), "..", "tests", "spdx", "data", "*.json")))
+    if "UTF-16" not in file_name
+]
+
+
+def main():
+    json_strs = []
+    for file_name in JSON_FILES:
+        with open(file_name, encoding="utf-8") as file:
+            json_strs.append(file.read())
+    documents = [json.loads(json_str) for json_str in json_strs]
+    # the streaming writer encodes the elements of the document one at a time
+    elements = [
+        element
+        for document in documents
+        for value in document.values()
+        if isinstance(value, list)
+        for element in value
+    ]
+
+    for backend_name in get_json_backend_names():
+        backend = get_json_backend(backend_name)
+        throughputs = []
+        for benchmark, function, values in [
+            (
+                "documents loaded",
+                lambda json_str: backend.loads(json_parser.remove_json_control_chars(json_str)),
+                json_strs,
+            ),
+            ("documents dumped", backend.dumps, documents),
+            ("elements dumped", backend.dumps, elements),
+        ]:
+            start = time.perf_counter()
+            for _ in range(ITERATIONS):
+                for value in values:
+                    function(value)
+            throughputs.append(f"{len(values) * ITERATIONS / (time.perf_counter() - start):.0f} {benchmark}")
+
+        print(f"{backend_name}: {', '.join(throughputs)} per second")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+# SPDX-FileCopyrightText: 2023 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+"""
+Prints the time the RDF writer needs for documents with an increasing number of files, in the default, the canonical
+and the streaming mode. Run from the repository root with: PYTHONPATH=. python dev/benchmark_rdf_writer.py
+"""
+
+import io
+import time
+
+from spdx_tools.common.spdx_licensing import spdx_licensing
+from spdx_tools.spdx.model import Document, RelationshipType
+from spdx_tools.spdx.writer.rdf.rdf_writer import write_document_to_stream
+from tests.spdx.fixtures import document_fixture, file_fixture, relationship_fixture
+
+NUMBERS_OF_FILES = [25, 50, 100, 200]
+
+
+def document_with_files(number_of_files: int) -> Document:
+    license_expression = spdx_licensing.parse("MIT AND (Apache-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0)")
+    files = [
+        file_fixture(
+            spdx_id=f"SPDXRef-File{index}",
+            name=f"./file{index}",
+            license_concluded=license_expression,
+            license_info_in_file=[license_expression],
+        )
+        for index in range(number_of_files)
+    ]
+    relationships = [
+        relationship_fixture("SPDXRef-Package", RelationshipType.CONTAINS, file.spdx_id) for file in files
+    ]
+    return document_fixture(files=files, relationships=relationships)
+
+
+def main():
+    for number_of_files in NUMBERS_OF_FILES:
+        document = document_with_files(number_of_files)
+        write_times = []
+        for canonical, streaming in [(False, False), (True, False), (False, True)]:
+            start = time.perf_counter()
+            write_document_to_stream(document, io.BytesIO(), False, canonical=canonical, streaming=streaming)
+            write_times.append(time.perf_counter() - start)
+
+        print(
+            f"{number_of_files} files: {write_times[0]:.2f} s, canonical: {write_times[1]:.2f} s, "
+            f"streaming: {write_times[2]:.2f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+# SPDX-FileCopyrightText: 2023 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+"""
+Prints the throughput of the validation of packages, files, snippets, checksums and external package references with
+the precompiled patterns and with re.match() on the pattern strings, like the validators did before. Run from the
+repository root with: PYTHONPATH=. python dev/benchmark_validation.py
+"""
+
+import re
+import time
+
+from beartype.typing import Pattern
+
+from spdx_tools.spdx.validation import (
+    checksum_validator,
+    external_package_ref_validator,
+    package_verification_code_validator,
+    spdx_id_validators,
+    uri_validators,
+)
+from spdx_tools.spdx.validation.checksum_validator import validate_checksum
+from spdx_tools.spdx.validation.document_index import build_document_index
+from spdx_tools.spdx.validation.external_package_ref_validator import validate_external_package_ref
+from spdx_tools.spdx.validation.file_validator import validate_file_within_document
+from spdx_tools.spdx.validation.package_validator import validate_package_within_document
+from spdx_tools.spdx.validation.snippet_validator import validate_snippet_within_document
+from tests.spdx.fixtures import checksum_fixture, document_fixture, external_package_ref_fixture
+
+ITERATIONS = 2_000
+ROUNDS = 5
+SPDX_VERSION = "SPDX-2.3"
+
+
+class UncompiledPattern:
+    """Matches with re.match() on the string of the pattern, which looks it up in the cache of the re module."""
+
+    def __init__(self, pattern: Pattern):
+        self.pattern = pattern.pattern
+        self.flags = pattern.flags
+
+    def match(self, value: str):
+        return re.match(self.pattern, value, self.flags)
+
+
+def use_uncompiled_patterns():
+    for module, name in [
+        (spdx_id_validators, "SPDX_ID_PATTERN"),
+        (spdx_id_validators, "EXTERNAL_DOCUMENT_REF_ID_PATTERN"),
+        (uri_validators, "URL_PATTERN"),
+        (uri_validators, "DOWNLOAD_LOCATION_PATTERN"),
+        (package_verification_code_validator, "VERIFICATION_CODE_PATTERN"),
+    ]:
+        setattr(module, name, UncompiledPattern(getattr(module, name)))
+    for module, name in [
+        (checksum_validator, "CHECKSUM_PATTERNS"),
+        (external_package_ref_validator, "TYPE_TO_PATTERN"),
+    ]:
+        setattr(module, name, {key: UncompiledPattern(pattern) for key, pattern in getattr(module, name).items()})
+
+
+def measure_throughputs() -> dict:
+    document = document_fixture()
+    document_index = build_document_index(document)
+    checksum = checksum_fixture()
+    external_package_ref = external_package_ref_fixture()
+    validations = {
+        "packages": lambda: validate_package_within_document(
+            document.packages[0], SPDX_VERSION, document, document_index
+        ),
+        "files": lambda: validate_file_within_document(document.files[0], SPDX_VERSION, document, document_index),
+        "snippets": lambda: validate_snippet_within_document(
+            document.snippets[0], SPDX_VERSION, document, document_index
+        ),
+        "checksums": lambda: validate_checksum(checksum, "SPDXRef-File", SPDX_VERSION),
+        "external package refs": lambda: validate_external_package_ref(
+            external_package_ref, "SPDXRef-Package", SPDX_VERSION
+        ),
+    }
+
+    throughputs = {}
+    for element_type, validation in validations.items():
+        # fills the caches of the validators, which both measurements share
+        validation()
+        durations = []
+        for _ in range(ROUNDS):
+            start = time.perf_counter()
+            for _ in range(ITERATIONS):
+                validation()
+            durations.append(time.perf_counter() - start)
+        throughputs[element_type] = ITERATIONS / min(durations)
+    return throughputs
+
+
+def main():
+    precompiled_throughputs = measure_throughputs()
+    use_uncompiled_patterns()
+    uncompiled_throughputs = measure_throughputs()
+
+    for element_type, precompiled_throughput in precompiled_throughputs.items():
+        print(
+            f"{element_type}: {uncompiled_throughputs[element_type]:.0f} with re.match(), "
+            f"{precompiled_throughput:.0f} with precompiled patterns per second"
+        )
+
+
+if __name__ == "__main__":
+    main()
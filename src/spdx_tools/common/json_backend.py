@@ -0,0 +1,128 @@
+# SPDX-FileCopyrightText: 2023 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+import codecs
+import json
+from dataclasses import dataclass
+
+from beartype.typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# stands in for a level of indentation while it is doubled, orjson never writes it unescaped
+INDENTATION_PLACEHOLDER = b"\x00"
+# error handler for str.encode("ascii") that escapes everything outside of ASCII like json.dumps()
+JSON_ESCAPE_ERROR_HANDLER = "spdx-tools-json-escape"
+
+
+@dataclass(frozen=True)
+class JsonBackend:
+    name: str
+    # returns the same value as json.loads(json_str), except that orjson reads integers exceeding 64 bit as floats
+    loads: Callable[[str], Any]
+    dumps: Callable[[Any], str]  # produces the same string as json.dumps(value, indent=4)
+
+
+def _loads_with_orjson(json_str: str) -> Any:
+    try:
+        return orjson.loads(json_str)
+    except orjson.JSONDecodeError:
+        # e.g. NaN, Infinity or numbers out of the range of floats, which json.loads() accepts; invalid json raises
+        # the json.JSONDecodeError of json.loads()
+        return json.loads(json_str)
+
+
+def _dumps_with_orjson(value: Any) -> str:
+    if _contains_float(value):
+        # orjson writes floats differently, e.g. 1e16 instead of 1e+16 and null instead of NaN
+        return json.dumps(value, indent=4)
+    try:
+        json_bytes = orjson.dumps(value, option=orjson.OPT_INDENT_2)
+    except orjson.JSONEncodeError:
+        # e.g. integers exceeding 64 bit or keys that are not strings
+        return json.dumps(value, indent=4)
+
+    json_bytes = double_indentation(json_bytes)
+    if json_bytes.isascii():
+        json_str = json_bytes.decode("ascii")
+    else:
+        json_str = json_bytes.decode("utf-8").encode("ascii", JSON_ESCAPE_ERROR_HANDLER).decode("ascii")
+    # the only printable ASCII char that json.dumps() escapes
+    return json_str.replace("\x7f", "\\u007f")
+
+
+def _contains_float(value: Any) -> bool:
+    values = [value]
+    while values:
+        current_value = values.pop()
+        # the exact types are checked first as this runs over every value that is dumped
+        value_type = type(current_value)
+        if value_type is str:
+            continue
+        if value_type is dict or (value_type is not list and isinstance(current_value, dict)):
+            values.extend(current_value.values())
+        elif value_type is list or isinstance(current_value, (list, tuple)):
+            values.extend(current_value)
+        elif isinstance(current_value, float):
+            return True
+    return False
+
+
+def double_indentation(json_bytes: bytes) -> bytes:
+    """
+    Turns the indentation of two spaces per level, as written by orjson, into four spaces per level. Line breaks
+    within json strings are escaped, so every line break is followed by the indentation only. Starting with the
+    deepest level, the indentation is replaced by placeholders first, so that it is not mistaken for a lower level.
+    """
+    depth = 0
+    while b"\n" + b"  " * (depth + 1) in json_bytes:
+        depth += 1
+    for level in range(depth, 0, -1):
+        json_bytes = json_bytes.replace(b"\n" + b"  " * level, b"\n" + INDENTATION_PLACEHOLDER * level)
+    return json_bytes.replace(INDENTATION_PLACEHOLDER, b"    ")
+
+
+def _escape_like_json(error: UnicodeEncodeError) -> Tuple[str, int]:
+    escaped_chars = []
+    for char in error.object[error.start : error.end]:
+        code_point = ord(char)
+        if code_point > 0xFFFF:
+            code_point -= 0x10000
+            escaped_chars.append(
+                "\\u{:04x}\\u{:04x}".format(0xD800 | (code_point >> 10), 0xDC00 | (code_point & 0x3FF))
+            )
+        else:
+            escaped_chars.append("\\u{:04x}".format(code_point))
+    return "".join(escaped_chars), error.end
+
+
+codecs.register_error(JSON_ESCAPE_ERROR_HANDLER, _escape_like_json)
+
+# only those that are installed, the first one is the default
+JSON_BACKENDS: Dict[str, JsonBackend] = {
+    "json": JsonBackend("json", json.loads, lambda value: json.dumps(value, indent=4))
+}
+if orjson is not None:
+    JSON_BACKENDS["orjson"] = JsonBackend("orjson", _loads_with_orjson, _dumps_with_orjson)
+
+
+def get_json_backend_names() -> List[str]:
+    return list(JSON_BACKENDS)
+
+
+def get_json_backend(name: Optional[str] = None) -> JsonBackend:
+    """
+    Returns the backend with the given name, or the one of the standard library's json module, named "json", if no
+    name is given. orjson, if it is installed, has to be chosen explicitly: it is faster and dumps the same strings,
+    but reads integers exceeding 64 bit as floats. Values that orjson treats differently otherwise, like floats when
+    dumping or NaN and Infinity when loading, are left to the json module. Errors while decoding raise a
+    json.JSONDecodeError with every backend.
+    """
+    if name is None:
+        return next(iter(JSON_BACKENDS.values()))
+    if name not in JSON_BACKENDS:
+        raise ValueError(f"JSON backend {name} is not available, available backends are: {get_json_backend_names()}")
+    return JSON_BACKENDS[name]
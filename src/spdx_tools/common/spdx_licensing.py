@@ -1,7 +1,65 @@
 # SPDX-FileCopyrightText: 2023 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-from license_expression import get_spdx_licensing
+from functools import lru_cache
 
-# this getter takes quite long so we only call it once in this singleton module
-spdx_licensing = get_spdx_licensing()
+from beartype.typing import Any, NamedTuple, Optional
+from license_expression import LicenseExpression, Licensing, get_spdx_licensing
+
+
+class LazySpdxLicensing:
+    """
+    Stands in for the Licensing object returned by get_spdx_licensing(), which takes quite long as it loads the whole
+    license index. The object is only created on the first access to one of its attributes, so that importing modules
+    which use it, like the command line tool, stays fast.
+    """
+
+    def __init__(self):
+        self._licensing: Optional[Licensing] = None
+
+    def get_licensing(self) -> Licensing:
+        if self._licensing is None:
+            self._licensing = get_spdx_licensing()
+        return self._licensing
+
+    def __getattr__(self, name: str) -> Any:
+        # private and special attributes are looked up e.g. by copy and pickle before __init__ has run, they must not
+        # be forwarded as that would end in an endless recursion through the missing _licensing
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.get_licensing(), name)
+
+
+# get_spdx_licensing() is only called once in this singleton module
+spdx_licensing = LazySpdxLicensing()
+
+# number of distinct license expression strings whose parsed expressions are kept
+LICENSE_EXPRESSION_CACHE_SIZE = 4096
+
+
+def parse_spdx_license_expression(expression: Any) -> Optional[LicenseExpression]:
+    """
+    Parses the expression like spdx_licensing.parse(). Parsed expressions are cached for the whole process, so the
+    same expression object is returned for the same expression string and shared by all documents that contain it.
+    LicenseExpression objects are mutable, but the model, the validators and the writers never modify them; callers
+    must not modify them either and have to work on a copy.deepcopy() or a fresh spdx_licensing.parse() instead.
+    Invalid expressions raise an ExpressionError each time they are parsed.
+    """
+    if not isinstance(expression, str):
+        return spdx_licensing.parse(expression)
+    # subclasses of str (like rdflib literals) might not compare equal to the plain string
+    return _parse_spdx_license_expression(str(expression))
+
+
+@lru_cache(maxsize=LICENSE_EXPRESSION_CACHE_SIZE)
+def _parse_spdx_license_expression(expression: str) -> Optional[LicenseExpression]:
+    return spdx_licensing.parse(expression)
+
+
+def get_license_expression_cache_info() -> NamedTuple:
+    """Returns the hits, misses, maximum size and current size of the license expression cache."""
+    return _parse_spdx_license_expression.cache_info()
+
+
+def clear_license_expression_cache():
+    _parse_spdx_license_expression.cache_clear()
@@ -1,12 +1,41 @@
 # SPDX-FileCopyrightText: 2023 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-from dataclasses import fields
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import fields, is_dataclass
+from functools import lru_cache
 
-from beartype.typing import Any, Dict
+from beartype.typing import Any, Dict, Iterator, List, Tuple
 
 from spdx_tools.common.typing.constructor_type_errors import ConstructorTypeErrors
 
+_trusted_construction: ContextVar[bool] = ContextVar("trusted_construction", default=False)
+
+
+@contextmanager
+def trusted_construction(enabled: bool = True) -> Iterator[None]:
+    """
+    Context manager that switches off the runtime type checks of all constructors using
+    check_types_and_set_values() for the current thread/context. Values are stored as they are, which makes
+    construction considerably faster. Only use this for input whose types are already guaranteed, e.g. by a parser.
+    The skipped checks can be run afterwards via check_types().
+    If enabled is False, the current mode is left unchanged, so an enclosing trusted_construction() stays in effect.
+    """
+    if not enabled:
+        yield
+        return
+
+    token = _trusted_construction.set(True)
+    try:
+        yield
+    finally:
+        _trusted_construction.reset(token)
+
+
+def is_trusted_construction_active() -> bool:
+    return _trusted_construction.get()
+
 
 def check_types_and_set_values(instance_under_construction: Any, local_variables: Dict) -> None:
     """
@@ -17,7 +46,14 @@ def check_types_and_set_values(instance_under_construction: Any, local_variables
     return all type violations in one go.
     As an aside, defining constructors "manually" using this utility method helps avoid a nasty PyCharm bug:
     https://youtrack.jetbrains.com/issue/PY-34569
+    Inside a trusted_construction() block the values are stored without any type checks.
     """
+    if _trusted_construction.get():
+        attributes = instance_under_construction.__dict__
+        for field_name, attribute_name in _get_field_and_attribute_names(type(instance_under_construction)):
+            attributes[attribute_name] = local_variables.get(field_name)
+        return
+
     errors = []
     for field in fields(instance_under_construction):
         key = field.name
@@ -29,3 +65,34 @@ def check_types_and_set_values(instance_under_construction: Any, local_variables
             errors.append(error_message)
     if errors:
         raise ConstructorTypeErrors(errors)
+
+
+def check_types(instance: Any, recursive: bool = False) -> None:
+    """
+    Runs the type checks of all fields of the given instance, e.g. after it has been constructed inside a
+    trusted_construction() block, and raises a ConstructorTypeErrors instance holding all violations.
+    If recursive is set, all dataclass instances reachable from the fields (directly or via lists) are checked, too.
+    """
+    errors: List[str] = []
+    instances_to_check = [instance]
+    while instances_to_check:
+        current_instance = instances_to_check.pop()
+        for field_name, _ in _get_field_and_attribute_names(type(current_instance)):
+            value = getattr(current_instance, field_name)
+            try:
+                setattr(current_instance, field_name, value)
+            except TypeError as err:
+                errors.append(err.args[0])
+            if recursive:
+                values = value if isinstance(value, list) else [value]
+                instances_to_check.extend(
+                    element for element in values if is_dataclass(element) and not isinstance(element, type)
+                )
+    if errors:
+        raise ConstructorTypeErrors(errors)
+
+
+@lru_cache(maxsize=None)
+def _get_field_and_attribute_names(cls: type) -> Tuple[Tuple[str, str], ...]:
+    # the properties generated by dataclass_with_properties store their values in "_<field name>"
+    return tuple((field.name, f"_{field.name}") for field in fields(cls))
@@ -1,9 +1,11 @@
 # SPDX-FileCopyrightText: 2022 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
+from functools import lru_cache
 from re import sub
 
 
+@lru_cache(maxsize=None)
 def snake_case_to_camel_case(snake_case_string: str) -> str:
     each_word_capitalized = sub(r"[_\-]+", " ", snake_case_string).title().replace(" ", "")
     return each_word_capitalized[0].lower() + each_word_capitalized[1:]
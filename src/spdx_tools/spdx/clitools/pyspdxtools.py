@@ -19,10 +19,9 @@ from xml.parsers.expat import ExpatError
 from xml.sax import SAXParseException
 
 import click
-from beartype.typing import List
+from beartype.typing import List, Optional
 from yaml.scanner import ScannerError
 
-from spdx_tools.spdx.graph_generation import export_graph_from_document
 from spdx_tools.spdx.model import Document
 from spdx_tools.spdx.parser.error import SPDXParsingError
 from spdx_tools.spdx.parser.parse_anything import parse_file
@@ -47,6 +46,12 @@ from spdx_tools.spdx.writer.write_anything import write_file
     default=None,
 )
 @click.option("--novalidation", is_flag=True, help="Don't validate the provided document.")
+@click.option(
+    "--max-errors",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Stop the validation after the given number of issues has been found.",
+)
 @click.option(
     "--graph",
     is_flag=True,
@@ -55,7 +60,7 @@ from spdx_tools.spdx.writer.write_anything import write_file
     "The generated graph is saved to the file specified with --outfile. "
     "Note: You need to install the optional dependencies 'networkx' and 'pygraphviz' for this feature.",
 )
-def main(infile: str, outfile: str, version: str, novalidation: bool, graph: bool):
+def main(infile: str, outfile: str, version: str, novalidation: bool, max_errors: Optional[int], graph: bool):
     """
     CLI-tool for validating SPDX documents and converting between RDF, TAG-VALUE, JSON, YAML and XML formats.
     Formats are determined by the file endings.
@@ -72,10 +77,17 @@ def main(infile: str, outfile: str, version: str, novalidation: bool, graph: boo
                 logging.error(f"This tool only supports SPDX versions SPDX-2.2 and SPDX-2.3, but got: {version}")
                 sys.exit(1)
 
-            validation_messages: List[ValidationMessage] = validate_full_spdx_document(document, version)
+            # one more message than shown tells whether the validation was stopped before its end
+            validation_messages: List[ValidationMessage] = validate_full_spdx_document(
+                document, version, max_messages=max_errors + 1 if max_errors else None
+            )
             if validation_messages:
+                issues_found = "The following issues have been found:"
+                if max_errors and len(validation_messages) > max_errors:
+                    issues_found = f"Validation stopped after the first {max_errors} issues:"
+                    validation_messages = validation_messages[:max_errors]
                 log_string = "\n".join(
-                    ["The document is invalid. The following issues have been found:"]
+                    [f"The document is invalid. {issues_found}"]
                     + [message.validation_message for message in validation_messages]
                 )
                 logging.error(log_string)
@@ -88,6 +100,8 @@ def main(infile: str, outfile: str, version: str, novalidation: bool, graph: boo
 
         elif graph:
             try:
+                from spdx_tools.spdx.graph_generation import export_graph_from_document
+
                 export_graph_from_document(document, outfile)
             except ImportError:
                 logging.error(
@@ -1,12 +1,25 @@
 # SPDX-FileCopyrightText: 2022 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-from copy import deepcopy
+from copy import copy
+from dataclasses import dataclass
 
-from beartype.typing import Any, Dict, List, Union
+from beartype.typing import Any, Dict, List, Optional, Type, Union
 
 from spdx_tools.spdx.model import Document, File, Package, Snippet
 
+# if elements of different types share an spdx_id, the id refers to the first of these types
+ELEMENT_TYPE_PRECEDENCE: List[Union[Type[Package], Type[File], Type[Snippet]]] = [Package, File, Snippet]
+
+
+@dataclass(frozen=True)
+class SpdxIdLocation:
+    """The type of an element with a certain spdx_id and its position in the corresponding list of the document. The
+    document itself is located at position 0 of type Document."""
+
+    element_type: Union[Type[Document], Type[Package], Type[File], Type[Snippet]]
+    position: int
+
 
 def get_contained_spdx_element_ids(document: Document) -> List[str]:
     element_ids = [file.spdx_id for file in document.files]
@@ -15,6 +28,31 @@ def get_contained_spdx_element_ids(document: Document) -> List[str]:
     return element_ids
 
 
+def get_spdx_id_locations(document: Document) -> Dict[str, List[SpdxIdLocation]]:
+    """
+    Collects the spdx_ids of the document and all its files, packages and snippets in a single pass. Every id is
+    mapped to the locations of all elements using it, so that ids with more than one location are duplicates.
+    """
+    spdx_id_locations: Dict[str, List[SpdxIdLocation]] = {
+        document.creation_info.spdx_id: [SpdxIdLocation(Document, 0)]
+    }
+    for element_type, elements in [(File, document.files), (Package, document.packages), (Snippet, document.snippets)]:
+        for position, element in enumerate(elements):
+            spdx_id_locations.setdefault(element.spdx_id, []).append(SpdxIdLocation(element_type, position))
+
+    return spdx_id_locations
+
+
+def get_element_type_from_spdx_id_locations(
+    locations: List[SpdxIdLocation],
+) -> Optional[Union[Type[Package], Type[File], Type[Snippet]]]:
+    element_types = {location.element_type for location in locations}
+    for element_type in ELEMENT_TYPE_PRECEDENCE:
+        if element_type in element_types:
+            return element_type
+    return None
+
+
 def get_element_from_spdx_id(document: Document, spdx_id: str) -> Union[Package, File, Snippet, None]:
     contained_spdx_elements: Dict[str, Union[Package, File, Snippet]] = get_contained_spdx_elements(document)
     if spdx_id not in contained_spdx_elements:
@@ -31,27 +69,56 @@ def get_contained_spdx_elements(document: Document) -> Dict[str, Union[Package,
 
 
 def create_document_without_duplicates(document: Document) -> Document:
-    document_without_duplicates = deepcopy(document)
-    for elements in [
-        [document_without_duplicates.creation_info],
-        document_without_duplicates.files,
-        document_without_duplicates.packages,
-        document_without_duplicates.snippets,
-        document_without_duplicates.extracted_licensing_info,
-    ]:
-        for element in elements:
-            for key, value in element.__dict__.items():
-                if isinstance(value, list):
-                    value_without_duplicates = create_list_without_duplicates(value)
-                    setattr(element, key, value_without_duplicates)
+    """
+    Returns a document whose creation info, files, packages, snippets and extracted licensing infos contain no
+    duplicates in their list properties. The given document is not modified. Only the elements that actually contain
+    duplicates are (shallowly) copied, everything else is shared with the given document.
+    """
+    document_without_duplicates = copy(document)
+    document_without_duplicates.creation_info = create_element_without_duplicates(document.creation_info)
+    for list_name in ["files", "packages", "snippets", "extracted_licensing_info"]:
+        elements = getattr(document, list_name)
+        elements_without_duplicates = [create_element_without_duplicates(element) for element in elements]
+        if any(
+            element_without_duplicates is not element
+            for element_without_duplicates, element in zip(elements_without_duplicates, elements)
+        ):
+            setattr(document_without_duplicates, list_name, elements_without_duplicates)
 
     return document_without_duplicates
 
 
+def create_element_without_duplicates(element: Any) -> Any:
+    """Returns the element itself if none of its list properties contains duplicates, otherwise a shallow copy of the
+    element with the duplicates removed."""
+    element_without_duplicates = element
+    for key, value in element.__dict__.items():
+        if isinstance(value, list):
+            value_without_duplicates = create_list_without_duplicates(value)
+            if len(value_without_duplicates) != len(value):
+                if element_without_duplicates is element:
+                    element_without_duplicates = copy(element)
+                setattr(element_without_duplicates, key, value_without_duplicates)
+
+    return element_without_duplicates
+
+
 def create_list_without_duplicates(list_with_potential_duplicates: List[Any]) -> List[Any]:
     list_without_duplicates = []
+    # as most elements of the data model are unhashable, they are grouped by a canonical key first, so that each
+    # element only has to be compared to the (usually none or single) previous elements with the same key
+    elements_by_key: Dict[Any, List[Any]] = dict()
     for element in list_with_potential_duplicates:
-        if element not in list_without_duplicates:
+        elements_with_same_key = elements_by_key.setdefault(_get_canonical_key(element), [])
+        if element not in elements_with_same_key:
+            elements_with_same_key.append(element)
             list_without_duplicates.append(element)
 
     return list_without_duplicates
+
+
+def _get_canonical_key(element: Any) -> Any:
+    try:
+        return hash(element)
+    except TypeError:
+        return repr(element)
@@ -1,7 +1,7 @@
 # SPDX-FileCopyrightText: 2023 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-from beartype.typing import Dict, List, Union
+from beartype.typing import Dict, Union
 
 from spdx_tools.spdx.model import File, Package, Snippet
 
@@ -10,7 +10,8 @@ try:
 except ImportError:
     DiGraph = None
 from spdx_tools.spdx.document_utils import get_contained_spdx_elements
-from spdx_tools.spdx.model import Document, Relationship
+from spdx_tools.spdx.model import Document
+from spdx_tools.spdx.model.relationship_index import RelationshipIndex
 
 
 def export_graph_from_document(document: Document, file_name: str) -> None:
@@ -32,11 +33,7 @@ def generate_relationship_graph_from_spdx(document: Document) -> DiGraph:
     contained_element_nodes = [(spdx_id, {"element": element}) for spdx_id, element in contained_elements.items()]
     graph.add_nodes_from(contained_element_nodes)
 
-    relationships_by_spdx_id: Dict[str, List[Relationship]] = dict()
-    for relationship in document.relationships:
-        relationships_by_spdx_id.setdefault(relationship.spdx_element_id, []).append(relationship)
-
-    for spdx_id, relationships in relationships_by_spdx_id.items():
+    for spdx_id, relationships in RelationshipIndex(document.relationships).by_origin.items():
         if spdx_id not in graph.nodes():
             # this will add any external spdx_id to the graph where we have no further information about the element,
             # to indicate that this node represents an element we add the attribute "element"
@@ -1,27 +1,25 @@
 # SPDX-FileCopyrightText: 2022 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-from beartype.typing import Any, Type
+from beartype.typing import Dict, Type
 
 from spdx_tools.spdx.datetime_conversions import datetime_to_iso_string
 from spdx_tools.spdx.jsonschema.annotation_properties import AnnotationProperty
-from spdx_tools.spdx.jsonschema.converter import TypedConverter
+from spdx_tools.spdx.jsonschema.converter import PropertyAccessor, TypedConverter
 from spdx_tools.spdx.jsonschema.json_property import JsonProperty
-from spdx_tools.spdx.model import Annotation, Document
+from spdx_tools.spdx.model import Annotation
 
 
 class AnnotationConverter(TypedConverter[Annotation]):
-    def _get_property_value(
-        self, annotation: Annotation, annotation_property: AnnotationProperty, document: Document = None
-    ) -> Any:
-        if annotation_property == AnnotationProperty.ANNOTATION_DATE:
-            return datetime_to_iso_string(annotation.annotation_date)
-        elif annotation_property == AnnotationProperty.ANNOTATION_TYPE:
-            return annotation.annotation_type.name
-        elif annotation_property == AnnotationProperty.ANNOTATOR:
-            return annotation.annotator.to_serialized_string()
-        elif annotation_property == AnnotationProperty.COMMENT:
-            return annotation.annotation_comment
+    def _get_property_accessors(self) -> Dict[AnnotationProperty, PropertyAccessor]:
+        return {
+            AnnotationProperty.ANNOTATION_DATE: lambda annotation, _: datetime_to_iso_string(
+                annotation.annotation_date
+            ),
+            AnnotationProperty.ANNOTATION_TYPE: lambda annotation, _: annotation.annotation_type.name,
+            AnnotationProperty.ANNOTATOR: lambda annotation, _: annotation.annotator.to_serialized_string(),
+            AnnotationProperty.COMMENT: lambda annotation, _: annotation.annotation_comment,
+        }
 
     def get_json_type(self) -> Type[JsonProperty]:
         return AnnotationProperty
@@ -1,12 +1,12 @@
 # SPDX-FileCopyrightText: 2022 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-from beartype.typing import Type
+from beartype.typing import Dict, Type
 
 from spdx_tools.spdx.jsonschema.checksum_properties import ChecksumProperty
-from spdx_tools.spdx.jsonschema.converter import TypedConverter
+from spdx_tools.spdx.jsonschema.converter import PropertyAccessor, TypedConverter
 from spdx_tools.spdx.jsonschema.json_property import JsonProperty
-from spdx_tools.spdx.model import Checksum, ChecksumAlgorithm, Document
+from spdx_tools.spdx.model import Checksum, ChecksumAlgorithm
 
 
 class ChecksumConverter(TypedConverter[Checksum]):
@@ -16,13 +16,11 @@ class ChecksumConverter(TypedConverter[Checksum]):
     def get_json_type(self) -> Type[JsonProperty]:
         return ChecksumProperty
 
-    def _get_property_value(
-        self, checksum: Checksum, checksum_property: ChecksumProperty, _document: Document = None
-    ) -> str:
-        if checksum_property == ChecksumProperty.ALGORITHM:
-            return algorithm_to_json_string(checksum.algorithm)
-        elif checksum_property == ChecksumProperty.CHECKSUM_VALUE:
-            return checksum.value
+    def _get_property_accessors(self) -> Dict[ChecksumProperty, PropertyAccessor]:
+        return {
+            ChecksumProperty.ALGORITHM: lambda checksum, _: algorithm_to_json_string(checksum.algorithm),
+            ChecksumProperty.CHECKSUM_VALUE: lambda checksum, _: checksum.value,
+        }
 
 
 def algorithm_to_json_string(algorithm: ChecksumAlgorithm) -> str:
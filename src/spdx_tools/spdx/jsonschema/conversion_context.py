@@ -0,0 +1,53 @@
+# SPDX-FileCopyrightText: 2023 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from beartype.typing import Dict, Iterator, List, Optional, Set
+
+from spdx_tools.spdx.document_utils import get_contained_spdx_element_ids
+from spdx_tools.spdx.model import Annotation, Document
+
+
+class ConversionContext:
+    """
+    Lookups over a document that the converters of its elements need, e.g. to find the annotations of each element.
+    They are computed once per document conversion instead of once per element.
+    """
+
+    def __init__(self, document: Document):
+        self.document = document
+        self.contained_spdx_element_ids: Set[str] = set(get_contained_spdx_element_ids(document))
+        self.annotations_by_spdx_id: Dict[str, List[Annotation]] = dict()
+        for annotation in document.annotations:
+            self.annotations_by_spdx_id.setdefault(annotation.spdx_id, []).append(annotation)
+
+    def get_annotations(self, spdx_id: str) -> List[Annotation]:
+        return self.annotations_by_spdx_id.get(spdx_id, [])
+
+
+_active_conversion_context: ContextVar[Optional[ConversionContext]] = ContextVar(
+    "active_conversion_context", default=None
+)
+
+
+@contextmanager
+def active_conversion_context(context: ConversionContext) -> Iterator[ConversionContext]:
+    """Makes get_conversion_context() return the given context for its document within this block."""
+    token = _active_conversion_context.set(context)
+    try:
+        yield context
+    finally:
+        _active_conversion_context.reset(token)
+
+
+def get_conversion_context(document: Document) -> ConversionContext:
+    """
+    Returns the context of the conversion that is currently running for the given document. If there is none, e.g. if
+    an element converter is used on its own, a new context is built.
+    """
+    context = _active_conversion_context.get()
+    if context is None or context.document is not document:
+        return ConversionContext(document)
+    return context
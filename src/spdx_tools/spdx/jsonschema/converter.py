@@ -2,8 +2,9 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 from abc import ABC, abstractmethod
+from functools import partial
 
-from beartype.typing import Any, Dict, Generic, Type, TypeVar
+from beartype.typing import Any, Callable, Dict, Generic, List, Optional, Tuple, Type, TypeVar
 
 from spdx_tools.spdx.casing_tools import snake_case_to_camel_case
 from spdx_tools.spdx.jsonschema.json_property import JsonProperty
@@ -13,6 +14,9 @@ MISSING_IMPLEMENTATION_MESSAGE = "Must be implemented"
 
 T = TypeVar("T")
 
+# retrieves the value of a json property from a data model instance and the (optional) full document
+PropertyAccessor = Callable[[Any, Optional[Document]], Any]
+
 
 class TypedConverter(ABC, Generic[T]):
     """
@@ -28,13 +32,24 @@ class TypedConverter(ABC, Generic[T]):
     cases, the full document is required (see below). The logic should be generic for all types.
     - requires_full_document: indicates whether the full document is required for conversion. Returns False by
     default, can be overridden as needed for specific types.
+    - _get_property_accessors: returns a function per json property that retrieves its value from the data model
+    instance (and the full document, if required). Properties without an accessor are not converted. Returns None by
+    default, in which case every property is retrieved via _get_property_value.
     - _get_property_value: Retrieves the value of a specific json property from the data model instance. In some
-    cases, the full document is required.
+    cases, the full document is required. The default implementation uses the accessor of the property.
+    The json property names and accessors are compiled once per converter into a conversion table (see
+    get_conversion_table), so that converting an instance does not have to dispatch on each property.
     """
 
-    @abstractmethod
+    def _get_property_accessors(self) -> Optional[Dict[JsonProperty, PropertyAccessor]]:
+        return None
+
     def _get_property_value(self, instance: T, json_property: JsonProperty, document: Document = None) -> Any:
-        raise NotImplementedError(MISSING_IMPLEMENTATION_MESSAGE)
+        property_accessors = self._get_property_accessors()
+        if property_accessors is None:
+            raise NotImplementedError(MISSING_IMPLEMENTATION_MESSAGE)
+        property_accessor = property_accessors.get(json_property)
+        return property_accessor(instance, document) if property_accessor else None
 
     @abstractmethod
     def get_json_type(self) -> Type[JsonProperty]:
@@ -60,9 +75,35 @@ class TypedConverter(ABC, Generic[T]):
             raise ValueError(f"Converter of type {self.__class__} requires the full document")
 
         result = {}
-        for property_name in self.get_json_type():
-            property_value = self._get_property_value(instance, property_name, document)
-            if property_value is None:
-                continue
-            result[self.json_property_name(property_name)] = property_value
+        for json_property_name, property_accessor in self.get_conversion_table():
+            property_value = property_accessor(instance, document)
+            if property_value is not None:
+                result[json_property_name] = property_value
         return result
+
+    def get_conversion_table(self) -> List[Tuple[str, PropertyAccessor]]:
+        """
+        Returns the (json property name, accessor) pairs of all converted properties in the order of the json type.
+        The table is built on first use and then kept for the lifetime of the converter.
+        """
+        conversion_table = self.__dict__.get("_conversion_table")
+        if conversion_table is None:
+            conversion_table = self._build_conversion_table()
+            self._conversion_table = conversion_table
+        return conversion_table
+
+    def _build_conversion_table(self) -> List[Tuple[str, PropertyAccessor]]:
+        property_accessors = self._get_property_accessors()
+        if property_accessors is None:
+            return [
+                (self.json_property_name(json_property), partial(self._get_value_of_property, json_property))
+                for json_property in self.get_json_type()
+            ]
+        return [
+            (self.json_property_name(json_property), property_accessors[json_property])
+            for json_property in self.get_json_type()
+            if json_property in property_accessors
+        ]
+
+    def _get_value_of_property(self, json_property: JsonProperty, instance: T, document: Optional[Document]) -> Any:
+        return self._get_property_value(instance, json_property, document)
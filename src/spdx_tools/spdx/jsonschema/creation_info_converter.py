@@ -1,14 +1,14 @@
 # SPDX-FileCopyrightText: 2022 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-from beartype.typing import Any, Type
+from beartype.typing import Dict, Type
 
 from spdx_tools.spdx.datetime_conversions import datetime_to_iso_string
-from spdx_tools.spdx.jsonschema.converter import TypedConverter
+from spdx_tools.spdx.jsonschema.converter import PropertyAccessor, TypedConverter
 from spdx_tools.spdx.jsonschema.creation_info_properties import CreationInfoProperty
 from spdx_tools.spdx.jsonschema.json_property import JsonProperty
 from spdx_tools.spdx.jsonschema.optional_utils import apply_if_present
-from spdx_tools.spdx.model import CreationInfo, Document
+from spdx_tools.spdx.model import CreationInfo
 
 
 class CreationInfoConverter(TypedConverter[CreationInfo]):
@@ -18,14 +18,15 @@ class CreationInfoConverter(TypedConverter[CreationInfo]):
     def get_json_type(self) -> Type[JsonProperty]:
         return CreationInfoProperty
 
-    def _get_property_value(
-        self, creation_info: CreationInfo, creation_info_property: CreationInfoProperty, _document: Document = None
-    ) -> Any:
-        if creation_info_property == CreationInfoProperty.CREATED:
-            return datetime_to_iso_string(creation_info.created)
-        elif creation_info_property == CreationInfoProperty.CREATORS:
-            return [creator.to_serialized_string() for creator in creation_info.creators] or None
-        elif creation_info_property == CreationInfoProperty.LICENSE_LIST_VERSION:
-            return apply_if_present(str, creation_info.license_list_version)
-        elif creation_info_property == CreationInfoProperty.COMMENT:
-            return creation_info.creator_comment
+    def _get_property_accessors(self) -> Dict[CreationInfoProperty, PropertyAccessor]:
+        return {
+            CreationInfoProperty.CREATED: lambda creation_info, _: datetime_to_iso_string(creation_info.created),
+            CreationInfoProperty.CREATORS: lambda creation_info, _: [
+                creator.to_serialized_string() for creator in creation_info.creators
+            ]
+            or None,
+            CreationInfoProperty.LICENSE_LIST_VERSION: lambda creation_info, _: apply_if_present(
+                str, creation_info.license_list_version
+            ),
+            CreationInfoProperty.COMMENT: lambda creation_info, _: creation_info.creator_comment,
+        }
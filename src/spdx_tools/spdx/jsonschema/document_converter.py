@@ -1,10 +1,14 @@
 # SPDX-FileCopyrightText: 2022 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-from beartype.typing import Any, Type
+from beartype.typing import Any, Dict, Iterable, Iterator, Tuple, Type
 
-from spdx_tools.spdx.document_utils import get_contained_spdx_element_ids
 from spdx_tools.spdx.jsonschema.annotation_converter import AnnotationConverter
+from spdx_tools.spdx.jsonschema.conversion_context import (
+    ConversionContext,
+    active_conversion_context,
+    get_conversion_context,
+)
 from spdx_tools.spdx.jsonschema.converter import TypedConverter
 from spdx_tools.spdx.jsonschema.creation_info_converter import CreationInfoConverter
 from spdx_tools.spdx.jsonschema.document_properties import DocumentProperty
@@ -49,6 +53,46 @@ class DocumentConverter(TypedConverter[Document]):
             return "SPDXID"
         return super().json_property_name(document_property)
 
+    def convert(self, document: Document, _document: Document = None) -> Dict:
+        with active_conversion_context(ConversionContext(document)):
+            return super().convert(document)
+
+    def iter_converted_properties(self, document: Document) -> Iterator[Tuple[str, Any]]:
+        """
+        Yields the same (json property name, value) pairs as convert() in the same order. The values of packages,
+        files, snippets and relationships are iterators instead of lists, which convert one element at a time, so that
+        the converted document never has to be held in memory as a whole.
+        """
+        streamed_properties = {
+            DocumentProperty.PACKAGES: (self.package_converter, document.packages),
+            DocumentProperty.FILES: (self.file_converter, document.files),
+            DocumentProperty.SNIPPETS: (self.snippet_converter, document.snippets),
+            DocumentProperty.RELATIONSHIPS: (self.relationship_converter, document.relationships),
+        }
+        context = ConversionContext(document)
+        for document_property in self.get_json_type():
+            if document_property in streamed_properties:
+                element_converter, elements = streamed_properties[document_property]
+                if elements:
+                    yield self.json_property_name(document_property), self._convert_elements(
+                        element_converter, elements, context
+                    )
+                continue
+            with active_conversion_context(context):
+                property_value = self._get_property_value(document, document_property, document)
+            if property_value is not None:
+                yield self.json_property_name(document_property), property_value
+
+    @staticmethod
+    def _convert_elements(
+        element_converter: TypedConverter, elements: Iterable[Any], context: ConversionContext
+    ) -> Iterator[Dict]:
+        # the context must only be active during the conversion, not while the generator is suspended
+        for element in elements:
+            with active_conversion_context(context):
+                converted_element = element_converter.convert(element, context.document)
+            yield converted_element
+
     def _get_property_value(
         self, document: Document, document_property: DocumentProperty, _document: Document = None
     ) -> Any:
@@ -56,7 +100,7 @@ class DocumentConverter(TypedConverter[Document]):
             return document.creation_info.spdx_id
         elif document_property == DocumentProperty.ANNOTATIONS:
             # annotations referencing files, packages or snippets will be added to those elements directly
-            element_ids = get_contained_spdx_element_ids(document)
+            element_ids = get_conversion_context(document).contained_spdx_element_ids
             document_annotations = filter(
                 lambda annotation: annotation.spdx_id not in element_ids, document.annotations
             )
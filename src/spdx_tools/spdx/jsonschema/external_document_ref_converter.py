@@ -1,13 +1,13 @@
 # SPDX-FileCopyrightText: 2022 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-from beartype.typing import Any, Type
+from beartype.typing import Dict, Type
 
 from spdx_tools.spdx.jsonschema.checksum_converter import ChecksumConverter
-from spdx_tools.spdx.jsonschema.converter import TypedConverter
+from spdx_tools.spdx.jsonschema.converter import PropertyAccessor, TypedConverter
 from spdx_tools.spdx.jsonschema.external_document_ref_properties import ExternalDocumentRefProperty
 from spdx_tools.spdx.jsonschema.json_property import JsonProperty
-from spdx_tools.spdx.model import Document, ExternalDocumentRef
+from spdx_tools.spdx.model import ExternalDocumentRef
 
 
 class ExternalDocumentRefConverter(TypedConverter[ExternalDocumentRef]):
@@ -16,18 +16,18 @@ class ExternalDocumentRefConverter(TypedConverter[ExternalDocumentRef]):
     def __init__(self):
         self.checksum_converter = ChecksumConverter()
 
-    def _get_property_value(
-        self,
-        external_document_ref: ExternalDocumentRef,
-        external_document_ref_property: ExternalDocumentRefProperty,
-        _document: Document = None,
-    ) -> Any:
-        if external_document_ref_property == ExternalDocumentRefProperty.EXTERNAL_DOCUMENT_ID:
-            return external_document_ref.document_ref_id
-        elif external_document_ref_property == ExternalDocumentRefProperty.SPDX_DOCUMENT:
-            return external_document_ref.document_uri
-        elif external_document_ref_property == ExternalDocumentRefProperty.CHECKSUM:
-            return self.checksum_converter.convert(external_document_ref.checksum)
+    def _get_property_accessors(self) -> Dict[ExternalDocumentRefProperty, PropertyAccessor]:
+        return {
+            ExternalDocumentRefProperty.EXTERNAL_DOCUMENT_ID: lambda external_document_ref, _: (
+                external_document_ref.document_ref_id
+            ),
+            ExternalDocumentRefProperty.SPDX_DOCUMENT: lambda external_document_ref, _: (
+                external_document_ref.document_uri
+            ),
+            ExternalDocumentRefProperty.CHECKSUM: lambda external_document_ref, _: self.checksum_converter.convert(
+                external_document_ref.checksum
+            ),
+        }
 
     def get_json_type(self) -> Type[JsonProperty]:
         return ExternalDocumentRefProperty
@@ -1,18 +1,19 @@
 # SPDX-FileCopyrightText: 2022 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-from beartype.typing import Any, Type
+from beartype.typing import Any, Dict, Optional, Type, Union
 
 from spdx_tools.spdx.datetime_conversions import datetime_to_iso_string
 from spdx_tools.spdx.jsonschema.annotation_converter import AnnotationConverter
 from spdx_tools.spdx.jsonschema.checksum_converter import ChecksumConverter
-from spdx_tools.spdx.jsonschema.converter import TypedConverter
+from spdx_tools.spdx.jsonschema.conversion_context import get_conversion_context
+from spdx_tools.spdx.jsonschema.converter import PropertyAccessor, TypedConverter
 from spdx_tools.spdx.jsonschema.external_package_ref_converter import ExternalPackageRefConverter
 from spdx_tools.spdx.jsonschema.json_property import JsonProperty
 from spdx_tools.spdx.jsonschema.optional_utils import apply_if_present
 from spdx_tools.spdx.jsonschema.package_properties import PackageProperty
 from spdx_tools.spdx.jsonschema.package_verification_code_converter import PackageVerificationCodeConverter
-from spdx_tools.spdx.model import Actor, Document, Package
+from spdx_tools.spdx.model import Actor, Document, Package, SpdxNoAssertion
 
 
 class PackageConverter(TypedConverter[Package]):
@@ -32,75 +33,60 @@ class PackageConverter(TypedConverter[Package]):
             return "SPDXID"
         return super().json_property_name(package_property)
 
-    def _get_property_value(
-        self, package: Package, package_property: PackageProperty, document: Document = None
-    ) -> Any:
-        if package_property == PackageProperty.SPDX_ID:
-            return package.spdx_id
-        elif package_property == PackageProperty.ANNOTATIONS:
-            package_annotations = filter(
-                lambda annotation: annotation.spdx_id == package.spdx_id, document.annotations
-            )
-            return [
-                self.annotation_converter.convert(annotation, document) for annotation in package_annotations
-            ] or None
-        elif package_property == PackageProperty.ATTRIBUTION_TEXTS:
-            return package.attribution_texts or None
-        elif package_property == PackageProperty.BUILT_DATE:
-            return apply_if_present(datetime_to_iso_string, package.built_date)
-        elif package_property == PackageProperty.CHECKSUMS:
-            return [self.checksum_converter.convert(checksum, document) for checksum in package.checksums] or None
-        elif package_property == PackageProperty.COMMENT:
-            return package.comment
-        elif package_property == PackageProperty.COPYRIGHT_TEXT:
-            return apply_if_present(str, package.copyright_text)
-        elif package_property == PackageProperty.DESCRIPTION:
-            return package.description
-        elif package_property == PackageProperty.DOWNLOAD_LOCATION:
-            return str(package.download_location)
-        elif package_property == PackageProperty.EXTERNAL_REFS:
-            return [
+    def _get_property_accessors(self) -> Dict[PackageProperty, PropertyAccessor]:
+        return {
+            PackageProperty.SPDX_ID: lambda package, _: package.spdx_id,
+            PackageProperty.ANNOTATIONS: self._get_annotations,
+            PackageProperty.ATTRIBUTION_TEXTS: lambda package, _: package.attribution_texts or None,
+            PackageProperty.BUILT_DATE: lambda package, _: apply_if_present(
+                datetime_to_iso_string, package.built_date
+            ),
+            PackageProperty.CHECKSUMS: lambda package, document: [
+                self.checksum_converter.convert(checksum, document) for checksum in package.checksums
+            ]
+            or None,
+            PackageProperty.COMMENT: lambda package, _: package.comment,
+            PackageProperty.COPYRIGHT_TEXT: lambda package, _: apply_if_present(str, package.copyright_text),
+            PackageProperty.DESCRIPTION: lambda package, _: package.description,
+            PackageProperty.DOWNLOAD_LOCATION: lambda package, _: str(package.download_location),
+            PackageProperty.EXTERNAL_REFS: lambda package, _: [
                 self.external_package_ref_converter.convert(external_ref)
                 for external_ref in package.external_references
-            ] or None
-        elif package_property == PackageProperty.FILES_ANALYZED:
-            return package.files_analyzed
-        elif package_property == PackageProperty.HOMEPAGE:
-            return apply_if_present(str, package.homepage)
-        elif package_property == PackageProperty.LICENSE_COMMENTS:
-            return package.license_comment
-        elif package_property == PackageProperty.LICENSE_CONCLUDED:
-            return apply_if_present(str, package.license_concluded)
-        elif package_property == PackageProperty.LICENSE_DECLARED:
-            return apply_if_present(str, package.license_declared)
-        elif package_property == PackageProperty.LICENSE_INFO_FROM_FILES:
-            return [str(license_expression) for license_expression in package.license_info_from_files] or None
-        elif package_property == PackageProperty.NAME:
-            return package.name
-        elif package_property == PackageProperty.ORIGINATOR:
-            if isinstance(package.originator, Actor):
-                return package.originator.to_serialized_string()
-            return apply_if_present(str, package.originator)
-        elif package_property == PackageProperty.PACKAGE_FILE_NAME:
-            return package.file_name
-        elif package_property == PackageProperty.PACKAGE_VERIFICATION_CODE:
-            return apply_if_present(self.package_verification_code_converter.convert, package.verification_code)
-        elif package_property == PackageProperty.PRIMARY_PACKAGE_PURPOSE:
-            return package.primary_package_purpose.name if package.primary_package_purpose is not None else None
-        elif package_property == PackageProperty.RELEASE_DATE:
-            return apply_if_present(datetime_to_iso_string, package.release_date)
-        elif package_property == PackageProperty.SOURCE_INFO:
-            return package.source_info
-        elif package_property == PackageProperty.SUMMARY:
-            return package.summary
-        elif package_property == PackageProperty.SUPPLIER:
-            if isinstance(package.supplier, Actor):
-                return package.supplier.to_serialized_string()
-            return apply_if_present(str, package.supplier)
-        elif package_property == PackageProperty.VALID_UNTIL_DATE:
-            return apply_if_present(datetime_to_iso_string, package.valid_until_date)
-        elif package_property == PackageProperty.VERSION_INFO:
-            return package.version
+            ]
+            or None,
+            PackageProperty.FILES_ANALYZED: lambda package, _: package.files_analyzed,
+            PackageProperty.HOMEPAGE: lambda package, _: apply_if_present(str, package.homepage),
+            PackageProperty.LICENSE_COMMENTS: lambda package, _: package.license_comment,
+            PackageProperty.LICENSE_CONCLUDED: lambda package, _: apply_if_present(str, package.license_concluded),
+            PackageProperty.LICENSE_DECLARED: lambda package, _: apply_if_present(str, package.license_declared),
+            PackageProperty.LICENSE_INFO_FROM_FILES: lambda package, _: [
+                str(license_expression) for license_expression in package.license_info_from_files
+            ]
+            or None,
+            PackageProperty.NAME: lambda package, _: package.name,
+            PackageProperty.ORIGINATOR: lambda package, _: convert_actor(package.originator),
+            PackageProperty.PACKAGE_FILE_NAME: lambda package, _: package.file_name,
+            PackageProperty.PACKAGE_VERIFICATION_CODE: lambda package, _: apply_if_present(
+                self.package_verification_code_converter.convert, package.verification_code
+            ),
+            PackageProperty.PRIMARY_PACKAGE_PURPOSE: lambda package, _: (
+                package.primary_package_purpose.name if package.primary_package_purpose is not None else None
+            ),
+            PackageProperty.RELEASE_DATE: lambda package, _: apply_if_present(
+                datetime_to_iso_string, package.release_date
+            ),
+            PackageProperty.SOURCE_INFO: lambda package, _: package.source_info,
+            PackageProperty.SUMMARY: lambda package, _: package.summary,
+            PackageProperty.SUPPLIER: lambda package, _: convert_actor(package.supplier),
+            PackageProperty.VALID_UNTIL_DATE: lambda package, _: apply_if_present(
+                datetime_to_iso_string, package.valid_until_date
+            ),
+            PackageProperty.VERSION_INFO: lambda package, _: package.version,
+        }
+
+    def _get_annotations(self, package: Package, document: Document) -> Any:
+        package_annotations = get_conversion_context(document).get_annotations(package.spdx_id)
+        return [self.annotation_converter.convert(annotation, document) for annotation in package_annotations] or None
 
     def get_json_type(self) -> Type[JsonProperty]:
         return PackageProperty
@@ -110,3 +96,9 @@ class PackageConverter(TypedConverter[Package]):
 
     def requires_full_document(self) -> bool:
         return True
+
+
+def convert_actor(actor: Optional[Union[Actor, SpdxNoAssertion]]) -> Optional[str]:
+    if isinstance(actor, Actor):
+        return actor.to_serialized_string()
+    return apply_if_present(str, actor)
@@ -1,25 +1,24 @@
 # SPDX-FileCopyrightText: 2022 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-from beartype.typing import Any, Type
+from beartype.typing import Dict, Type
 
-from spdx_tools.spdx.jsonschema.converter import TypedConverter
+from spdx_tools.spdx.jsonschema.converter import PropertyAccessor, TypedConverter
 from spdx_tools.spdx.jsonschema.json_property import JsonProperty
 from spdx_tools.spdx.jsonschema.package_verification_code_properties import PackageVerificationCodeProperty
-from spdx_tools.spdx.model import Document, PackageVerificationCode
+from spdx_tools.spdx.model import PackageVerificationCode
 
 
 class PackageVerificationCodeConverter(TypedConverter[PackageVerificationCode]):
-    def _get_property_value(
-        self,
-        verification_code: PackageVerificationCode,
-        verification_code_property: PackageVerificationCodeProperty,
-        document: Document = None,
-    ) -> Any:
-        if verification_code_property == PackageVerificationCodeProperty.PACKAGE_VERIFICATION_CODE_EXCLUDED_FILES:
-            return verification_code.excluded_files or None
-        elif verification_code_property == PackageVerificationCodeProperty.PACKAGE_VERIFICATION_CODE_VALUE:
-            return verification_code.value
+    def _get_property_accessors(self) -> Dict[PackageVerificationCodeProperty, PropertyAccessor]:
+        return {
+            PackageVerificationCodeProperty.PACKAGE_VERIFICATION_CODE_EXCLUDED_FILES: lambda verification_code, _: (
+                verification_code.excluded_files or None
+            ),
+            PackageVerificationCodeProperty.PACKAGE_VERIFICATION_CODE_VALUE: lambda verification_code, _: (
+                verification_code.value
+            ),
+        }
 
     def get_json_type(self) -> Type[JsonProperty]:
         return PackageVerificationCodeProperty
@@ -1,10 +1,11 @@
 # SPDX-FileCopyrightText: 2022 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-from beartype.typing import Any, Dict, Tuple, Type
+from beartype.typing import Any, Dict, List, Tuple, Type
 
 from spdx_tools.spdx.jsonschema.annotation_converter import AnnotationConverter
-from spdx_tools.spdx.jsonschema.converter import TypedConverter
+from spdx_tools.spdx.jsonschema.conversion_context import get_conversion_context
+from spdx_tools.spdx.jsonschema.converter import PropertyAccessor, TypedConverter
 from spdx_tools.spdx.jsonschema.json_property import JsonProperty
 from spdx_tools.spdx.jsonschema.optional_utils import apply_if_present
 from spdx_tools.spdx.jsonschema.snippet_properties import SnippetProperty
@@ -22,37 +23,27 @@ class SnippetConverter(TypedConverter[Snippet]):
             return "SPDXID"
         return super().json_property_name(snippet_property)
 
-    def _get_property_value(
-        self, snippet: Snippet, snippet_property: SnippetProperty, document: Document = None
-    ) -> Any:
-        if snippet_property == SnippetProperty.SPDX_ID:
-            return snippet.spdx_id
-        elif snippet_property == SnippetProperty.ANNOTATIONS:
-            snippet_annotations = filter(
-                lambda annotation: annotation.spdx_id == snippet.spdx_id, document.annotations
-            )
-            return [self.annotation_converter.convert(annotation) for annotation in snippet_annotations] or None
-        elif snippet_property == SnippetProperty.ATTRIBUTION_TEXTS:
-            return snippet.attribution_texts or None
-        elif snippet_property == SnippetProperty.COMMENT:
-            return snippet.comment
-        elif snippet_property == SnippetProperty.COPYRIGHT_TEXT:
-            return apply_if_present(str, snippet.copyright_text)
-        elif snippet_property == SnippetProperty.LICENSE_COMMENTS:
-            return snippet.license_comment
-        elif snippet_property == SnippetProperty.LICENSE_CONCLUDED:
-            return apply_if_present(str, snippet.license_concluded)
-        elif snippet_property == SnippetProperty.LICENSE_INFO_IN_SNIPPETS:
-            return [str(license_expression) for license_expression in snippet.license_info_in_snippet] or None
-        elif snippet_property == SnippetProperty.NAME:
-            return snippet.name
-        elif snippet_property == SnippetProperty.RANGES:
-            ranges = [convert_byte_range_to_dict(snippet.byte_range, snippet.file_spdx_id)]
-            if snippet.line_range:
-                ranges.append(convert_line_range_to_dict(snippet.line_range, snippet.file_spdx_id))
-            return ranges
-        elif snippet_property == SnippetProperty.SNIPPET_FROM_FILE:
-            return snippet.file_spdx_id
+    def _get_property_accessors(self) -> Dict[SnippetProperty, PropertyAccessor]:
+        return {
+            SnippetProperty.SPDX_ID: lambda snippet, _: snippet.spdx_id,
+            SnippetProperty.ANNOTATIONS: self._get_annotations,
+            SnippetProperty.ATTRIBUTION_TEXTS: lambda snippet, _: snippet.attribution_texts or None,
+            SnippetProperty.COMMENT: lambda snippet, _: snippet.comment,
+            SnippetProperty.COPYRIGHT_TEXT: lambda snippet, _: apply_if_present(str, snippet.copyright_text),
+            SnippetProperty.LICENSE_COMMENTS: lambda snippet, _: snippet.license_comment,
+            SnippetProperty.LICENSE_CONCLUDED: lambda snippet, _: apply_if_present(str, snippet.license_concluded),
+            SnippetProperty.LICENSE_INFO_IN_SNIPPETS: lambda snippet, _: [
+                str(license_expression) for license_expression in snippet.license_info_in_snippet
+            ]
+            or None,
+            SnippetProperty.NAME: lambda snippet, _: snippet.name,
+            SnippetProperty.RANGES: lambda snippet, _: convert_ranges(snippet),
+            SnippetProperty.SNIPPET_FROM_FILE: lambda snippet, _: snippet.file_spdx_id,
+        }
+
+    def _get_annotations(self, snippet: Snippet, document: Document) -> Any:
+        snippet_annotations = get_conversion_context(document).get_annotations(snippet.spdx_id)
+        return [self.annotation_converter.convert(annotation) for annotation in snippet_annotations] or None
 
     def get_json_type(self) -> Type[JsonProperty]:
         return SnippetProperty
@@ -64,6 +55,13 @@ class SnippetConverter(TypedConverter[Snippet]):
         return True
 
 
+def convert_ranges(snippet: Snippet) -> List[Dict]:
+    ranges = [convert_byte_range_to_dict(snippet.byte_range, snippet.file_spdx_id)]
+    if snippet.line_range:
+        ranges.append(convert_line_range_to_dict(snippet.line_range, snippet.file_spdx_id))
+    return ranges
+
+
 def convert_line_range_to_dict(line_range: Tuple[int, int], file_id: str) -> Dict:
     return _convert_range_to_dict(line_range, file_id, "lineNumber")
 
@@ -7,7 +7,7 @@ from spdx_tools.spdx.model import Document, Package, Relationship, RelationshipT
 
 
 def find_package_contains_file_relationships(document: Document, package: Package) -> List[Relationship]:
-    file_ids_in_document = [file.spdx_id for file in document.files]
+    file_ids_in_document = {file.spdx_id for file in document.files}
     package_contains_relationships = filter_by_type_and_origin(
         document.relationships, RelationshipType.CONTAINS, package.spdx_id
     )
@@ -19,7 +19,7 @@ def find_package_contains_file_relationships(document: Document, package: Packag
 
 
 def find_file_contained_by_package_relationships(document: Document, package: Package) -> List[Relationship]:
-    file_ids_in_document = [file.spdx_id for file in document.files]
+    file_ids_in_document = {file.spdx_id for file in document.files}
     contained_by_package_relationships = filter_by_type_and_target(
         document.relationships, RelationshipType.CONTAINED_BY, package.spdx_id
     )
@@ -0,0 +1,47 @@
+# SPDX-FileCopyrightText: 2023 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+from beartype.typing import Dict, List, Tuple, Union
+
+from spdx_tools.spdx.model import Relationship, RelationshipType, SpdxNoAssertion, SpdxNone
+
+
+class RelationshipIndex:
+    """
+    Adjacency lists over a list of relationships, keyed by origin (spdx_element_id) and target
+    (related_spdx_element_id), each with and without the relationship type. All lists keep the order in which the
+    relationships appear in the indexed list.
+    As relationships can be replaced or modified in place, the index is not kept up to date; build a new one whenever
+    the relationships might have changed, e.g. once per validation run.
+    """
+
+    def __init__(self, relationships: List[Relationship]):
+        self.by_origin: Dict[str, List[Relationship]] = dict()
+        self.by_target: Dict[Union[str, SpdxNone, SpdxNoAssertion], List[Relationship]] = dict()
+        self.by_type_and_origin: Dict[Tuple[RelationshipType, str], List[Relationship]] = dict()
+        self.by_type_and_target: Dict[
+            Tuple[RelationshipType, Union[str, SpdxNone, SpdxNoAssertion]], List[Relationship]
+        ] = dict()
+
+        for relationship in relationships:
+            origin = relationship.spdx_element_id
+            target = relationship.related_spdx_element_id
+            relationship_type = relationship.relationship_type
+            self.by_origin.setdefault(origin, []).append(relationship)
+            self.by_target.setdefault(target, []).append(relationship)
+            self.by_type_and_origin.setdefault((relationship_type, origin), []).append(relationship)
+            self.by_type_and_target.setdefault((relationship_type, target), []).append(relationship)
+
+    def filter_by_type_and_origin(self, relationship_type: RelationshipType, origin_id: str) -> List[Relationship]:
+        return list(self.by_type_and_origin.get((relationship_type, origin_id), []))
+
+    def filter_by_type_and_target(
+        self, relationship_type: RelationshipType, target_id: Union[str, SpdxNone, SpdxNoAssertion]
+    ) -> List[Relationship]:
+        return list(self.by_type_and_target.get((relationship_type, target_id), []))
+
+    def get_relationships_from(self, origin_id: str) -> List[Relationship]:
+        return list(self.by_origin.get(origin_id, []))
+
+    def get_relationships_to(self, target_id: Union[str, SpdxNone, SpdxNoAssertion]) -> List[Relationship]:
+        return list(self.by_target.get(target_id, []))
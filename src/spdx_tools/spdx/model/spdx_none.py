@@ -18,3 +18,6 @@ class SpdxNone:
 
     def __eq__(self, other):
         return isinstance(other, SpdxNone)
+
+    def __hash__(self):
+        return hash(SPDX_NONE_STRING)
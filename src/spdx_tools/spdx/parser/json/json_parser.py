@@ -2,34 +2,238 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 import json
+import re
 
-from beartype.typing import Any, Dict
+from beartype.typing import Any, Callable, Collection, Dict, Iterator, Optional, TextIO, Tuple, Union
 
-from spdx_tools.spdx.model import Document
-from spdx_tools.spdx.parser.jsonlikedict.json_like_dict_parser import JsonLikeDictParser
+from spdx_tools.common.json_backend import get_json_backend
+from spdx_tools.common.typing.type_checks import trusted_construction
+from spdx_tools.spdx.model import (
+    Annotation,
+    CreationInfo,
+    Document,
+    ExtractedLicensingInfo,
+    File,
+    Package,
+    Relationship,
+    Snippet,
+)
+from spdx_tools.spdx.parser.jsonlikedict.json_like_dict_parser import STREAMED_FIELDS, JsonLikeDictParser
 
-# chars we don't want to see in SBOMs
-CONTROL_CHARS_MAP = {
-    8: None,  # ASCII/UTF-8: backspace
-    12: None,  # ASCII/UTF-8: formfeed
-}
+# escaped backspace and formfeed chars, which we don't want to see in SBOMs
+ESCAPED_CONTROL_CHARS = re.compile(r"\\(?:[bf]|u000[8cC])")
+# no escape sequence is longer than this (\uXXXX)
+MAX_ESCAPE_SEQUENCE_LENGTH = 6
 
+# number of characters that are read at once when parsing incrementally
+DEFAULT_CHUNK_SIZE = 64 * 1024
 
-def remove_control_chars_from_value(value: Any) -> Any:
-    if isinstance(value, str):
-        return value.translate(CONTROL_CHARS_MAP)
-    elif isinstance(value, list):
-        for i in range(len(value)):
-            value[i] = remove_control_chars_from_value(value[i])
-    return value
+JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
 
 
-def remove_json_control_chars_hook(pairs: list) -> dict:
-    return {k: remove_control_chars_from_value(v) for k, v in pairs}
+def remove_json_control_chars(json_str: str) -> str:
+    """Removes the control chars from all strings in the JSON text in a single pass, before it is decoded."""
+    return ESCAPED_CONTROL_CHARS.sub(_remove_unless_backslash_is_escaped, json_str)
 
 
-def parse_from_file(file_name: str, encoding: str = "utf-8") -> Document:
+def _remove_unless_backslash_is_escaped(match: re.Match) -> str:
+    start = match.start()
+    preceding_backslashes_start = start
+    while preceding_backslashes_start > 0 and match.string[preceding_backslashes_start - 1] == "\\":
+        preceding_backslashes_start -= 1
+    if (start - preceding_backslashes_start) % 2:
+        return match.group(0)
+    return ""
+
+
+def get_incomplete_escape_sequence_start(json_str: str) -> int:
+    """
+    Returns the position from which on the end of the given part of a JSON text might belong to an escape sequence
+    that continues in the next part, i.e. the start of the last run of backslashes if it is close to the end.
+    """
+    start = json_str.rfind("\\", max(0, len(json_str) - MAX_ESCAPE_SEQUENCE_LENGTH + 1))
+    if start == -1:
+        return len(json_str)
+    while start > 0 and json_str[start - 1] == "\\":
+        start -= 1
+    return start
+
+
+def parse_from_file(
+    file_name: str,
+    encoding: str = "utf-8",
+    trusted: bool = False,
+    on_element: Optional[
+        Callable[[Union[Package, File, Snippet, Relationship, Annotation, ExtractedLicensingInfo, CreationInfo]], Any]
+    ] = None,
+    json_backend: Optional[str] = None,
+) -> Optional[Document]:
+    """
+    If on_element is given, the file is parsed incrementally and every element is passed to on_element as soon as it
+    has been parsed (see iter_elements_from_file()) instead of being collected in a document; None is returned then.
+    Otherwise, the file is decoded by the given JSON backend, by default the standard library's json module (see
+    spdx_tools.common.json_backend).
+    """
+    if on_element:
+        for element in iter_elements_from_file(file_name, encoding, trusted):
+            on_element(element)
+        return None
+
     with open(file_name, encoding=encoding) as file:
-        input_doc_as_dict: Dict = json.load(file, object_pairs_hook=remove_json_control_chars_hook)
+        input_doc_as_dict: Dict = get_json_backend(json_backend).loads(remove_json_control_chars(file.read()))
+
+    with trusted_construction(trusted):
+        return JsonLikeDictParser().parse(input_doc_as_dict)
+
+
+def iter_elements_from_file(
+    file_name: str, encoding: str = "utf-8", trusted: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[Union[Package, File, Snippet, Relationship, Annotation, ExtractedLicensingInfo, CreationInfo]]:
+    """
+    Parses the file incrementally, so that neither the whole file nor the whole document has to be held in memory.
+    Packages, files, snippets and relationships are yielded one at a time while the file is read, see
+    JsonLikeDictParser.iter_elements() for the remaining elements and the handling of errors.
+    Construction is only done in trusted mode while the parser is running, never while this generator is suspended.
+    """
+    with open(file_name, encoding=encoding) as file:
+        elements = JsonLikeDictParser().iter_elements(iter_top_level_members(file, STREAMED_FIELDS, chunk_size))
+        while True:
+            with trusted_construction(trusted):
+                element = next(elements, None)
+            if element is None:
+                return
+            yield element
+
+
+def iter_top_level_members(
+    file: TextIO, streamed_keys: Collection[str], chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[Tuple[str, Any]]:
+    """
+    Reads the JSON object in the given file incrementally and yields its (key, value) pairs. For streamed_keys, one
+    pair per array item is yielded instead, so that the array never has to be decoded as a whole. Control chars are
+    removed from all strings as in parse_from_file(). Malformed input raises a json.JSONDecodeError.
+    """
+    decoder = IncrementalJsonDecoder(file, chunk_size)
+    decoder.expect("{", "Expecting '{'")
+    if decoder.peek() == "}":
+        decoder.expect("}", "Expecting '}'")
+    else:
+        while True:
+            if decoder.peek() != '"':
+                raise decoder.decode_error("Expecting property name enclosed in double quotes")
+            key = decoder.decode_value()
+            decoder.expect(":", "Expecting ':' delimiter")
+            if key in streamed_keys and decoder.peek() == "[":
+                decoder.expect("[", "Expecting '['")
+                if decoder.peek() == "]":
+                    decoder.expect("]", "Expecting ']'")
+                else:
+                    while True:
+                        yield key, decoder.decode_value()
+                        if decoder.expect(",]", "Expecting ',' delimiter") == "]":
+                            break
+            else:
+                value = decoder.decode_value()
+                if key in streamed_keys:
+                    for item in value or []:
+                        yield key, item
+                else:
+                    yield key, value
+            if decoder.expect(",}", "Expecting ',' delimiter") == "}":
+                break
+
+    if decoder.peek():
+        raise decoder.decode_error("Extra data")
+
+
+class IncrementalJsonDecoder:
+    """
+    Decodes single JSON values from a text stream that is read in chunks. The part of the input that has already been
+    decoded is dropped from the buffer, so only the value that is currently decoded has to be held in memory. Control
+    chars are removed from every chunk before it is added to the buffer; the end of a chunk that might be the start of
+    an escape sequence is held back until the next chunk has been read.
+    """
+
+    def __init__(self, file: TextIO, chunk_size: int):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.held_back_text = ""
+        self.position = 0
+        self.end_of_file = False
+        # to report positions in the whole input
+        self.dropped_chars = 0
+        self.dropped_lines = 0
+        self.dropped_chars_in_last_line = 0
+
+    def read_chunk(self, min_size: int = 0) -> bool:
+        if self.end_of_file:
+            return False
+        chunk = self.file.read(max(self.chunk_size, min_size))
+        if not chunk:
+            if not self.held_back_text:
+                self.end_of_file = True
+                return False
+            chunk, self.held_back_text = self.held_back_text, ""
+        else:
+            chunk = self.held_back_text + chunk
+            held_back_start = get_incomplete_escape_sequence_start(chunk)
+            chunk, self.held_back_text = chunk[:held_back_start], chunk[held_back_start:]
+
+        dropped_text = self.buffer[: self.position]
+        last_line_break = dropped_text.rfind("\n")
+        if last_line_break == -1:
+            self.dropped_chars_in_last_line += len(dropped_text)
+        else:
+            self.dropped_lines += dropped_text.count("\n")
+            self.dropped_chars_in_last_line = len(dropped_text) - last_line_break - 1
+        self.dropped_chars += len(dropped_text)
+        self.buffer = self.buffer[self.position :] + remove_json_control_chars(chunk)
+        self.position = 0
+        return True
+
+    def peek(self) -> str:
+        """Skips whitespace and returns the next char without consuming it, or an empty string at the end."""
+        while True:
+            self.position = JSON_WHITESPACE.match(self.buffer, self.position).end()
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if not self.read_chunk():
+                return ""
+
+    def expect(self, chars: str, error_message: str) -> str:
+        char = self.peek()
+        if not char or char not in chars:
+            raise self.decode_error(error_message)
+        self.position += 1
+        return char
+
+    def decode_value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+                # numbers and literals at the end of the buffer might continue in the next chunk
+                if end < len(self.buffer) or self.end_of_file:
+                    self.position = end
+                    return value
+            except json.JSONDecodeError as err:
+                if self.end_of_file:
+                    raise self.decode_error(err.msg, err.pos)
+            # doubling the buffer keeps the effort linear for values that span many chunks
+            self.read_chunk(len(self.buffer) - self.position)
 
-    return JsonLikeDictParser().parse(input_doc_as_dict)
+    def decode_error(self, message: str, position: Optional[int] = None) -> json.JSONDecodeError:
+        if position is None:
+            position = self.position
+        line_break_count = self.buffer.count("\n", 0, position)
+        column = position - self.buffer.rfind("\n", 0, position)
+        if not line_break_count:
+            column += self.dropped_chars_in_last_line
+        error = json.JSONDecodeError(message, self.buffer, position)
+        error.pos = position + self.dropped_chars
+        error.lineno = line_break_count + self.dropped_lines + 1
+        error.colno = column
+        error.args = (f"{message}: line {error.lineno} column {error.colno} (char {error.pos})",)
+        return error
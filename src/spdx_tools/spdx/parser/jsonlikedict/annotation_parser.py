@@ -29,13 +29,7 @@ class AnnotationParser:
         self.actor_parser = ActorParser()
 
     def parse_all_annotations(self, input_doc_dict: Dict) -> List[Annotation]:
-        annotations = []
-        self.parse_annotations_from_object(annotations, [input_doc_dict])
-        reviews: List[Dict] = input_doc_dict.get("revieweds", [])
-        for review in reviews:
-            annotations = append_parsed_field_or_log_error(
-                self.logger, annotations, review, lambda x: self.parse_review(x, spdx_id=input_doc_dict.get("SPDXID"))
-            )
+        annotations = self.parse_document_annotations(input_doc_dict)
         packages: List[Dict] = input_doc_dict.get("packages", [])
         self.parse_annotations_from_object(annotations, packages)
         files: List[Dict] = input_doc_dict.get("files", [])
@@ -46,19 +40,31 @@ class AnnotationParser:
         raise_parsing_error_if_logger_has_messages(self.logger, "annotations")
         return annotations
 
+    def parse_document_annotations(self, input_doc_dict: Dict) -> List[Annotation]:
+        # annotations and reviews of the document itself, without those of its packages, files and snippets
+        annotations = []
+        self.parse_annotations_from_object(annotations, [input_doc_dict])
+        reviews: List[Dict] = input_doc_dict.get("revieweds", [])
+        for review in reviews:
+            annotations = append_parsed_field_or_log_error(
+                self.logger, annotations, review, lambda x: self.parse_review(x, spdx_id=input_doc_dict.get("SPDXID"))
+            )
+        return annotations
+
     def parse_annotations_from_object(self, annotations: List[Annotation], element_list: List[Dict]):
         for element in element_list:
-            element_spdx_id: Optional[str] = element.get("SPDXID")
-            element_annotations: List[Dict] = element.get("annotations", [])
-            annotations.extend(
-                parse_field_or_log_error(
-                    self.logger,
-                    element_annotations,
-                    lambda y: self.parse_annotation(y, spdx_id=element_spdx_id),
-                    [],
-                    True,
-                )
-            )
+            annotations.extend(self.parse_element_annotations(element, self.logger))
+
+    def parse_element_annotations(self, element_dict: Dict, logger: Logger) -> List[Annotation]:
+        element_spdx_id: Optional[str] = element_dict.get("SPDXID")
+        element_annotations: List[Dict] = element_dict.get("annotations", [])
+        return parse_field_or_log_error(
+            logger,
+            element_annotations,
+            lambda y: self.parse_annotation(y, spdx_id=element_spdx_id),
+            [],
+            True,
+        )
 
     def parse_annotation(self, annotation_dict: Dict, spdx_id: Optional[str] = None) -> Annotation:
         logger = Logger()
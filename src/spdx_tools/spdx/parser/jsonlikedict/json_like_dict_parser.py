@@ -1,17 +1,29 @@
 # SPDX-FileCopyrightText: 2022 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-from beartype.typing import Dict
+from beartype.typing import Any, Callable, Dict, Iterable, Iterator, List, Set, Tuple, Union
 
-from spdx_tools.spdx.model import Document
+from spdx_tools.spdx.model import (
+    Annotation,
+    CreationInfo,
+    Document,
+    ExtractedLicensingInfo,
+    File,
+    Package,
+    Relationship,
+    Snippet,
+)
 from spdx_tools.spdx.parser.error import SPDXParsingError
 from spdx_tools.spdx.parser.jsonlikedict.annotation_parser import AnnotationParser
 from spdx_tools.spdx.parser.jsonlikedict.creation_info_parser import CreationInfoParser
-from spdx_tools.spdx.parser.jsonlikedict.dict_parsing_functions import parse_list_of_elements
+from spdx_tools.spdx.parser.jsonlikedict.dict_parsing_functions import (
+    append_parsed_field_or_log_error,
+    parse_list_of_elements,
+)
 from spdx_tools.spdx.parser.jsonlikedict.extracted_licensing_info_parser import ExtractedLicensingInfoParser
 from spdx_tools.spdx.parser.jsonlikedict.file_parser import FileParser
 from spdx_tools.spdx.parser.jsonlikedict.package_parser import PackageParser
-from spdx_tools.spdx.parser.jsonlikedict.relationship_parser import RelationshipParser
+from spdx_tools.spdx.parser.jsonlikedict.relationship_parser import RelationshipKey, RelationshipParser
 from spdx_tools.spdx.parser.jsonlikedict.snippet_parser import SnippetParser
 from spdx_tools.spdx.parser.logger import Logger
 from spdx_tools.spdx.parser.parsing_functions import (
@@ -19,6 +31,9 @@ from spdx_tools.spdx.parser.parsing_functions import (
     raise_parsing_error_if_logger_has_messages,
 )
 
+# top-level fields whose array items can be parsed one by one, see JsonLikeDictParser.iter_elements()
+STREAMED_FIELDS = ["packages", "files", "snippets", "relationships"]
+
 
 class JsonLikeDictParser:
     logger: Logger
@@ -90,3 +105,84 @@ class JsonLikeDictParser:
         document = construct_or_raise_parsing_error(Document, parsed_fields)
 
         return document
+
+    def iter_elements(
+        self, json_like_members: Iterable[Tuple[str, Any]]
+    ) -> Iterator[Union[Package, File, Snippet, Relationship, Annotation, ExtractedLicensingInfo, CreationInfo]]:
+        """
+        Parses a document that is given as a sequence of its top-level (key, value) pairs, in which the arrays of the
+        STREAMED_FIELDS are given as one pair per array item. Packages, files, snippets and relationships (together
+        with the annotations of the former) are yielded as soon as their pair has been parsed and are not kept
+        afterwards. All other fields are collected, so that the remaining elements can be yielded at the end,
+        followed by the creation info.
+        As errors are collected over the whole input, an SPDXParsingError is only raised at the end, after all
+        elements that could be parsed have been yielded. It contains the same messages as one raised by parse().
+        """
+        document_dict = dict()
+        element_parsers = {
+            "packages": (self.package_parser.parse_package, self.package_parser.logger),
+            "files": (self.file_parser.parse_file, self.file_parser.logger),
+            "snippets": (self.snippet_parser.parse_snippet, self.snippet_parser.logger),
+            "relationships": (self.relationship_parser.parse_relationship, self.relationship_parser.logger),
+        }
+        annotation_loggers = {"packages": Logger(), "files": Logger(), "snippets": Logger()}
+        # all that is needed to imply relationships from hasFiles and documentDescribes at the end
+        packages_with_files: List[Dict] = []
+        relationship_keys: Set[RelationshipKey] = set()
+
+        for key, value in json_like_members:
+            if key not in STREAMED_FIELDS:
+                document_dict[key] = value
+                continue
+            parsing_method, logger = element_parsers[key]
+            parsed_elements = append_parsed_field_or_log_error(logger, [], value, parsing_method)
+            yield from parsed_elements
+            if key == "relationships":
+                relationship_keys.update(self.relationship_parser.get_canonical_relationship_keys(parsed_elements))
+                continue
+            yield from self.annotation_parser.parse_element_annotations(value, annotation_loggers[key])
+            if key == "packages" and value.get("hasFiles"):
+                packages_with_files.append({"SPDXID": value.get("SPDXID"), "hasFiles": value["hasFiles"]})
+
+        # the errors are collected in the same order as in parse()
+        creation_info = self.parse_or_log_error(self.creation_info_parser.parse_creation_info, document_dict)
+        self.logger.extend(self.package_parser.logger.get_messages())
+        self.logger.extend(self.file_parser.logger.get_messages())
+
+        annotations = self.annotation_parser.parse_document_annotations(document_dict)
+        for annotation_logger in annotation_loggers.values():
+            self.annotation_parser.logger.extend(annotation_logger.get_messages())
+        self.parse_or_log_error(
+            lambda x: raise_parsing_error_if_logger_has_messages(x, "annotations"), self.annotation_parser.logger
+        )
+        self.logger.extend(self.snippet_parser.logger.get_messages())
+
+        implied_relationships = self.relationship_parser.parse_implied_relationships(
+            dict(document_dict, packages=packages_with_files), relationship_keys
+        )
+        self.parse_or_log_error(raise_parsing_error_if_logger_has_messages, self.relationship_parser.logger)
+
+        extracted_licensing_info = []
+        if document_dict.get("hasExtractedLicensingInfos"):
+            extracted_licensing_info = self.parse_or_log_error(
+                lambda x: parse_list_of_elements(
+                    x,
+                    self.extracted_licensing_info_parser.parse_extracted_licensing_info,
+                    self.extracted_licensing_info_parser.logger,
+                ),
+                document_dict["hasExtractedLicensingInfos"],
+                [],
+            )
+
+        yield from annotations
+        yield from implied_relationships
+        yield from extracted_licensing_info
+        raise_parsing_error_if_logger_has_messages(self.logger)
+        yield creation_info
+
+    def parse_or_log_error(self, parsing_method: Callable, field: Any, default: Any = None) -> Any:
+        try:
+            return parsing_method(field)
+        except SPDXParsingError as err:
+            self.logger.extend(err.get_messages())
+        return default
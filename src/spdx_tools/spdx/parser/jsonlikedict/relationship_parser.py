@@ -1,10 +1,10 @@
 # SPDX-FileCopyrightText: 2022 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-from beartype.typing import Dict, List, Optional
+from beartype.typing import Dict, Iterable, List, Optional, Set, Tuple, Union
 
 from spdx_tools.common.typing.constructor_type_errors import ConstructorTypeErrors
-from spdx_tools.spdx.model import Relationship, RelationshipType
+from spdx_tools.spdx.model import Relationship, RelationshipType, SpdxNoAssertion, SpdxNone
 from spdx_tools.spdx.parser.error import SPDXParsingError
 from spdx_tools.spdx.parser.jsonlikedict.dict_parsing_functions import (
     delete_duplicates_from_list,
@@ -18,6 +18,9 @@ from spdx_tools.spdx.parser.parsing_functions import (
     raise_parsing_error_if_logger_has_messages,
 )
 
+# (spdx_element_id, relationship_type, related_spdx_element_id) of a relationship, see get_canonical_relationship_key()
+RelationshipKey = Tuple[str, RelationshipType, Union[str, SpdxNone, SpdxNoAssertion]]
+
 
 class RelationshipParser:
     logger: Logger
@@ -32,51 +35,57 @@ class RelationshipParser:
             parse_field_or_log_error(self.logger, relationship_dicts, self.parse_relationship, [], True)
         )
 
+        relationships.extend(
+            self.parse_implied_relationships(input_doc_dict, self.get_canonical_relationship_keys(relationships))
+        )
+
+        file_dicts: List[Dict] = input_doc_dict.get("files", [])
+
+        # not implemented yet: deal with deprecated fields in file:
+        # https://github.com/spdx/tools-python/issues/294 & https://github.com/spdx/tools-python/issues/387
+        _ = self.parse_artifact_of(file_dicts=file_dicts)
+        _ = self.parse_file_dependencies(file_dicts=file_dicts)
+
+        raise_parsing_error_if_logger_has_messages(self.logger)
+
+        return relationships
+
+    def parse_implied_relationships(
+        self, input_doc_dict: Dict, existing_relationship_keys: Set[RelationshipKey]
+    ) -> List[Relationship]:
+        """
+        Returns the relationships implied by the documentDescribes field of the document and the hasFiles fields of
+        its packages that are not already contained in the relationships with the given canonical keys. The keys of
+        the implied relationships are added to the given set.
+        """
+        implied_relationships = []
         document_describes: List[str] = delete_duplicates_from_list(input_doc_dict.get("documentDescribes", []))
         doc_spdx_id: Optional[str] = input_doc_dict.get("SPDXID")
 
-        existing_relationships_without_comments: List[Relationship] = self.get_all_relationships_without_comments(
-            relationships
-        )
-        relationships.extend(
+        implied_relationships.extend(
             parse_field_or_log_error(
                 self.logger,
                 document_describes,
                 lambda x: self.parse_document_describes(
                     doc_spdx_id=doc_spdx_id,
                     described_spdx_ids=x,
-                    existing_relationships=existing_relationships_without_comments,
+                    existing_relationship_keys=existing_relationship_keys,
                 ),
                 [],
             )
         )
 
         package_dicts: List[Dict] = input_doc_dict.get("packages", [])
-        existing_relationships_without_comments: List[Relationship] = self.get_all_relationships_without_comments(
-            relationships
-        )
-
-        relationships.extend(
+        implied_relationships.extend(
             parse_field_or_log_error(
                 self.logger,
                 package_dicts,
-                lambda x: self.parse_has_files(
-                    package_dicts=x, existing_relationships=existing_relationships_without_comments
-                ),
+                lambda x: self.parse_has_files(package_dicts=x, existing_relationship_keys=existing_relationship_keys),
                 [],
             )
         )
 
-        file_dicts: List[Dict] = input_doc_dict.get("files", [])
-
-        # not implemented yet: deal with deprecated fields in file:
-        # https://github.com/spdx/tools-python/issues/294 & https://github.com/spdx/tools-python/issues/387
-        _ = self.parse_artifact_of(file_dicts=file_dicts)
-        _ = self.parse_file_dependencies(file_dicts=file_dicts)
-
-        raise_parsing_error_if_logger_has_messages(self.logger)
-
-        return relationships
+        return implied_relationships
 
     def parse_relationship(self, relationship_dict: Dict) -> Relationship:
         logger = Logger()
@@ -110,7 +119,7 @@ class RelationshipParser:
         return relationship_type
 
     def parse_document_describes(
-        self, doc_spdx_id: str, described_spdx_ids: List[str], existing_relationships: List[Relationship]
+        self, doc_spdx_id: str, described_spdx_ids: List[str], existing_relationship_keys: Set[RelationshipKey]
     ) -> List[Relationship]:
         logger = Logger()
         describes_relationships = []
@@ -124,16 +133,15 @@ class RelationshipParser:
             except ConstructorTypeErrors as err:
                 logger.append(err.get_messages())
                 continue
-            if not self.check_if_relationship_exists(describes_relationship, existing_relationships):
+            if self.add_relationship_key_if_new(describes_relationship, existing_relationship_keys):
                 describes_relationships.append(describes_relationship)
         raise_parsing_error_if_logger_has_messages(logger, "document describes relationships")
 
         return describes_relationships
 
     def parse_has_files(
-        self, package_dicts: List[Dict], existing_relationships: List[Relationship]
+        self, package_dicts: List[Dict], existing_relationship_keys: Set[RelationshipKey]
     ) -> List[Relationship]:
-        # assume existing relationships are stripped of comments
         logger = Logger()
         contains_relationships = []
         for package in package_dicts:
@@ -151,37 +159,37 @@ class RelationshipParser:
                 except ConstructorTypeErrors as err:
                     logger.append(err.get_messages())
                     continue
-                if not self.check_if_relationship_exists(
-                    relationship=contains_relationship, existing_relationships=existing_relationships
-                ):
+                if self.add_relationship_key_if_new(contains_relationship, existing_relationship_keys):
                     contains_relationships.append(contains_relationship)
         raise_parsing_error_if_logger_has_messages(logger, "package contains relationships")
 
         return contains_relationships
 
-    def check_if_relationship_exists(
-        self, relationship: Relationship, existing_relationships: List[Relationship]
+    def add_relationship_key_if_new(
+        self, relationship: Relationship, existing_relationship_keys: Set[RelationshipKey]
     ) -> bool:
-        # assume existing relationships are stripped of comments
-        if relationship in existing_relationships:
-            return True
-        relationship_inverted: Relationship = self.invert_relationship(relationship)
-        if relationship_inverted in existing_relationships:
-            return True
-
-        return False
-
-    @staticmethod
-    def get_all_relationships_without_comments(existing_relationships: List[Relationship]) -> List[Relationship]:
-        relationships_without_comments = [
-            Relationship(
-                relationship_type=relationship.relationship_type,
-                related_spdx_element_id=relationship.related_spdx_element_id,
-                spdx_element_id=relationship.spdx_element_id,
+        """Returns False if a relationship with the same canonical key exists already, otherwise adds the key."""
+        relationship_key = self.get_canonical_relationship_key(relationship)
+        if relationship_key in existing_relationship_keys:
+            return False
+        existing_relationship_keys.add(relationship_key)
+        return True
+
+    def get_canonical_relationship_keys(self, relationships: Iterable[Relationship]) -> Set[RelationshipKey]:
+        return {self.get_canonical_relationship_key(relationship) for relationship in relationships}
+
+    def get_canonical_relationship_key(self, relationship: Relationship) -> RelationshipKey:
+        """
+        Returns the same key for relationships that only differ in their comments and for relationships that are the
+        inverse of each other (like "A DESCRIBES B" and "B DESCRIBED_BY A").
+        """
+        if relationship.relationship_type in self.canonical_relationship_types:
+            return (
+                relationship.related_spdx_element_id,
+                self.invert_relationship_types[relationship.relationship_type],
+                relationship.spdx_element_id,
             )
-            for relationship in existing_relationships
-        ]
-        return relationships_without_comments
+        return relationship.spdx_element_id, relationship.relationship_type, relationship.related_spdx_element_id
 
     def invert_relationship(self, relationship: Relationship) -> Relationship:
         return Relationship(
@@ -197,6 +205,8 @@ class RelationshipParser:
         RelationshipType.CONTAINS: RelationshipType.CONTAINED_BY,
         RelationshipType.CONTAINED_BY: RelationshipType.CONTAINS,
     }
+    # relationship types whose inverse is used in the canonical keys
+    canonical_relationship_types = {RelationshipType.DESCRIBED_BY, RelationshipType.CONTAINED_BY}
 
     @staticmethod
     def parse_file_dependencies(file_dicts: List[Dict]) -> List[Relationship]:
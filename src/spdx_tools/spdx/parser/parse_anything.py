@@ -13,14 +13,15 @@ import logging
 
 from spdx_tools.spdx.formats import FileFormat, file_name_to_format
 from spdx_tools.spdx.model import Document
-from spdx_tools.spdx.parser.json import json_parser
-from spdx_tools.spdx.parser.rdf import rdf_parser
-from spdx_tools.spdx.parser.tagvalue import tagvalue_parser
-from spdx_tools.spdx.parser.xml import xml_parser
-from spdx_tools.spdx.parser.yaml import yaml_parser
 
 
-def parse_file(file_name: str, encoding: str = "utf-8") -> Document:
+def parse_file(file_name: str, encoding: str = "utf-8", trusted: bool = False) -> Document:
+    """
+    Parses the given file, determining the format by its file ending. If trusted is set, the runtime type checks of
+    the model constructors are skipped (see spdx_tools.common.typing.type_checks.trusted_construction()). Only do this
+    for input that is known to be well-formed, as wrongly typed values will then end up in the document unnoticed.
+    Only the parser of the format is imported, as the others pull in dependencies that take long to load.
+    """
     if encoding != "utf-8":
         logging.warning(
             "It's recommended to use the UTF-8 encoding for any SPDX file. Consider changing the encoding of the file."
@@ -28,12 +29,22 @@ def parse_file(file_name: str, encoding: str = "utf-8") -> Document:
 
     input_format = file_name_to_format(file_name)
     if input_format == FileFormat.RDF_XML:
-        return rdf_parser.parse_from_file(file_name, encoding)
+        from spdx_tools.spdx.parser.rdf import rdf_parser
+
+        return rdf_parser.parse_from_file(file_name, encoding, trusted)
     elif input_format == FileFormat.TAG_VALUE:
-        return tagvalue_parser.parse_from_file(file_name, encoding)
+        from spdx_tools.spdx.parser.tagvalue import tagvalue_parser
+
+        return tagvalue_parser.parse_from_file(file_name, encoding, trusted)
     elif input_format == FileFormat.JSON:
-        return json_parser.parse_from_file(file_name, encoding)
+        from spdx_tools.spdx.parser.json import json_parser
+
+        return json_parser.parse_from_file(file_name, encoding, trusted)
     elif input_format == FileFormat.XML:
-        return xml_parser.parse_from_file(file_name, encoding)
+        from spdx_tools.spdx.parser.xml import xml_parser
+
+        return xml_parser.parse_from_file(file_name, encoding, trusted)
     elif input_format == FileFormat.YAML:
-        return yaml_parser.parse_from_file(file_name, encoding)
+        from spdx_tools.spdx.parser.yaml import yaml_parser
+
+        return yaml_parser.parse_from_file(file_name, encoding, trusted)
@@ -3,10 +3,11 @@
 # SPDX-License-Identifier: Apache-2.0
 from enum import Enum
 
-from beartype.typing import Any, Callable, Optional, Tuple, Type, Union
+from beartype.typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Type, Union
 from rdflib import RDF, Graph, URIRef
 from rdflib.exceptions import UniquenessError
 from rdflib.namespace import NamespaceManager
+from rdflib.paths import Path
 from rdflib.term import BNode, Literal, Node
 
 from spdx_tools.spdx.casing_tools import camel_case_to_snake_case
@@ -69,12 +70,19 @@ def get_correctly_typed_value(
 
 
 def get_unique_value(logger: Logger, graph: Graph, subject: Node, predicate: Node, default: Any) -> Any:
-    try:
-        value = graph.value(subject=subject, predicate=predicate, default=default, any=False)
-        return value
-    except UniquenessError:
+    values = get_objects(graph, subject, predicate)
+    if not values:
+        return default
+    if len(values) > 1:
         logger.append(f"Multiple values for unique value {predicate} found.")
         return default
+    return values[0]
+
+
+def get_objects(graph: Graph, subject: Node, predicate: Node) -> List[Node]:
+    if isinstance(graph, SubjectIndexedGraph):
+        return list(graph.get_predicate_objects(subject).get(predicate, ()))
+    return list(graph.objects(subject, predicate))
 
 
 def parse_enum_value(enum_str: str, enum_class: Type[Enum], prefix: str) -> Enum:
@@ -139,10 +147,87 @@ def get_value_from_graph(
 ) -> Optional[Union[URIRef, Literal, BNode]]:
     # this is a helper method to cast some rdf types from graph.value() to be compatible with the
     # code that follows
-    value = graph.value(subject=subject, predicate=predicate, object=_object, default=default, any=_any)
+    if subject is not None and predicate is not None and _object is None:
+        values = get_objects(graph, subject, predicate)
+        if len(values) > 1 and not _any:
+            raise UniquenessError(values)
+        value = values[0] if values else default
+    else:
+        value = graph.value(subject=subject, predicate=predicate, object=_object, default=default, any=_any)
     if value != default and value is not None and not isinstance(value, (URIRef, Literal, BNode)):
         logger.append(
             f"Warning: Node {value} should be of type BNode, Literal or URIRef, but is {type(value).__name__}. "
             f"This might lead to a failure."
         )
     return value
+
+
+class SubjectIndexedGraph(Graph):
+    """
+    Graph that groups its triples by subject into dictionaries of predicates to objects while they are added, e.g. by
+    Graph.parse(), so that the lookups of one predicate of a node after another by the parsers are dictionary accesses
+    instead of queries of the store. If the store already contained triples, those of a subject are grouped on its
+    first lookup instead. The objects keep the order of the store.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # the objects of a subject and predicate are the keys of a dictionary, which is an ordered set
+        self.subject_index: Dict[Node, Dict[Node, Dict[Node, None]]] = {}
+        self.is_index_complete = len(self) == 0
+
+    def get_predicate_objects(self, subject: Node) -> Dict[Node, Dict[Node, None]]:
+        predicate_objects = self.subject_index.get(subject)
+        if predicate_objects is None:
+            predicate_objects = {}
+            if not self.is_index_complete:
+                for (_, predicate, obj), _ in self.store.triples((subject, None, None), context=self):
+                    predicate_objects.setdefault(predicate, {})[obj] = None
+                self.subject_index[subject] = predicate_objects
+        return predicate_objects
+
+    def add(self, triple: Tuple[Node, Node, Node]) -> "SubjectIndexedGraph":
+        super().add(triple)
+        subject, predicate, obj = triple
+        if self.is_index_complete or subject in self.subject_index:
+            self.subject_index.setdefault(subject, {}).setdefault(predicate, {})[obj] = None
+        return self
+
+    def addN(self, quads) -> "SubjectIndexedGraph":
+        super().addN(quads)
+        self.subject_index.clear()
+        self.is_index_complete = False
+        return self
+
+    def remove(self, triple: Tuple[Optional[Node], Optional[Node], Optional[Node]]) -> "SubjectIndexedGraph":
+        super().remove(triple)
+        subject, predicate, obj = triple
+        if subject is None or predicate is None or obj is None:
+            self.subject_index.clear()
+            self.is_index_complete = False
+        elif subject in self.subject_index:
+            self.subject_index[subject].get(predicate, {}).pop(obj, None)
+        return self
+
+    def triples(
+        self, triple: Tuple[Optional[Node], Optional[Node], Optional[Node]]
+    ) -> Iterator[Tuple[Node, Node, Node]]:
+        subject, predicate, obj = triple
+        if subject is None or obj is not None or isinstance(predicate, Path):
+            yield from super().triples(triple)
+            return
+        predicate_objects = self.get_predicate_objects(subject)
+        predicates = list(predicate_objects) if predicate is None else [predicate]
+        for current_predicate in predicates:
+            for current_object in list(predicate_objects.get(current_predicate, {})):
+                yield subject, current_predicate, current_object
+
+
+def index_graph_by_subject(graph: Graph) -> SubjectIndexedGraph:
+    """
+    Returns the graph itself if it is a SubjectIndexedGraph, else a SubjectIndexedGraph on its store, which shares the
+    triples and namespaces.
+    """
+    if isinstance(graph, SubjectIndexedGraph):
+        return graph
+    return SubjectIndexedGraph(graph.store, graph.identifier, graph.namespace_manager)
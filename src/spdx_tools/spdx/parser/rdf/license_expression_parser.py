@@ -6,9 +6,9 @@ from license_expression import LicenseExpression
 from rdflib import RDF, Graph
 from rdflib.term import BNode, Identifier, Node, URIRef
 
-from spdx_tools.common.spdx_licensing import spdx_licensing
+from spdx_tools.common.spdx_licensing import parse_spdx_license_expression
 from spdx_tools.spdx.parser.logger import Logger
-from spdx_tools.spdx.parser.rdf.graph_parsing_functions import get_value_from_graph, remove_prefix
+from spdx_tools.spdx.parser.rdf.graph_parsing_functions import get_objects, get_value_from_graph, remove_prefix
 from spdx_tools.spdx.rdfschema.namespace import LICENSE_NAMESPACE, SPDX_NAMESPACE
 
 
@@ -24,25 +24,29 @@ def parse_license_expression(
     expression = ""
     if license_expression_node.startswith(LICENSE_NAMESPACE):
         expression = remove_prefix(license_expression_node, LICENSE_NAMESPACE)
-        return spdx_licensing.parse(expression)
+        return parse_spdx_license_expression(expression)
     if license_expression_node.startswith(doc_namespace):
         expression = license_expression_node.fragment
-        return spdx_licensing.parse(expression)
+        return parse_spdx_license_expression(expression)
 
-    node_type = graph.value(license_expression_node, RDF.type)
+    node_types = get_objects(graph, license_expression_node, RDF.type)
+    node_type = node_types[0] if node_types else None
     if node_type == SPDX_NAMESPACE.ConjunctiveLicenseSet:
         members = []
-        for _, _, member_node in graph.triples((license_expression_node, SPDX_NAMESPACE.member, None)):
+        for member_node in get_objects(graph, license_expression_node, SPDX_NAMESPACE.member):
             members.append(parse_license_expression(member_node, graph, doc_namespace, logger))
         expression = " AND ".join([str(member) for member in members])
     if node_type == SPDX_NAMESPACE.DisjunctiveLicenseSet:
         members = []
-        for _, _, member_node in graph.triples((license_expression_node, SPDX_NAMESPACE.member, None)):
+        for member_node in get_objects(graph, license_expression_node, SPDX_NAMESPACE.member):
             members.append(parse_license_expression(member_node, graph, doc_namespace, logger))
         expression = " OR ".join([str(member) for member in members])
     if node_type == SPDX_NAMESPACE.WithExceptionOperator:
         license_expression = parse_license_expression(
-            graph.value(license_expression_node, SPDX_NAMESPACE.member), graph, doc_namespace, logger
+            get_value_from_graph(logger, graph, license_expression_node, SPDX_NAMESPACE.member),
+            graph,
+            doc_namespace,
+            logger,
         )
         exception = parse_license_exception(
             get_value_from_graph(logger, graph, license_expression_node, SPDX_NAMESPACE.licenseException),
@@ -51,7 +55,7 @@ def parse_license_expression(
         )
         expression = f"{license_expression} WITH {exception}"
 
-    return spdx_licensing.parse(expression)
+    return parse_spdx_license_expression(expression)
 
 
 def parse_license_exception(exception_node: Identifier, graph: Graph, logger) -> str:
@@ -4,6 +4,7 @@
 from beartype.typing import Any, Dict
 from rdflib import RDF, Graph
 
+from spdx_tools.common.typing.type_checks import trusted_construction
 from spdx_tools.spdx.model import Document, RelationshipType
 from spdx_tools.spdx.parser.error import SPDXParsingError
 from spdx_tools.spdx.parser.logger import Logger
@@ -11,27 +12,48 @@ from spdx_tools.spdx.parser.parsing_functions import (
     construct_or_raise_parsing_error,
     raise_parsing_error_if_logger_has_messages,
 )
+from spdx_tools.spdx.parser.rdf import rdf_xml_reader
 from spdx_tools.spdx.parser.rdf.annotation_parser import parse_annotation
 from spdx_tools.spdx.parser.rdf.creation_info_parser import parse_creation_info
 from spdx_tools.spdx.parser.rdf.extracted_licensing_info_parser import parse_extracted_licensing_info
 from spdx_tools.spdx.parser.rdf.file_parser import parse_file
-from spdx_tools.spdx.parser.rdf.graph_parsing_functions import get_correctly_typed_triples
+from spdx_tools.spdx.parser.rdf.graph_parsing_functions import (
+    SubjectIndexedGraph,
+    get_correctly_typed_triples,
+    index_graph_by_subject,
+)
 from spdx_tools.spdx.parser.rdf.package_parser import parse_package
 from spdx_tools.spdx.parser.rdf.relationship_parser import parse_implicit_relationship, parse_relationship
 from spdx_tools.spdx.parser.rdf.snippet_parser import parse_snippet
 from spdx_tools.spdx.rdfschema.namespace import SPDX_NAMESPACE
 
 
-def parse_from_file(file_name: str, encoding: str = "utf-8") -> Document:
-    graph = Graph()
+def parse_from_file(
+    file_name: str, encoding: str = "utf-8", trusted: bool = False, streaming: bool = False
+) -> Document:
+    """
+    With streaming=True, the file is read without building an rdflib Graph of the whole document first, which needs
+    much less memory and time for large documents (see rdf_xml_reader.RdfXmlReader). Files that are serialized in a
+    way that the reader does not support are parsed via the graph as usual.
+    """
+    if streaming:
+        try:
+            return rdf_xml_reader.parse_from_file(file_name, encoding, trusted)
+        except rdf_xml_reader.UnsupportedSerializationError:
+            pass
+
+    graph = SubjectIndexedGraph()
     with open(file_name, encoding=encoding) as file:
         graph.parse(file, format="xml")
 
-    document: Document = translate_graph_to_document(graph)
+    with trusted_construction(trusted):
+        document: Document = translate_graph_to_document(graph)
     return document
 
 
 def translate_graph_to_document(graph: Graph) -> Document:
+    # the parsers look up the values of each node one by one, which the index turns into dictionary accesses
+    graph = index_graph_by_subject(graph)
     parsed_fields: Dict[str, Any] = dict()
     logger = Logger()
     creation_info, doc_node = parse_creation_info(graph)
@@ -0,0 +1,457 @@
+# SPDX-FileCopyrightText: 2023 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+from urllib.parse import urldefrag
+from xml.parsers import expat
+
+from beartype.typing import Any, Dict, List, Optional, Set, TextIO, Tuple, Union
+from rdflib import RDF, RDFS, BNode, Graph, Literal, URIRef
+from rdflib.term import Node
+
+from spdx_tools.common.typing.type_checks import trusted_construction
+from spdx_tools.spdx.model import Document, Relationship, RelationshipType
+from spdx_tools.spdx.parser.error import SPDXParsingError
+from spdx_tools.spdx.parser.logger import Logger
+from spdx_tools.spdx.parser.parsing_functions import (
+    construct_or_raise_parsing_error,
+    raise_parsing_error_if_logger_has_messages,
+)
+from spdx_tools.spdx.parser.rdf.annotation_parser import parse_annotation
+from spdx_tools.spdx.parser.rdf.creation_info_parser import parse_creation_info
+from spdx_tools.spdx.parser.rdf.extracted_licensing_info_parser import parse_extracted_licensing_info
+from spdx_tools.spdx.parser.rdf.file_parser import parse_file
+from spdx_tools.spdx.parser.rdf.package_parser import parse_package
+from spdx_tools.spdx.parser.rdf.relationship_parser import parse_implicit_relationship, parse_relationship
+from spdx_tools.spdx.parser.rdf.snippet_parser import parse_snippet
+from spdx_tools.spdx.rdfschema.namespace import LICENSE_NAMESPACE, POINTER_NAMESPACE, SPDX_NAMESPACE
+
+# number of characters that are read at once
+DEFAULT_CHUNK_SIZE = 64 * 1024
+# rdflib's stores keep empty index entries for removed nodes, so the graph is copied after this many descriptions
+GRAPH_RENEWAL_INTERVAL = 1000
+
+# names of elements and attributes as expat reports them, i.e. as plain strings, with the separator removed
+RDF_ROOT, RDF_DESCRIPTION, RDF_ABOUT, RDF_NODE_ID, RDF_RESOURCE, RDF_DATATYPE = (
+    f"{RDF}{name}" for name in ["RDF", "Description", "about", "nodeID", "resource", "datatype"]
+)
+XML_LANG = "http://www.w3.org/XML/1998/namespacelang"
+NODE_ELEMENT_ATTRIBUTES = frozenset([RDF_ABOUT, RDF_NODE_ID, XML_LANG])
+PROPERTY_ELEMENT_ATTRIBUTES = frozenset([RDF_RESOURCE, RDF_NODE_ID, RDF_DATATYPE, XML_LANG])
+RDF_PROPERTIES = frozenset(str(term) for term in [RDF.type, RDF.value, RDF.first, RDF.rest])
+
+ELEMENT_PARSERS = {
+    SPDX_NAMESPACE.Package: ("packages", parse_package),
+    SPDX_NAMESPACE.File: ("files", parse_file),
+    SPDX_NAMESPACE.Snippet: ("snippets", parse_snippet),
+}
+# the terms that are compared with every triple, as looking them up in SPDX_NAMESPACE creates a new URIRef each time
+SPDX_ANNOTATION = SPDX_NAMESPACE.annotation
+SPDX_RELATIONSHIP = SPDX_NAMESPACE.relationship
+SPDX_LICENSE_EXCEPTION = SPDX_NAMESPACE.licenseException
+SPDX_DOCUMENT = SPDX_NAMESPACE.SpdxDocument
+IMPLICIT_RELATIONSHIP_TYPES = {
+    SPDX_NAMESPACE.hasFile: RelationshipType.CONTAINS,
+    SPDX_NAMESPACE.describesPackage: RelationshipType.DESCRIBES,
+}
+# URIs from these namespaces are never turned into SPDX ids with the help of the namespace bindings of the document
+VOCABULARY_NAMESPACES = (str(SPDX_NAMESPACE), str(POINTER_NAMESPACE), str(RDF), str(RDFS))
+
+
+class UnsupportedSerializationError(Exception):
+    """Raised for RDF/XML that the RdfXmlReader cannot read, even though it may be valid."""
+
+
+def parse_from_file(
+    file_name: str, encoding: str = "utf-8", trusted: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Document:
+    """
+    Parses the file without building a graph of the whole document, see RdfXmlReader. Raises an
+    UnsupportedSerializationError if the file is not serialized in a way that allows this; such files can still be
+    parsed by rdf_parser.parse_from_file().
+    """
+    reader = RdfXmlReader()
+    with open(file_name, encoding=encoding) as file, trusted_construction(trusted):
+        reader.read(file, chunk_size)
+        return reader.get_document()
+
+
+class NodeDescription:
+    """
+    The triples from the node element of a resource, including those of the blank nodes that are nested into it.
+    Resources that are nested into it have descriptions of their own, only the triples that refer to them are kept.
+    """
+
+    def __init__(self, subject: Optional[Union[URIRef, BNode]] = None):
+        self.subject = subject
+        self.triples: List[Tuple[Node, Node, Node]] = []
+        self.element_type: Optional[URIRef] = None
+        self.shares_blank_nodes = False
+        self.is_complete = False
+
+
+class NodeFrame:
+    def __init__(self, subject: Union[URIRef, BNode], description: NodeDescription, language: Optional[str]):
+        self.subject = subject
+        self.description = description
+        self.language = language
+
+
+class PropertyFrame:
+    def __init__(
+        self,
+        node_frame: Optional[NodeFrame],
+        predicate: Optional[URIRef],
+        obj: Optional[Node],
+        datatype: Optional[URIRef],
+        language: Optional[str],
+    ):
+        # the root rdf:RDF element is represented by a property frame without node frame and predicate
+        self.node_frame = node_frame
+        self.predicate = predicate
+        self.object = obj
+        self.is_reference = obj is not None
+        self.datatype = datatype
+        self.language = language
+        self.text_parts: List[str] = []
+
+
+class RdfXmlReader:
+    """
+    Reads SPDX documents from RDF/XML without building an rdflib Graph of the whole document, which takes several
+    times the size of the file in memory. The XML is streamed with expat and the triples of every node element are
+    collected in a NodeDescription. As soon as the description of a package, file or snippet is complete, it is parsed
+    by the same functions as in rdf_parser, in a graph that holds only the description and the remaining nodes of the
+    document, and dropped afterwards. The remaining nodes are few: the document with its creation info, extracted
+    licensing infos and the like. Descriptions of listed licenses, which contain the whole license text, are not kept
+    at all, as only their URIs are used.
+    Elements are parsed later if the namespace of the document is not known yet when their description is complete,
+    or if their SPDX ids might depend on the external document references. Serializations which do not describe every
+    element in one node element, such as one rdf:Description per triple, as well as rdf:parseType, rdf:li, property
+    attributes and relative URIs, raise an UnsupportedSerializationError.
+    """
+
+    def __init__(self):
+        # the remaining nodes of the document and the description that is currently parsed, the store keeps the order
+        # of the triples, so that lists like the checksums of a file are parsed in the order of the file
+        self.graph = Graph(store="SimpleMemory")
+        self.parsed_description_count = 0
+        self.logger = Logger()
+        self.doc_namespace: Optional[str] = None
+        self.parsed_fields: Dict[str, Any] = {"packages": [], "files": [], "snippets": []}
+        self.annotations = []
+        self.relationships = []
+        self.implicit_relationship_triples: List[Tuple[Node, RelationshipType, Node]] = []
+        self.parsed_element_nodes: Set[URIRef] = set()
+        self.type_only_descriptions: Dict[URIRef, NodeDescription] = {}
+        self.descriptions_without_namespace: List[NodeDescription] = []
+        self.descriptions_for_the_end: List[NodeDescription] = []
+        self.blank_nodes: Dict[str, Tuple[BNode, NodeDescription]] = {}
+        self.stack: List[Union[NodeFrame, PropertyFrame]] = []
+
+    def read(self, file: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        parser = expat.ParserCreate("utf-8", " ")
+        parser.buffer_text = True
+        parser.StartElementHandler = self.start_element
+        parser.EndElementHandler = self.end_element
+        parser.CharacterDataHandler = self.characters
+        parser.StartNamespaceDeclHandler = self.bind_namespace
+        parser.EntityDeclHandler = self.reject_entities
+        while True:
+            chunk = file.read(chunk_size)
+            parser.Parse(chunk, not chunk)
+            if not chunk:
+                break
+
+    def get_document(self) -> Document:
+        """Parses the remaining nodes of the document after read(), like rdf_parser.translate_graph_to_document()."""
+        creation_info, _ = parse_creation_info(self.graph)
+        self.doc_namespace = creation_info.document_namespace
+        for description in self.descriptions_without_namespace + self.descriptions_for_the_end:
+            self.parse_description(description)
+        for subject, description in self.type_only_descriptions.items():
+            if subject not in self.parsed_element_nodes:
+                self.parse_description(description)
+
+        for parent_node, _, annotation_node in self.graph.triples((None, SPDX_ANNOTATION, None)):
+            self.parse_and_append(self.annotations, parse_annotation, annotation_node, parent_node)
+        for parent_node, _, relationship_node in self.graph.triples((None, SPDX_RELATIONSHIP, None)):
+            self.parse_and_append(self.relationships, parse_relationship, relationship_node, parent_node)
+
+        for predicate, relationship_type in IMPLICIT_RELATIONSHIP_TYPES.items():
+            for parent_node, _, element_node in self.graph.triples((None, predicate, None)):
+                self.implicit_relationship_triples.append((parent_node, relationship_type, element_node))
+        relationship_keys = set(get_relationship_key(relationship) for relationship in self.relationships)
+        for parent_node, relationship_type, element_node in self.implicit_relationship_triples:
+            try:
+                relationship = parse_implicit_relationship(
+                    parent_node, relationship_type, element_node, self.graph, self.doc_namespace
+                )
+            except SPDXParsingError as err:
+                self.logger.extend(err.get_messages())
+                continue
+            if get_relationship_key(relationship) not in relationship_keys:
+                relationship_keys.add(get_relationship_key(relationship))
+                self.relationships.append(relationship)
+
+        extracted_licensing_infos = []
+        for _, _, extracted_licensing_info_node in self.graph.triples(
+            (None, SPDX_NAMESPACE.hasExtractedLicensingInfo, None)
+        ):
+            try:
+                extracted_licensing_infos.append(
+                    parse_extracted_licensing_info(extracted_licensing_info_node, self.graph, self.doc_namespace)
+                )
+            except SPDXParsingError as err:
+                self.logger.extend(err.get_messages())
+
+        raise_parsing_error_if_logger_has_messages(self.logger)
+        return construct_or_raise_parsing_error(
+            Document,
+            dict(
+                self.parsed_fields,
+                creation_info=creation_info,
+                annotations=self.annotations,
+                relationships=self.relationships,
+                extracted_licensing_info=extracted_licensing_infos,
+            ),
+        )
+
+    def start_element(self, name: str, attributes: Dict[str, str]):
+        # expat reports qualified names as the namespace and the local name, separated by a space
+        uri = name.replace(" ", "")
+        attributes = {attribute.replace(" ", ""): value for attribute, value in attributes.items()}
+        if not self.stack:
+            if uri != RDF_ROOT or attributes.keys() - {XML_LANG}:
+                raise UnsupportedSerializationError("The root element has to be rdf:RDF without attributes.")
+            self.stack.append(PropertyFrame(None, None, None, None, attributes.get(XML_LANG)))
+        elif isinstance(self.stack[-1], PropertyFrame):
+            self.start_node_element(uri, attributes)
+        else:
+            self.start_property_element(uri, attributes)
+
+    def start_node_element(self, uri: str, attributes: Dict[str, str]):
+        parent = self.stack[-1]
+        if parent.node_frame and (parent.object is not None or "".join(parent.text_parts).strip()):
+            raise UnsupportedSerializationError(f"Property {parent.predicate} has more than one value.")
+        if attributes.keys() - NODE_ELEMENT_ATTRIBUTES or (uri.startswith(str(RDF)) and uri != RDF_DESCRIPTION):
+            raise UnsupportedSerializationError(f"Unsupported node element {uri} with attributes {list(attributes)}.")
+        if RDF_ABOUT in attributes and RDF_NODE_ID in attributes:
+            raise UnsupportedSerializationError("A node element has both rdf:about and rdf:nodeID.")
+
+        if RDF_ABOUT in attributes:
+            subject = get_uri(attributes[RDF_ABOUT])
+            description = NodeDescription(subject)
+        else:
+            description = parent.node_frame.description if parent.node_frame else NodeDescription()
+            if RDF_NODE_ID in attributes:
+                subject = self.get_blank_node(attributes[RDF_NODE_ID], description)
+            else:
+                subject = BNode()
+            if description.subject is None:
+                description.subject = subject
+
+        if parent.node_frame:
+            self.add_triple(parent.node_frame.description, (parent.node_frame.subject, parent.predicate, subject))
+        parent.object = subject
+        if uri != RDF_DESCRIPTION:
+            self.add_triple(description, (subject, RDF.type, URIRef(uri)))
+        self.stack.append(NodeFrame(subject, description, attributes.get(XML_LANG, parent.language)))
+
+    def start_property_element(self, uri: str, attributes: Dict[str, str]):
+        node_frame = self.stack[-1]
+        if attributes.keys() - PROPERTY_ELEMENT_ATTRIBUTES or (uri.startswith(str(RDF)) and uri not in RDF_PROPERTIES):
+            raise UnsupportedSerializationError(
+                f"Unsupported property element {uri} with attributes {list(attributes)}."
+            )
+        if RDF_RESOURCE in attributes and RDF_NODE_ID in attributes:
+            raise UnsupportedSerializationError("A property element has both rdf:resource and rdf:nodeID.")
+
+        obj = None
+        if RDF_RESOURCE in attributes:
+            obj = get_uri(attributes[RDF_RESOURCE])
+        elif RDF_NODE_ID in attributes:
+            obj = self.get_blank_node(attributes[RDF_NODE_ID], node_frame.description)
+        datatype = get_uri(attributes[RDF_DATATYPE]) if RDF_DATATYPE in attributes else None
+        self.stack.append(
+            PropertyFrame(node_frame, URIRef(uri), obj, datatype, attributes.get(XML_LANG, node_frame.language))
+        )
+
+    def characters(self, text: str):
+        frame = self.stack[-1] if self.stack else None
+        if isinstance(frame, PropertyFrame):
+            frame.text_parts.append(text)
+        elif text.strip():
+            raise UnsupportedSerializationError("Text is only allowed within property elements.")
+
+    def end_element(self, name: str):
+        frame = self.stack.pop()
+        if isinstance(frame, NodeFrame):
+            if frame.description.subject == frame.subject:
+                self.complete_description(frame.description)
+            return
+        if frame.node_frame is None:
+            return
+
+        text = "".join(frame.text_parts)
+        if frame.object is None:
+            if frame.datatype is None:
+                obj = Literal(text, lang=frame.language)
+            else:
+                obj = Literal(text, datatype=frame.datatype)
+            self.add_triple(frame.node_frame.description, (frame.node_frame.subject, frame.predicate, obj))
+        elif text.strip():
+            raise UnsupportedSerializationError(f"Property {frame.predicate} has both a text and another value.")
+        elif frame.is_reference:
+            self.add_triple(frame.node_frame.description, (frame.node_frame.subject, frame.predicate, frame.object))
+
+    def add_triple(self, description: NodeDescription, triple: Tuple[Node, Node, Node]):
+        description.triples.append(triple)
+        subject, predicate, obj = triple
+        if predicate != RDF.type:
+            return
+        if obj in ELEMENT_PARSERS:
+            if not isinstance(subject, URIRef) or description.element_type not in [None, obj]:
+                raise UnsupportedSerializationError(f"Unsupported node {subject} of type {obj}.")
+            description.element_type = obj
+        elif obj == SPDX_DOCUMENT and self.doc_namespace is None and "#" in subject:
+            # parse_creation_info() checks the node of the document again in the end
+            self.doc_namespace = urldefrag(str(subject))[0] or None
+
+    def get_blank_node(self, node_id: str, description: NodeDescription) -> BNode:
+        if node_id not in self.blank_nodes:
+            self.blank_nodes[node_id] = (BNode(), description)
+        blank_node, first_description = self.blank_nodes[node_id]
+        if first_description is not description:
+            if first_description.is_complete and first_description.element_type:
+                raise UnsupportedSerializationError(f"Blank node {node_id} belongs to more than one node element.")
+            first_description.shares_blank_nodes = True
+            description.shares_blank_nodes = True
+        return blank_node
+
+    def complete_description(self, description: NodeDescription):
+        description.is_complete = True
+        subject = description.subject
+        is_element = description.element_type is not None
+        if not is_element and not describes_only_relationships(description):
+            if subject in self.parsed_element_nodes or subject in self.type_only_descriptions:
+                raise UnsupportedSerializationError(f"Element {subject} is described in more than one node element.")
+            if not (isinstance(subject, URIRef) and subject.startswith(LICENSE_NAMESPACE)):
+                for triple in description.triples:
+                    self.graph.add(triple)
+            description.triples = []
+            return
+
+        if description.shares_blank_nodes:
+            raise UnsupportedSerializationError(f"Element {subject} shares blank nodes with other node elements.")
+        if is_element and len(description.triples) == 1:
+            # only the type, which is given where the element is referenced
+            self.type_only_descriptions.setdefault(subject, description)
+            return
+        if is_element:
+            if subject in self.parsed_element_nodes or (subject, None, None) in self.graph:
+                raise UnsupportedSerializationError(f"Element {subject} is described in more than one node element.")
+            self.parsed_element_nodes.add(subject)
+
+        if self.doc_namespace is None:
+            self.descriptions_without_namespace.append(description)
+            return
+        for waiting_description in self.descriptions_without_namespace:
+            self.parse_or_postpone_description(waiting_description)
+        self.descriptions_without_namespace.clear()
+        self.parse_or_postpone_description(description)
+
+    def parse_or_postpone_description(self, description: NodeDescription):
+        for subject, predicate, obj in description.triples:
+            for node in [subject, obj]:
+                if (
+                    isinstance(node, URIRef)
+                    and "#" in node
+                    and predicate != RDF.type
+                    and not str(node).startswith((*VOCABULARY_NAMESPACES, f"{self.doc_namespace}#"))
+                ):
+                    # the id might be prefixed with an external document reference that has not been read yet
+                    self.descriptions_for_the_end.append(description)
+                    return
+            if predicate == SPDX_LICENSE_EXCEPTION and isinstance(obj, URIRef):
+                if not obj.startswith(LICENSE_NAMESPACE) and (obj, None, None) not in self.graph:
+                    self.descriptions_for_the_end.append(description)
+                    return
+        self.parse_description(description)
+
+    def parse_description(self, description: NodeDescription):
+        """
+        Parses the element, if the description is one of a package, file or snippet, as well as the annotations and
+        relationships in the description. The triples are only added to the graph for as long as this takes.
+        """
+        for triple in description.triples:
+            self.graph.add(triple)
+        if description.element_type is not None:
+            field, parsing_method = ELEMENT_PARSERS[description.element_type]
+            try:
+                self.parsed_fields[field].append(parsing_method(description.subject, self.graph, self.doc_namespace))
+            except SPDXParsingError as err:
+                self.logger.extend(err.get_messages())
+
+        for subject, predicate, obj in description.triples:
+            if predicate == SPDX_ANNOTATION:
+                self.parse_and_append(self.annotations, parse_annotation, obj, subject)
+            elif predicate == SPDX_RELATIONSHIP:
+                self.parse_and_append(self.relationships, parse_relationship, obj, subject)
+            elif predicate in IMPLICIT_RELATIONSHIP_TYPES:
+                self.implicit_relationship_triples.append((subject, IMPLICIT_RELATIONSHIP_TYPES[predicate], obj))
+        for triple in description.triples:
+            self.graph.remove(triple)
+        description.triples = []
+        self.parsed_description_count += 1
+        if self.parsed_description_count % GRAPH_RENEWAL_INTERVAL == 0:
+            self.graph = copy_graph(self.graph)
+
+    def parse_and_append(self, elements: List, parsing_method, element_node: Node, parent_node: Node):
+        try:
+            elements.append(parsing_method(element_node, self.graph, parent_node, self.doc_namespace))
+        except SPDXParsingError as err:
+            self.logger.extend(err.get_messages())
+
+    def bind_namespace(self, prefix: Optional[str], uri: str):
+        # like rdflib's parser, so that parse_spdx_id() abbreviates the same URIs
+        self.graph.bind(prefix, uri or "", override=False)
+
+    @staticmethod
+    def reject_entities(*args):
+        raise UnsupportedSerializationError("Entity declarations are not supported.")
+
+
+def copy_graph(graph: Graph) -> Graph:
+    graph_copy = Graph(store="SimpleMemory")
+    for prefix, namespace in graph.namespaces():
+        graph_copy.bind(prefix, namespace, override=False)
+    for triple in graph:
+        graph_copy.add(triple)
+    return graph_copy
+
+
+def describes_only_relationships(description: NodeDescription) -> bool:
+    """
+    Relationships and annotations are often written apart from the description of their element, e.g. by the streaming
+    RDF writer, but can be parsed on their own.
+    """
+    return all(
+        predicate in (SPDX_RELATIONSHIP, SPDX_ANNOTATION)
+        for subject, predicate, _ in description.triples
+        if subject == description.subject
+    )
+
+
+def get_uri(value: str) -> URIRef:
+    if ":" not in value:
+        raise UnsupportedSerializationError(f"Relative URI {value} is not supported.")
+    return URIRef(value)
+
+
+def get_relationship_key(relationship: Relationship) -> Tuple:
+    return (
+        relationship.spdx_element_id,
+        relationship.relationship_type,
+        relationship.related_spdx_element_id,
+        relationship.comment,
+    )
@@ -11,8 +11,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from beartype.typing import Dict, Tuple
 from ply import lex
-from ply.lex import TOKEN
+from ply.lex import TOKEN, Lexer
+
+# compiled lexers by build arguments, shared by all SPDXLexer instances of the process
+_LEXER_TEMPLATES: Dict[Tuple, Lexer] = dict()
 
 
 class SPDXLexer:
@@ -193,7 +197,18 @@ class SPDXLexer:
         pass
 
     def build(self, **kwargs):
-        self.lexer = lex.lex(module=self, **kwargs)
+        # Compiling the master regular expression of the lexer is expensive, so it is done only once per process and
+        # set of build arguments. Each instance gets a clone of the compiled lexer whose rules are bound to itself.
+        template_key = tuple(sorted(kwargs.items()))
+        if template_key not in _LEXER_TEMPLATES:
+            _LEXER_TEMPLATES[template_key] = lex.lex(module=SPDXLexer(), **kwargs)
+        self.lexer = _LEXER_TEMPLATES[template_key].clone(self)
+        self.reset()
+
+    def reset(self):
+        self.lexer.lexstatestack = []
+        self.lexer.begin("INITIAL")
+        self.lexer.lineno = 1
 
     def token(self):
         return self.lexer.token()
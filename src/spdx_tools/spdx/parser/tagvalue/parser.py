@@ -12,12 +12,15 @@
 # limitations under the License.
 
 import re
+from copy import copy
 
-from beartype.typing import Any, Dict, List
-from license_expression import ExpressionError, get_spdx_licensing
+from beartype.typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+from license_expression import ExpressionError
 from ply import yacc
 from ply.yacc import LRParser
 
+from spdx_tools.common.spdx_licensing import parse_spdx_license_expression
+from spdx_tools.common.typing.type_checks import trusted_construction
 from spdx_tools.spdx.datetime_conversions import datetime_from_str
 from spdx_tools.spdx.model import (
     Annotation,
@@ -73,6 +76,9 @@ ELEMENT_EXPECTED_START_TAG = dict(
     ExtractedLicensingInfo="LicenseID",
 )
 
+# LALR parser whose tables are shared by all Parser instances of the process; its grammar rules are not bound
+_LR_PARSER_TEMPLATE: Optional[LRParser] = None
+
 
 class Parser:
     tokens: List[str]
@@ -80,18 +86,30 @@ class Parser:
     current_element: Dict[str, Any]
     creation_info: Dict[str, Any]
     elements_built: Dict[str, Any]
+    relationship_keys: Set[Tuple]
+    constructed_elements: Optional[List[Any]]
     lex: SPDXLexer
     yacc: LRParser
 
     def __init__(self, **kwargs):
         self.tokens = SPDXLexer.tokens
+        self.lex = SPDXLexer()
+        self.lex.build(reflags=re.UNICODE)
+        if kwargs:
+            self.yacc = yacc.yacc(module=self, **kwargs)
+        else:
+            self.yacc = _create_lr_parser(self)
+        self.reset()
+
+    def reset(self):
+        """Discards all state of a previous parse, so that the instance can be reused for parsing another document."""
         self.logger = Logger()
         self.current_element = {"logger": Logger()}
         self.creation_info = {"logger": Logger()}
         self.elements_built = dict()
-        self.lex = SPDXLexer()
-        self.lex.build(reflags=re.UNICODE)
-        self.yacc = yacc.yacc(module=self, **kwargs)
+        self.relationship_keys = set()
+        self.constructed_elements = None
+        self.lex.reset()
 
     @grammar_rule("start : start attrib ")
     def p_start_start_attrib(self, p):
@@ -237,7 +255,7 @@ class Parser:
     @grammar_rule("license_or_no_assertion_or_none : LINE")
     def p_license(self, p):
         try:
-            p[0] = get_spdx_licensing().parse(p[1])
+            p[0] = parse_spdx_license_expression(p[1])
         except ExpressionError as err:
             error_message = f"Error while parsing license expression: {p[1]}"
             if err.args:
@@ -537,11 +555,62 @@ class Parser:
 
     def parse(self, text):
         # entry point for the tag-value parser
-        self.yacc.parse(text, lexer=self.lex)
+        return self.parse_chunks([text])
+
+    def parse_chunks(self, chunks: Iterable[str]) -> Document:
+        """
+        Parses a document that is given as consecutive pieces of its text, so that the whole text never has to be
+        held in memory. The chunks have to be split at line boundaries outside <text>...</text> blocks,
+        see split_into_chunks().
+        """
+        self.reset()
+        for chunk in chunks:
+            self.yacc.parse(chunk, lexer=self.lex)
         # this constructs the last remaining element; all other elements are constructed at the start of
         # their subsequent element
         self.construct_current_element()
 
+        creation_info = self.construct_creation_info()
+        self.elements_built["creation_info"] = creation_info
+        document = construct_or_raise_parsing_error(Document, self.elements_built)
+        return document
+
+    def iter_elements(
+        self, chunks: Iterable[str], trusted: bool = False
+    ) -> Iterator[Union[Package, File, Snippet, Relationship, Annotation, ExtractedLicensingInfo, CreationInfo]]:
+        """
+        Parses a document given as chunks (see parse_chunks()) and yields every element as soon as it is
+        constructed, followed by the creation info once the whole input has been read. Elements are not kept after
+        they have been yielded, so memory usage does not grow with the size of the document.
+        As errors are collected over the whole input, an SPDXParsingError is only raised at the end, after all
+        elements that could be constructed have been yielded.
+        Construction is only done in trusted mode (see trusted_construction()) while the parser is running, the
+        mode is never active while this generator is suspended.
+        """
+        self.reset()
+        self.constructed_elements = []
+        for chunk in chunks:
+            with trusted_construction(trusted):
+                self.yacc.parse(chunk, lexer=self.lex)
+            yield from self.pop_constructed_elements()
+
+        with trusted_construction(trusted):
+            self.construct_current_element()
+        yield from self.pop_constructed_elements()
+
+        with trusted_construction(trusted):
+            creation_info = self.construct_creation_info()
+        yield creation_info
+
+    def pop_constructed_elements(self) -> List[Any]:
+        constructed_elements = self.constructed_elements
+        self.constructed_elements = []
+        # Only the last package is needed to assign subsequent files to it, all other elements have been handed out.
+        for field_name, elements in self.elements_built.items():
+            del elements[: -1 if field_name == "packages" else None]
+        return constructed_elements
+
+    def construct_creation_info(self) -> CreationInfo:
         # To be able to parse creation info values if they appear in between other elements, e.g. packages, we use
         # two different dictionaries to collect the creation info and all other elements. Therefore, we have a separate
         # logger for the creation info whose messages we need to add to the main logger to than raise all collected
@@ -551,10 +620,7 @@ class Parser:
             self.logger.extend([f"Error while parsing CreationInfo: {creation_info_logger.get_messages()}"])
 
         raise_parsing_error_if_logger_has_messages(self.logger)
-        creation_info = construct_or_raise_parsing_error(CreationInfo, self.creation_info)
-        self.elements_built["creation_info"] = creation_info
-        document = construct_or_raise_parsing_error(Document, self.elements_built)
-        return document
+        return construct_or_raise_parsing_error(CreationInfo, self.creation_info)
 
     def initialize_new_current_element(self, clazz: Any):
         self.construct_current_element()
@@ -579,9 +645,8 @@ class Parser:
         clazz = self.current_element.pop("class")
         try:
             raise_parsing_error_if_logger_has_messages(self.current_element.pop("logger"), clazz.__name__)
-            self.elements_built.setdefault(CLASS_MAPPING[clazz.__name__], []).append(
-                construct_or_raise_parsing_error(clazz, self.current_element)
-            )
+            elements = self.elements_built.setdefault(CLASS_MAPPING[clazz.__name__], [])
+            self.add_built_element(elements, construct_or_raise_parsing_error(clazz, self.current_element))
             if clazz == File:
                 self.check_for_preceding_package_and_build_contains_relationship()
         except SPDXParsingError as err:
@@ -604,5 +669,51 @@ class Parser:
             return
         package_spdx_id = self.elements_built["packages"][-1].spdx_id
         relationship = Relationship(package_spdx_id, RelationshipType.CONTAINS, file_spdx_id)
-        if relationship not in self.elements_built.setdefault("relationships", []):
-            self.elements_built["relationships"].append(relationship)
+        if get_relationship_key(relationship) not in self.relationship_keys:
+            self.add_built_element(self.elements_built.setdefault("relationships", []), relationship)
+
+    def add_built_element(self, elements: List[Any], element: Any):
+        elements.append(element)
+        if isinstance(element, Relationship):
+            self.relationship_keys.add(get_relationship_key(element))
+        if self.constructed_elements is not None:
+            self.constructed_elements.append(element)
+
+
+def get_relationship_key(relationship: Relationship) -> Tuple:
+    # relationships are not hashable, but the key compares equal exactly if the relationships do
+    return (
+        relationship.spdx_element_id,
+        relationship.relationship_type,
+        relationship.related_spdx_element_id,
+        relationship.comment,
+    )
+
+
+def _create_lr_parser(parser: Parser) -> LRParser:
+    """
+    Returns an LALR parser for the given Parser instance. The grammar analysis and the loading of the parsing tables
+    only happen for the first call per process, all subsequent calls share these tables.
+    """
+    global _LR_PARSER_TEMPLATE
+    if _LR_PARSER_TEMPLATE is None:
+        lr_parser_template = yacc.yacc(module=parser)
+        # The grammar rules of the template must not be bound to the instance it has been built from. Instead, they
+        # dispatch to the Parser instance attached to the LRParser that is currently running.
+        for production in lr_parser_template.productions:
+            if production.func:
+                production.callable = _create_grammar_rule_dispatcher(getattr(Parser, production.func))
+        lr_parser_template.errorfunc = None
+        _LR_PARSER_TEMPLATE = lr_parser_template
+
+    lr_parser = copy(_LR_PARSER_TEMPLATE)
+    lr_parser.spdx_parser = parser
+    lr_parser.errorfunc = parser.p_error
+    return lr_parser
+
+
+def _create_grammar_rule_dispatcher(grammar_rule_function: Callable) -> Callable:
+    def dispatch_grammar_rule(p):
+        return grammar_rule_function(p.parser.spdx_parser, p)
+
+    return dispatch_grammar_rule
@@ -1,13 +1,122 @@
 # SPDX-FileCopyrightText: 2023 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-from spdx_tools.spdx.model import Document
+import re
+
+from beartype.typing import Iterable, Iterator, List, Union
+
+from spdx_tools.common.typing.type_checks import trusted_construction
+from spdx_tools.spdx.model import (
+    Annotation,
+    CreationInfo,
+    Document,
+    ExtractedLicensingInfo,
+    File,
+    Package,
+    Relationship,
+    Snippet,
+)
 from spdx_tools.spdx.parser.tagvalue.parser import Parser
 
+# number of characters that are passed to the lexer at once when parsing in streaming mode
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# the same pattern the lexer uses to enter its text state
+TEXT_START_PATTERN = re.compile(r":\s*<text>")
+TEXT_START = "<text>"
+TEXT_END = "</text>"
+TAG_PATTERN = re.compile(r"[a-zA-Z]+:")
+# tags that are parsed together with the tag-value pair in the preceding line
+CONTINUATION_TAGS = ("RelationshipComment", "ExternalRefComment")
+
 
-def parse_from_file(file_name: str, encoding: str = "utf-8") -> Document:
+def parse_from_file(
+    file_name: str, encoding: str = "utf-8", trusted: bool = False, streaming: bool = False
+) -> Document:
+    """
+    If streaming is set, the file is read and lexed in chunks instead of being read into memory as a whole. The
+    resulting document is the same in both modes.
+    """
     parser = Parser()
     with open(file_name, encoding=encoding) as file:
+        if streaming:
+            with trusted_construction(trusted):
+                return parser.parse_chunks(split_into_chunks(file))
         data = file.read()
-    document: Document = parser.parse(data)
+    with trusted_construction(trusted):
+        document: Document = parser.parse(data)
     return document
+
+
+def iter_elements_from_file(
+    file_name: str, encoding: str = "utf-8", trusted: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[Union[Package, File, Snippet, Relationship, Annotation, ExtractedLicensingInfo, CreationInfo]]:
+    """
+    Reads the file in chunks and yields its elements in the order they are constructed, see Parser.iter_elements().
+    The creation info is yielded last.
+    """
+    with open(file_name, encoding=encoding) as file:
+        yield from Parser().iter_elements(split_into_chunks(file, chunk_size), trusted)
+
+
+def split_into_chunks(lines: Iterable[str], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+    """
+    Joins the given lines (including their line breaks) to chunks of at least chunk_size characters that can be
+    lexed and parsed independently of each other: a chunk only ends after a complete tag-value pair outside of
+    <text>...</text> blocks, and the next chunk starts with a tag that does not continue the preceding pair (like
+    the comment of a relationship or an external package reference). Like in the lexer, a text block may also start
+    on one of the lines after its tag.
+    """
+    chunk: List[str] = []
+    chunk_length = 0
+    in_text = False
+    at_complete_value = False
+    awaits_value = False
+    for line in lines:
+        stripped_line = line.strip()
+        if chunk_length >= chunk_size and at_complete_value and _starts_new_tag_value_pair(stripped_line):
+            yield "".join(chunk)
+            chunk = []
+            chunk_length = 0
+        chunk.append(line)
+        chunk_length += len(line)
+        in_text = _is_in_text_at_end_of_line(line, in_text, awaits_value)
+        if stripped_line:
+            # a tag without a value on the same line is completed by one of the following lines
+            awaits_value = not in_text and stripped_line.endswith(":")
+            at_complete_value = not in_text and (
+                stripped_line.endswith(TEXT_END) or (":" in stripped_line and not awaits_value)
+            )
+
+    if chunk:
+        yield "".join(chunk)
+
+
+def _starts_new_tag_value_pair(line: str) -> bool:
+    # Lines that do not start with a tag (e.g. stray lines of a broken multi-line value) are tokenized together with
+    # the preceding pair, as they might change how it is parsed.
+    return bool(TAG_PATTERN.match(line)) and not line.startswith(CONTINUATION_TAGS)
+
+
+def _is_in_text_at_end_of_line(line: str, in_text: bool, awaits_value: bool = False) -> bool:
+    # The start pattern may also match inside of a single line value, in which case the chunk is just not split
+    # until the next closing tag. This only leads to larger chunks, never to a split within a text block.
+    position = 0
+    stripped_line = line.lstrip()
+    if awaits_value and not in_text and stripped_line.startswith(TEXT_START):
+        # the colon of the tag in one of the preceding lines, the line breaks and <text> form the start pattern
+        in_text = True
+        position = len(line) - len(stripped_line) + len(TEXT_START)
+    while True:
+        if in_text:
+            end = line.find(TEXT_END, position)
+            if end == -1:
+                return True
+            in_text = False
+            position = end + len(TEXT_END)
+        else:
+            match = TEXT_START_PATTERN.search(line, position)
+            if not match:
+                return False
+            in_text = True
+            position = match.end()
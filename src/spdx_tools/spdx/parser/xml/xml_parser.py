@@ -1,71 +1,223 @@
 # SPDX-FileCopyrightText: 2023 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-import xmltodict
-from beartype.typing import Any, Dict
+from xml.parsers import expat
 
-from spdx_tools.spdx.model import Document
+from beartype.typing import Any, Callable, Collection, Dict, Iterator, List, Optional, Set, TextIO, Tuple, Union
+
+from spdx_tools.common.typing.type_checks import trusted_construction
+from spdx_tools.spdx.model import (
+    Annotation,
+    CreationInfo,
+    Document,
+    ExtractedLicensingInfo,
+    File,
+    Package,
+    Relationship,
+    Snippet,
+)
 from spdx_tools.spdx.parser.error import SPDXParsingError
-from spdx_tools.spdx.parser.jsonlikedict.json_like_dict_parser import JsonLikeDictParser
-
-LIST_LIKE_FIELDS = [
-    "creators",
-    "externalDocumentRefs",
-    "hasExtractedLicensingInfos",
-    "seeAlsos",
-    "annotations",
-    "relationships",
-    "snippets",
-    "reviewers",
-    "fileTypes",
-    "licenseInfoFromFiles",
-    "licenseInfoInFiles",
-    "artifactOf",
-    "fileContributors",
-    "fileDependencies",
-    "files",
-    "documentDescribes",
-    "packages",
-    "checksums",
-    "hasFiles",
-    "externalRefs",
-    "ranges",
-    "licenseInfoInSnippets",
-    "packageVerificationCodeExcludedFiles",
-    "attributionTexts",
-]
-
-
-def parse_from_file(file_name: str, encoding: str = "utf-8") -> Document:
+from spdx_tools.spdx.parser.jsonlikedict.json_like_dict_parser import STREAMED_FIELDS, JsonLikeDictParser
+
+LIST_LIKE_FIELDS = frozenset(
+    [
+        "creators",
+        "externalDocumentRefs",
+        "hasExtractedLicensingInfos",
+        "seeAlsos",
+        "annotations",
+        "relationships",
+        "snippets",
+        "reviewers",
+        "fileTypes",
+        "licenseInfoFromFiles",
+        "licenseInfoInFiles",
+        "artifactOf",
+        "fileContributors",
+        "fileDependencies",
+        "files",
+        "documentDescribes",
+        "packages",
+        "checksums",
+        "hasFiles",
+        "externalRefs",
+        "ranges",
+        "licenseInfoInSnippets",
+        "packageVerificationCodeExcludedFiles",
+        "attributionTexts",
+    ]
+)
+
+# number of characters that are read at once when parsing incrementally
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+MISSING_DOCUMENT_TAG_MESSAGE = 'Did not find the XML top level tag "Document".'
+
+
+def parse_from_file(
+    file_name: str,
+    encoding: str = "utf-8",
+    trusted: bool = False,
+    on_element: Optional[
+        Callable[[Union[Package, File, Snippet, Relationship, Annotation, ExtractedLicensingInfo, CreationInfo]], Any]
+    ] = None,
+) -> Optional[Document]:
+    """
+    If on_element is given, the file is parsed incrementally and every element is passed to on_element as soon as it
+    has been parsed (see iter_elements_from_file()) instead of being collected in a document; None is returned then.
+    """
+    if on_element:
+        for element in iter_elements_from_file(file_name, encoding, trusted):
+            on_element(element)
+        return None
+
     with open(file_name, encoding=encoding) as file:
-        parsed_xml: Dict = xmltodict.parse(file.read(), encoding="utf-8")
+        parsed_xml: Dict = parse_xml_to_dict(file.read())
 
-    input_doc_as_dict: Dict = _fix_list_like_fields(parsed_xml).get("Document")
+    input_doc_as_dict: Optional[Dict] = parsed_xml.get("Document")
 
     if not input_doc_as_dict:
-        raise SPDXParsingError(['Did not find the XML top level tag "Document".'])
+        raise SPDXParsingError([MISSING_DOCUMENT_TAG_MESSAGE])
+
+    with trusted_construction(trusted):
+        return JsonLikeDictParser().parse(input_doc_as_dict)
+
+
+def iter_elements_from_file(
+    file_name: str, encoding: str = "utf-8", trusted: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[Union[Package, File, Snippet, Relationship, Annotation, ExtractedLicensingInfo, CreationInfo]]:
+    """
+    Parses the file incrementally, so that neither the whole file nor the whole document has to be held in memory.
+    Packages, files, snippets and relationships are yielded one at a time while the file is read, see
+    JsonLikeDictParser.iter_elements() for the remaining elements and the handling of errors.
+    Construction is only done in trusted mode while the parser is running, never while this generator is suspended.
+    """
+    with open(file_name, encoding=encoding) as file:
+        elements = JsonLikeDictParser().iter_elements(iter_top_level_members(file, STREAMED_FIELDS, chunk_size))
+        while True:
+            with trusted_construction(trusted):
+                element = next(elements, None)
+            if element is None:
+                return
+            yield element
 
-    return JsonLikeDictParser().parse(input_doc_as_dict)
 
+def parse_xml_to_dict(xml_str: str) -> Dict:
+    """
+    Returns the same dictionary as xmltodict.parse(xml_str), except that all fields from LIST_LIKE_FIELDS are lists.
+    """
+    builder = XmlDictBuilder()
+    builder.create_parser().Parse(xml_str, True)
+    return builder.item or {}
 
-def _fix_list_like_fields(data: Any) -> Any:
+
+def iter_top_level_members(
+    file: TextIO, streamed_keys: Collection[str], chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[Tuple[str, Any]]:
     """
-    XML files do not contain lists. Thus, single fields that should be a list in SPDX have to be manually cast.
-    This method takes a parsed dictionary and converts all values with key from LIST_LIKE_FIELDS to lists.
+    Reads the XML document in the given file incrementally and yields the (key, value) pairs of its "Document" tag
+    as parse_xml_to_dict() returns them. For streamed_keys, one pair per tag is yielded as soon as the tag has been
+    read; all other pairs are yielded at the end. Malformed input raises an expat.ExpatError.
     """
-    if isinstance(data, dict):
-        new_data = {}
-        for key, value in data.items():
-            if key in LIST_LIKE_FIELDS and not isinstance(value, list):
-                new_data[key] = [_fix_list_like_fields(value)] if value else []
+    streamed_members: List[Tuple[str, Any]] = []
+    builder = XmlDictBuilder(streamed_keys, lambda key, value: streamed_members.append((key, value)))
+    parser = builder.create_parser()
+    # a single empty tag stands for an empty list, so the first empty tag of a key is only passed on with the second
+    streamed_counts: Dict[str, int] = {}
+    held_back_keys: Set[str] = set()
+
+    while True:
+        chunk = file.read(chunk_size)
+        parser.Parse(chunk, not chunk)
+        for key, value in streamed_members:
+            streamed_counts[key] = streamed_counts.get(key, 0) + 1
+            if key in held_back_keys:
+                held_back_keys.remove(key)
+                yield key, None
+            if value is None and streamed_counts[key] == 1:
+                held_back_keys.add(key)
             else:
-                new_data[key] = _fix_list_like_fields(value)
-        return new_data
+                yield key, value
+        streamed_members.clear()
+        if not chunk:
+            break
 
-    if isinstance(data, list):
-        new_data = []
-        for element in data:
-            new_data.append(_fix_list_like_fields(element))
-        return new_data
+    document_dict: Optional[Dict] = (builder.item or {}).get("Document")
+    if not document_dict and not streamed_counts:
+        raise SPDXParsingError([MISSING_DOCUMENT_TAG_MESSAGE])
+    yield from (document_dict or {}).items()
+
+
+class XmlDictBuilder:
+    """
+    Handles the events of an expat parser like xmltodict does with its default options: tags become keys, repeated
+    tags become lists, attributes are prefixed with "@" and text next to child tags or attributes is stored under
+    "#text". As XML files do not contain lists, the fields from LIST_LIKE_FIELDS are made lists while building, where
+    a single empty tag stands for an empty list. This way, no second pass over the built tree is needed.
+    If on_member is given, the children of the "Document" tag whose names are in streamed_keys are passed to it as
+    soon as they are complete instead of being added to the tree.
+    """
+
+    def __init__(self, streamed_keys: Collection[str] = (), on_member: Optional[Callable[[str, Any], Any]] = None):
+        self.item: Optional[Dict] = None
+        self.text_parts: List[str] = []
+        self.stack: List[Tuple[Optional[Dict], List[str]]] = []
+        self.streamed_keys = frozenset(streamed_keys) if on_member else frozenset()
+        self.on_member = on_member
+
+    def create_parser(self) -> expat.XMLParserType:
+        parser = expat.ParserCreate("utf-8")
+        parser.ordered_attributes = True
+        parser.buffer_text = True
+        parser.StartElementHandler = self.start_element
+        parser.EndElementHandler = self.end_element
+        parser.CharacterDataHandler = self.characters
+        # like xmltodict, do not expand entities that are declared in the document
+        parser.EntityDeclHandler = self.forbid_entities
+        return parser
+
+    def start_element(self, name: str, attributes: List[str]):
+        self.stack.append((self.item, self.text_parts))
+        if len(self.stack) == 1 and name != "Document":
+            self.streamed_keys = frozenset()
+        self.item = None
+        if attributes:
+            self.item = {"@" + attributes[index]: attributes[index + 1] for index in range(0, len(attributes), 2)}
+        self.text_parts = []
+
+    def characters(self, text: str):
+        self.text_parts.append(text)
+
+    def end_element(self, name: str):
+        item = self.item
+        text = "".join(self.text_parts).strip() or None
+        self.item, self.text_parts = self.stack.pop()
+        if item is None:
+            value = text
+        else:
+            if text:
+                item["#text"] = text
+            for key in item.keys() & LIST_LIKE_FIELDS:
+                if item[key] == [None]:
+                    item[key] = []
+            value = item
+
+        if len(self.stack) == 1 and name in self.streamed_keys:
+            self.on_member(name, value)
+            return
+        if self.item is None:
+            self.item = {}
+        if name in self.item:
+            existing_value = self.item[name]
+            if isinstance(existing_value, list):
+                existing_value.append(value)
+            else:
+                self.item[name] = [existing_value, value]
+        elif name in LIST_LIKE_FIELDS:
+            self.item[name] = [value]
+        else:
+            self.item[name] = value
 
-    return data
+    @staticmethod
+    def forbid_entities(*args):
+        raise ValueError("entities are disabled")
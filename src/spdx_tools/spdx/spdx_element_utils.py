@@ -3,8 +3,13 @@
 # SPDX-License-Identifier: Apache-2.0
 import hashlib
 
-from beartype.typing import List, Optional, Type, Union
+from beartype.typing import Dict, List, Optional, Type, Union
 
+from spdx_tools.spdx.document_utils import (
+    SpdxIdLocation,
+    get_element_type_from_spdx_id_locations,
+    get_spdx_id_locations,
+)
 from spdx_tools.spdx.model import (
     ChecksumAlgorithm,
     Document,
@@ -17,15 +22,15 @@ from spdx_tools.spdx.model import (
 
 
 def get_element_type_from_spdx_id(
-    spdx_id: str, document: Document
+    spdx_id: str, document: Document, spdx_id_locations: Optional[Dict[str, List[SpdxIdLocation]]] = None
 ) -> Optional[Union[Type[Package], Type[File], Type[Snippet]]]:
-    if spdx_id in [package.spdx_id for package in document.packages]:
-        return Package
-    if spdx_id in [file.spdx_id for file in document.files]:
-        return File
-    if spdx_id in [snippet.spdx_id for snippet in document.snippets]:
-        return Snippet
-    return None
+    """
+    Packages take precedence over files and files over snippets if they share the spdx_id. Pass the result of
+    get_spdx_id_locations(document) to look up several ids without collecting the ids of the document each time.
+    """
+    if spdx_id_locations is None:
+        spdx_id_locations = get_spdx_id_locations(document)
+    return get_element_type_from_spdx_id_locations(spdx_id_locations.get(spdx_id, []))
 
 
 def get_full_element_spdx_id(
@@ -2,34 +2,12 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-import re
-
-from beartype.typing import Dict, List
+from beartype.typing import List
 
 from spdx_tools.spdx.model import Checksum, ChecksumAlgorithm
+from spdx_tools.spdx.validation.regex_patterns import CHECKSUM_PATTERNS, algorithm_length
 from spdx_tools.spdx.validation.validation_message import SpdxElementType, ValidationContext, ValidationMessage
 
-# in hexadecimal digits
-algorithm_length: Dict = {
-    ChecksumAlgorithm.SHA1: "40",
-    ChecksumAlgorithm.SHA224: "56",
-    ChecksumAlgorithm.SHA256: "64",
-    ChecksumAlgorithm.SHA384: "96",
-    ChecksumAlgorithm.SHA512: "128",
-    ChecksumAlgorithm.SHA3_256: "64",
-    ChecksumAlgorithm.SHA3_384: "96",
-    ChecksumAlgorithm.SHA3_512: "128",
-    ChecksumAlgorithm.BLAKE2B_256: "64",
-    ChecksumAlgorithm.BLAKE2B_384: "96",
-    ChecksumAlgorithm.BLAKE2B_512: "128",
-    ChecksumAlgorithm.BLAKE3: "256,",  # at least 256 bits
-    ChecksumAlgorithm.MD2: "32",
-    ChecksumAlgorithm.MD4: "32",
-    ChecksumAlgorithm.MD5: "32",
-    ChecksumAlgorithm.MD6: "0,512",  # between 0 and 512 bits
-    ChecksumAlgorithm.ADLER32: "8",
-}
-
 
 def validate_checksums(checksums: List[Checksum], parent_id: str, spdx_version: str) -> List[ValidationMessage]:
     validation_messages = []
@@ -56,7 +34,7 @@ def validate_checksum(checksum: Checksum, parent_id: str, spdx_version: str) ->
     ]:
         return [ValidationMessage(f"{checksum.algorithm.name} is not supported in SPDX-2.2", context)]
 
-    if not re.match("^[0-9a-f]{" + algorithm_length[algorithm] + "}$", checksum.value):
+    if not CHECKSUM_PATTERNS[algorithm].match(checksum.value):
         if algorithm == ChecksumAlgorithm.BLAKE3:
             length = "at least 256"
         elif algorithm == ChecksumAlgorithm.MD6:
@@ -0,0 +1,59 @@
+# SPDX-FileCopyrightText: 2023 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+from dataclasses import dataclass
+
+from beartype.typing import Dict, FrozenSet, List, Optional, Type, Union
+
+from spdx_tools.spdx.document_utils import (
+    SpdxIdLocation,
+    get_element_type_from_spdx_id_locations,
+    get_spdx_id_locations,
+)
+from spdx_tools.spdx.model import Document, File, Package, Snippet
+from spdx_tools.spdx.model.relationship_index import RelationshipIndex
+
+
+@dataclass(frozen=True)
+class DocumentIndex:
+    """Lookup tables for the cross-references that are checked during validation. Building the index once per
+    validation run turns every existence check into a hash lookup instead of a scan over the whole document."""
+
+    document_spdx_id: str
+    spdx_ids: FrozenSet[str]  # contains the document's own spdx_id as well as the ids of all contained elements
+    file_spdx_ids: FrozenSet[str]
+    external_document_ref_ids: FrozenSet[str]
+    extracted_license_ids: FrozenSet[str]
+    element_types: Dict[str, Union[Type[Package], Type[File], Type[Snippet]]]
+    spdx_id_locations: Dict[str, List[SpdxIdLocation]]  # ids with more than one location are duplicates
+    relationship_index: RelationshipIndex
+
+    def get_element_type(self, spdx_id: str) -> Optional[Union[Type[Package], Type[File], Type[Snippet]]]:
+        return self.element_types.get(spdx_id)
+
+
+def build_document_index(document: Document) -> DocumentIndex:
+    spdx_id_locations: Dict[str, List[SpdxIdLocation]] = get_spdx_id_locations(document)
+    element_types: Dict[str, Union[Type[Package], Type[File], Type[Snippet]]] = {}
+    file_spdx_ids = set()
+    for spdx_id, locations in spdx_id_locations.items():
+        element_type = get_element_type_from_spdx_id_locations(locations)
+        if element_type is not None:
+            element_types[spdx_id] = element_type
+        if any(location.element_type is File for location in locations):
+            file_spdx_ids.add(spdx_id)
+
+    return DocumentIndex(
+        document_spdx_id=document.creation_info.spdx_id,
+        spdx_ids=frozenset(spdx_id_locations),
+        file_spdx_ids=frozenset(file_spdx_ids),
+        external_document_ref_ids=frozenset(
+            external_doc_ref.document_ref_id for external_doc_ref in document.creation_info.external_document_refs
+        ),
+        extracted_license_ids=frozenset(
+            extracted_licensing_info.license_id for extracted_licensing_info in document.extracted_licensing_info
+        ),
+        element_types=element_types,
+        spdx_id_locations=spdx_id_locations,
+        relationship_index=RelationshipIndex(document.relationships),
+    )
@@ -1,32 +1,101 @@
 # SPDX-FileCopyrightText: 2022 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-from beartype.typing import List
+from itertools import islice
 
-from spdx_tools.spdx.model import Document, RelationshipType
-from spdx_tools.spdx.model.relationship_filters import filter_by_type_and_origin, filter_by_type_and_target
-from spdx_tools.spdx.validation.annotation_validator import validate_annotations
+from beartype.typing import Dict, Iterator, List, Optional, Type, Union
+
+from spdx_tools.spdx.document_utils import SpdxIdLocation
+from spdx_tools.spdx.model import Document, File, Package, RelationshipType, Snippet
+from spdx_tools.spdx.model.relationship_index import RelationshipIndex
+from spdx_tools.spdx.validation.annotation_validator import validate_annotation
 from spdx_tools.spdx.validation.creation_info_validator import validate_creation_info
-from spdx_tools.spdx.validation.extracted_licensing_info_validator import validate_extracted_licensing_infos
-from spdx_tools.spdx.validation.file_validator import validate_files
-from spdx_tools.spdx.validation.package_validator import validate_packages
-from spdx_tools.spdx.validation.relationship_validator import validate_relationships
-from spdx_tools.spdx.validation.snippet_validator import validate_snippets
-from spdx_tools.spdx.validation.spdx_id_validators import get_list_of_all_spdx_ids
+from spdx_tools.spdx.validation.document_index import DocumentIndex, build_document_index
+from spdx_tools.spdx.validation.extracted_licensing_info_validator import validate_extracted_licensing_info
+from spdx_tools.spdx.validation.file_validator import validate_file_within_document
+from spdx_tools.spdx.validation.package_validator import validate_package_within_document
+from spdx_tools.spdx.validation.parallel_validation import validate_elements_in_parallel
+from spdx_tools.spdx.validation.relationship_validator import validate_relationship
+from spdx_tools.spdx.validation.snippet_validator import validate_snippet_within_document
 from spdx_tools.spdx.validation.validation_message import SpdxElementType, ValidationContext, ValidationMessage
 
+ELEMENT_LIST_NAMES: Dict[Union[Type[Package], Type[File], Type[Snippet]], str] = {
+    Package: "packages",
+    File: "files",
+    Snippet: "snippets",
+}
+
+
+def validate_full_spdx_document(
+    document: Document,
+    spdx_version: str = None,
+    workers: Optional[int] = None,
+    max_messages: Optional[int] = None,
+    fail_fast: bool = False,
+) -> List[ValidationMessage]:
+    """
+    If more than one worker is given, the packages, files, snippets, annotations and relationships of the document are
+    validated in a pool of that many processes. The messages are the same (and in the same order) in both modes.
+    Validation stops as soon as max_messages messages have been found, or after the first one if fail_fast is set.
+    max_messages has to be at least 1, as an empty list of messages would claim that the document is valid.
+    """
+    if max_messages is not None and max_messages < 1:
+        raise ValueError(f"max_messages has to be at least 1, but is: {max_messages}")
+    if fail_fast:
+        max_messages = 1
+    return list(islice(iter_validation_messages(document, spdx_version, workers), max_messages))
+
+
+def iter_validation_messages(
+    document: Document, spdx_version: str = None, workers: Optional[int] = None
+) -> Iterator[ValidationMessage]:
+    """
+    Yields the messages of validate_full_spdx_document() one at a time while the document is validated, so that
+    consumers can stop validating at any point, e.g. once they know that the document is invalid. The elements of the
+    document are validated one after another, unless more than one worker is given. In that case, all of them are
+    validated in parallel as soon as the first of their messages is requested.
+    """
+    if not spdx_version:
+        spdx_version = document.creation_info.spdx_version
+    version_messages: List[ValidationMessage] = validate_document_spdx_version(document, spdx_version)
+    if version_messages:
+        yield from version_messages
+        return
+
+    document_index: DocumentIndex = build_document_index(document)
+
+    yield from validate_creation_info(document.creation_info, spdx_version)
+    if workers and workers > 1:
+        yield from validate_elements_in_parallel(document, spdx_version, document_index, workers)
+    else:
+        for package in document.packages:
+            yield from validate_package_within_document(package, spdx_version, document, document_index)
+        for file in document.files:
+            yield from validate_file_within_document(file, spdx_version, document, document_index)
+        for snippet in document.snippets:
+            yield from validate_snippet_within_document(snippet, spdx_version, document, document_index)
+        for annotation in document.annotations:
+            yield from validate_annotation(annotation, document, document_index)
+        for relationship in document.relationships:
+            yield from validate_relationship(relationship, spdx_version, document, document_index)
+    for extracted_licensing_info in document.extracted_licensing_info:
+        yield from validate_extracted_licensing_info(extracted_licensing_info)
+
+    yield from validate_describes_relationships(document, document_index)
+    yield from validate_unique_spdx_ids(document, document_index)
 
-def validate_full_spdx_document(document: Document, spdx_version: str = None) -> List[ValidationMessage]:
-    validation_messages: List[ValidationMessage] = []
 
-    # SPDX version validation has to happen here because subsequent validators rely on it
+def validate_document_spdx_version(document: Document, spdx_version: str) -> List[ValidationMessage]:
+    """
+    Returns no messages if the document's SPDX version is supported and equals the given one. Otherwise, the messages
+    end with one that cancels the validation, as subsequent validators rely on the correct version.
+    """
+    version_messages: List[ValidationMessage] = []
     document_version: str = document.creation_info.spdx_version
     context = ValidationContext(spdx_id=document.creation_info.spdx_id, element_type=SpdxElementType.DOCUMENT)
-    if not spdx_version:
-        spdx_version = document_version
 
     if document_version not in ["SPDX-2.2", "SPDX-2.3"]:
-        validation_messages.append(
+        version_messages.append(
             ValidationMessage(
                 f'only SPDX versions "SPDX-2.2" and "SPDX-2.3" are supported, but the document\'s spdx_version is: '
                 f"{document_version}",
@@ -34,7 +103,7 @@ def validate_full_spdx_document(document: Document, spdx_version: str = None) ->
             )
         )
     elif spdx_version != document_version:
-        validation_messages.append(
+        version_messages.append(
             ValidationMessage(
                 f"provided SPDX version {spdx_version} does not match "
                 f"the document's SPDX version {document_version}",
@@ -42,8 +111,8 @@ def validate_full_spdx_document(document: Document, spdx_version: str = None) ->
             )
         )
 
-    if validation_messages:
-        validation_messages.append(
+    if version_messages:
+        version_messages.append(
             ValidationMessage(
                 "There are issues concerning the SPDX version of the document. "
                 "As subsequent validation relies on the correct version, "
@@ -51,47 +120,61 @@ def validate_full_spdx_document(document: Document, spdx_version: str = None) ->
                 context,
             )
         )
-        return validation_messages
 
-    validation_messages.extend(validate_creation_info(document.creation_info, spdx_version))
-    validation_messages.extend(validate_packages(document.packages, spdx_version, document))
-    validation_messages.extend(validate_files(document.files, spdx_version, document))
-    validation_messages.extend(validate_snippets(document.snippets, spdx_version, document))
-    validation_messages.extend(validate_annotations(document.annotations, document))
-    validation_messages.extend(validate_relationships(document.relationships, spdx_version, document))
-    validation_messages.extend(validate_extracted_licensing_infos(document.extracted_licensing_info))
+    return version_messages
+
 
+def validate_describes_relationships(
+    document: Document, document_index: Optional[DocumentIndex] = None
+) -> List[ValidationMessage]:
+    if document_index is None:
+        document_index = build_document_index(document)
     document_id = document.creation_info.spdx_id
-    document_describes_relationships = filter_by_type_and_origin(
-        document.relationships, RelationshipType.DESCRIBES, document_id
+    relationship_index: RelationshipIndex = document_index.relationship_index
+    document_describes_relationships = relationship_index.filter_by_type_and_origin(
+        RelationshipType.DESCRIBES, document_id
     )
-    described_by_document_relationships = filter_by_type_and_target(
-        document.relationships, RelationshipType.DESCRIBED_BY, document_id
+    described_by_document_relationships = relationship_index.filter_by_type_and_target(
+        RelationshipType.DESCRIBED_BY, document_id
     )
 
     only_a_single_package = len(document.packages) == 1 and not document.files and not document.snippets
     if not only_a_single_package and not document_describes_relationships + described_by_document_relationships:
-        validation_messages.append(
+        return [
             ValidationMessage(
                 f'there must be at least one relationship "{document_id} DESCRIBES ..." or "... DESCRIBED_BY '
                 f'{document_id}" when there is not only a single package present',
                 ValidationContext(spdx_id=document_id, element_type=SpdxElementType.DOCUMENT),
             )
-        )
+        ]
+    return []
 
-    all_spdx_ids: List[str] = get_list_of_all_spdx_ids(document)
-    auxiliary_set = set()
-    duplicated_spdx_ids = set(
-        spdx_id for spdx_id in all_spdx_ids if spdx_id in auxiliary_set or auxiliary_set.add(spdx_id)
-    )
+
+def validate_unique_spdx_ids(
+    document: Document, document_index: Optional[DocumentIndex] = None
+) -> List[ValidationMessage]:
+    if document_index is None:
+        document_index = build_document_index(document)
+    duplicated_spdx_ids: Dict[str, List[SpdxIdLocation]] = {
+        spdx_id: locations for spdx_id, locations in document_index.spdx_id_locations.items() if len(locations) > 1
+    }
 
     if duplicated_spdx_ids:
-        validation_messages.append(
+        locations_of_duplicates = "; ".join(
+            f"{spdx_id}: " + ", ".join(format_spdx_id_location(location) for location in duplicated_spdx_ids[spdx_id])
+            for spdx_id in sorted(duplicated_spdx_ids)
+        )
+        return [
             ValidationMessage(
                 f"every spdx_id must be unique within the document, but found the following duplicates: "
-                f"{sorted(duplicated_spdx_ids)}",
-                context,
+                f"{sorted(duplicated_spdx_ids)} (used by {locations_of_duplicates})",
+                ValidationContext(spdx_id=document.creation_info.spdx_id, element_type=SpdxElementType.DOCUMENT),
             )
-        )
+        ]
+    return []
+
 
-    return validation_messages
+def format_spdx_id_location(location: SpdxIdLocation) -> str:
+    if location.element_type is Document:
+        return "creation_info"
+    return f"{ELEMENT_LIST_NAMES[location.element_type]}[{location.position}]"
@@ -1,42 +1,27 @@
 # SPDX-FileCopyrightText: 2022 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-import re
-
 import uritools
-from beartype.typing import Dict, List
+from beartype.typing import List
 
 from spdx_tools.spdx.model import ExternalPackageRef, ExternalPackageRefCategory
 from spdx_tools.spdx.model.package import CATEGORY_TO_EXTERNAL_PACKAGE_REF_TYPES
+from spdx_tools.spdx.validation.regex_patterns import (  # noqa: F401, the regexes are kept importable from here
+    BOWER_REGEX,
+    CPE22TYPE_REGEX,
+    CPE23TYPE_REGEX,
+    GITOID_REGEX,
+    MAVEN_CENTRAL_REGEX,
+    NPM_REGEX,
+    NUGET_REGEX,
+    PURL_REGEX,
+    SWH_REGEX,
+    TYPE_TO_PATTERN,
+    TYPE_TO_REGEX,
+)
 from spdx_tools.spdx.validation.uri_validators import validate_url
 from spdx_tools.spdx.validation.validation_message import SpdxElementType, ValidationContext, ValidationMessage
 
-CPE22TYPE_REGEX = r"^c[pP][eE]:/[AHOaho]?(:[A-Za-z0-9._\-~%]*){0,6}$"
-CPE23TYPE_REGEX = (
-    r'^cpe:2\.3:[aho\*\-](:(((\?*|\*?)([a-zA-Z0-9\-\._]|(\\[\\\*\?!"#$$%&\'\(\)\+,\/:;<=>@\[\]\^'
-    r"`\{\|}~]))+(\?*|\*?))|[\*\-])){5}(:(([a-zA-Z]{2,3}(-([a-zA-Z]{2}|[0-9]{3}))?)|[\*\-]))(:(((\?*"
-    r'|\*?)([a-zA-Z0-9\-\._]|(\\[\\\*\?!"#$$%&\'\(\)\+,\/:;<=>@\[\]\^`\{\|}~]))+(\?*|\*?))|[\*\-])){4}$'
-)
-MAVEN_CENTRAL_REGEX = r"^[^:]+:[^:]+(:[^:]+)?$"
-NPM_REGEX = r"^[^@]+@[^@]+$"
-NUGET_REGEX = r"^[^/]+/[^/]+$"
-BOWER_REGEX = r"^[^#]+#[^#]+$"
-PURL_REGEX = r"^pkg:.+(\/.+)?\/.+(@.+)?(\?.+)?(#.+)?$"
-SWH_REGEX = r"^swh:1:(snp|rel|rev|dir|cnt):[0-9a-fA-F]{40}$"
-GITOID_REGEX = r"^gitoid:(blob|tree|commit|tag):(sha1:[0-9a-fA-F]{40}|sha256:[0-9a-fA-F]{64})$"
-
-TYPE_TO_REGEX: Dict[str, str] = {
-    "cpe22Type": CPE22TYPE_REGEX,
-    "cpe23Type": CPE23TYPE_REGEX,
-    "maven-central": MAVEN_CENTRAL_REGEX,
-    "npm": NPM_REGEX,
-    "nuget": NUGET_REGEX,
-    "bower": BOWER_REGEX,
-    "purl": PURL_REGEX,
-    "swh": SWH_REGEX,
-    "gitoid": GITOID_REGEX,
-}
-
 
 def validate_external_package_refs(
     external_package_refs: List[ExternalPackageRef], parent_id: str, spdx_version: str
@@ -108,12 +93,12 @@ def validate_external_package_ref(
 def validate_against_regex(
     string_to_validate: str, reference_type: str, context: ValidationContext
 ) -> List[ValidationMessage]:
-    regex = TYPE_TO_REGEX[reference_type]
-    if not re.match(regex, string_to_validate):
+    pattern = TYPE_TO_PATTERN[reference_type]
+    if not pattern.match(string_to_validate):
         return [
             ValidationMessage(
-                f'externalPackageRef locator of type "{reference_type}" must conform with the regex {regex}, '
-                f"but is: {string_to_validate}",
+                f'externalPackageRef locator of type "{reference_type}" must conform with the regex '
+                f"{pattern.pattern}, but is: {string_to_validate}",
                 context,
             )
         ]
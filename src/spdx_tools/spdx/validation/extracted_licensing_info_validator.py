@@ -2,11 +2,10 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-import re
-
 from beartype.typing import List, Optional
 
 from spdx_tools.spdx.model import ExtractedLicensingInfo
+from spdx_tools.spdx.validation.regex_patterns import LICENSE_REF_ID_PATTERN
 from spdx_tools.spdx.validation.uri_validators import validate_url
 from spdx_tools.spdx.validation.validation_message import SpdxElementType, ValidationContext, ValidationMessage
 
@@ -28,7 +27,7 @@ def validate_extracted_licensing_info(extracted_licensing_infos: ExtractedLicens
     )
 
     license_id: str = extracted_licensing_infos.license_id
-    if license_id and not re.match(r"^LicenseRef-[\da-zA-Z.-]+$", license_id):
+    if license_id and not LICENSE_REF_ID_PATTERN.match(license_id):
         validation_messages.append(
             ValidationMessage(
                 f'license_id must only contain letters, numbers, "." and "-" and must begin with "LicenseRef-", '
@@ -0,0 +1,166 @@
+# SPDX-FileCopyrightText: 2023 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+from beartype.typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from spdx_tools.spdx.model import Document
+from spdx_tools.spdx.validation.annotation_validator import validate_annotation
+from spdx_tools.spdx.validation.creation_info_validator import validate_creation_info
+from spdx_tools.spdx.validation.document_index import DocumentIndex, build_document_index
+from spdx_tools.spdx.validation.document_validator import (
+    validate_describes_relationships,
+    validate_document_spdx_version,
+    validate_unique_spdx_ids,
+)
+from spdx_tools.spdx.validation.extracted_licensing_info_validator import validate_extracted_licensing_info
+from spdx_tools.spdx.validation.file_validator import validate_file_within_document
+from spdx_tools.spdx.validation.package_validator import validate_package_within_document
+from spdx_tools.spdx.validation.relationship_validator import validate_relationship
+from spdx_tools.spdx.validation.snippet_validator import validate_snippet_within_document
+from spdx_tools.spdx.validation.validation_message import ValidationMessage
+
+# the element lists whose messages are cached, in the order in which validate_full_spdx_document() reports them,
+# together with the spdx ids each element refers to: an element is validated again when one of these ids is added to
+# or removed from the document, or changes its type or its relationships
+CACHED_ELEMENT_LISTS: List[Tuple[str, Callable[[Any], Iterable[Any]]]] = [
+    ("packages", lambda package: [package.spdx_id]),
+    ("files", lambda file: []),
+    ("snippets", lambda snippet: [snippet.file_spdx_id]),
+    ("annotations", lambda annotation: [annotation.spdx_id]),
+    ("relationships", lambda relationship: [relationship.spdx_element_id, relationship.related_spdx_element_id]),
+]
+
+
+class IncrementalValidator:
+    """
+    Validates a document repeatedly while it is being edited, and only validates those elements again whose messages
+    might have changed since the last run. Elements that are modified in place have to be reported with mark_dirty();
+    elements that are added to, removed from or replaced in the lists of the document are detected automatically. The
+    creation info, the extracted licensing infos and the checks that span the whole document, which use relationship
+    and document indices that are built anew, are validated on every run.
+    validate() returns the same messages, in the same order, as validate_full_spdx_document().
+    """
+
+    def __init__(self, document: Document, spdx_version: str = None):
+        self.document = document
+        self.spdx_version = spdx_version
+        # per element list: id of the element -> (element, messages); keeping the element guards against reused ids
+        self._cached_messages: Dict[str, Dict[int, Tuple[Any, List[ValidationMessage]]]] = {
+            element_list_name: {} for element_list_name, _ in CACHED_ELEMENT_LISTS
+        }
+        # the endpoints of the relationships at the time they were validated, as they might be changed in place
+        self._relationship_endpoints: Dict[int, Tuple[Any, Any]] = {}
+        self._dirty_element_ids: Set[int] = set()
+        self._document_index: Optional[DocumentIndex] = None
+        self._validated_spdx_version: Optional[str] = None
+
+    def mark_dirty(self, *elements: Any):
+        self._dirty_element_ids.update(id(element) for element in elements)
+
+    def mark_all_dirty(self):
+        for cached_messages in self._cached_messages.values():
+            cached_messages.clear()
+        self._relationship_endpoints.clear()
+
+    def validate(self) -> List[ValidationMessage]:
+        document = self.document
+        spdx_version = self.spdx_version or document.creation_info.spdx_version
+        version_messages: List[ValidationMessage] = validate_document_spdx_version(document, spdx_version)
+        if version_messages:
+            return version_messages
+        if spdx_version != self._validated_spdx_version:
+            self.mark_all_dirty()
+
+        document_index: DocumentIndex = build_document_index(document)
+        affected_spdx_ids: Set[str] = self._get_affected_spdx_ids(document_index)
+
+        validation_messages: List[ValidationMessage] = validate_creation_info(document.creation_info, spdx_version)
+        validators: Dict[str, Callable[[Any], List[ValidationMessage]]] = {
+            "packages": lambda package: validate_package_within_document(
+                package, spdx_version, document, document_index
+            ),
+            "files": lambda file: validate_file_within_document(file, spdx_version, document, document_index),
+            "snippets": lambda snippet: validate_snippet_within_document(
+                snippet, spdx_version, document, document_index
+            ),
+            "annotations": lambda annotation: validate_annotation(annotation, document, document_index),
+            "relationships": lambda relationship: validate_relationship(
+                relationship, spdx_version, document, document_index
+            ),
+        }
+        for element_list_name, get_referenced_spdx_ids in CACHED_ELEMENT_LISTS:
+            previous_messages = self._cached_messages[element_list_name]
+            current_messages: Dict[int, Tuple[Any, List[ValidationMessage]]] = {}
+            for element in getattr(document, element_list_name):
+                key = id(element)
+                if key not in current_messages:
+                    cached = previous_messages.get(key)
+                    if (
+                        cached is None
+                        or cached[0] is not element
+                        or key in self._dirty_element_ids
+                        or not affected_spdx_ids.isdisjoint(get_referenced_spdx_ids(element))
+                    ):
+                        cached = (element, validators[element_list_name](element))
+                    current_messages[key] = cached
+                validation_messages.extend(current_messages[key][1])
+            self._cached_messages[element_list_name] = current_messages
+
+        for extracted_licensing_info in document.extracted_licensing_info:
+            validation_messages.extend(validate_extracted_licensing_info(extracted_licensing_info))
+        validation_messages.extend(validate_describes_relationships(document, document_index))
+        validation_messages.extend(validate_unique_spdx_ids(document, document_index))
+
+        self._relationship_endpoints = {
+            id(relationship): (relationship.spdx_element_id, relationship.related_spdx_element_id)
+            for relationship in document.relationships
+        }
+        self._dirty_element_ids.clear()
+        self._document_index = document_index
+        self._validated_spdx_version = spdx_version
+        return validation_messages
+
+    def _get_affected_spdx_ids(self, document_index: DocumentIndex) -> Set[str]:
+        """
+        Returns the spdx ids that were added, removed or changed their type since the last run, together with the
+        endpoints of all relationships that changed or refer to such an id. If an id that every license expression or
+        spdx id might refer to has changed, all elements are marked as dirty instead.
+        """
+        previous_index = self._document_index
+        if previous_index is None:
+            return set()
+        if (
+            document_index.document_spdx_id != previous_index.document_spdx_id
+            or document_index.external_document_ref_ids != previous_index.external_document_ref_ids
+            or document_index.extracted_license_ids != previous_index.extracted_license_ids
+        ):
+            self.mark_all_dirty()
+            return set()
+
+        affected_spdx_ids: Set[str] = set(document_index.element_types.keys() ^ previous_index.element_types.keys())
+        affected_spdx_ids.update(
+            spdx_id
+            for spdx_id, element_type in document_index.element_types.items()
+            if previous_index.element_types.get(spdx_id, element_type) is not element_type
+        )
+        if affected_spdx_ids:
+            relationship_index = document_index.relationship_index
+            for spdx_id in list(affected_spdx_ids):
+                for relationship in relationship_index.get_relationships_from(
+                    spdx_id
+                ) + relationship_index.get_relationships_to(spdx_id):
+                    affected_spdx_ids.update([relationship.spdx_element_id, relationship.related_spdx_element_id])
+
+        previous_endpoints = dict(self._relationship_endpoints)
+        cached_relationships = self._cached_messages["relationships"]
+        for relationship in self.document.relationships:
+            key = id(relationship)
+            cached = cached_relationships.get(key)
+            if cached is None or cached[0] is not relationship or key in self._dirty_element_ids:
+                affected_spdx_ids.update([relationship.spdx_element_id, relationship.related_spdx_element_id])
+                affected_spdx_ids.update(previous_endpoints.get(key, ()))
+            previous_endpoints.pop(key, None)
+        for removed_endpoints in previous_endpoints.values():
+            affected_spdx_ids.update(removed_endpoints)
+
+        return affected_spdx_ids
@@ -1,18 +1,25 @@
 # SPDX-FileCopyrightText: 2022 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
+from functools import lru_cache
 
-from beartype.typing import List, Optional, Union
+from beartype.typing import FrozenSet, List, Optional, Tuple, Union
 from license_expression import ExpressionError, ExpressionParseError, LicenseExpression
 
 from spdx_tools.common.spdx_licensing import spdx_licensing
 from spdx_tools.spdx.model import Document, SpdxNoAssertion, SpdxNone
-from spdx_tools.spdx.validation.spdx_id_validators import is_external_doc_ref_present_in_document
+from spdx_tools.spdx.validation.document_index import DocumentIndex
 from spdx_tools.spdx.validation.validation_message import SpdxElementType, ValidationContext, ValidationMessage
 
+# number of distinct combinations of license expression and known license references whose messages are kept
+LICENSE_EXPRESSION_VALIDATION_CACHE_SIZE = 4096
+
 
 def validate_license_expressions(
-    license_expressions: List[Union[LicenseExpression, SpdxNoAssertion, SpdxNone]], document: Document, parent_id: str
+    license_expressions: List[Union[LicenseExpression, SpdxNoAssertion, SpdxNone]],
+    document: Document,
+    parent_id: str,
+    document_index: Optional[DocumentIndex] = None,
 ) -> List[ValidationMessage]:
     context = ValidationContext(
         parent_id=parent_id, element_type=SpdxElementType.LICENSE_EXPRESSION, full_element=license_expressions
@@ -20,7 +27,9 @@ def validate_license_expressions(
     validation_messages = []
 
     for license_expression in license_expressions:
-        validation_messages.extend(validate_license_expression(license_expression, document, parent_id, context))
+        validation_messages.extend(
+            validate_license_expression(license_expression, document, parent_id, context, document_index)
+        )
 
     return validation_messages
 
@@ -30,8 +39,13 @@ def validate_license_expression(
     document: Document,
     parent_id: str,
     context: ValidationContext = None,
+    document_index: Optional[DocumentIndex] = None,
 ) -> List[ValidationMessage]:
-    if license_expression in [SpdxNoAssertion(), SpdxNone(), None]:
+    """
+    Without a document_index, the ids of the extracted licenses and external document references that the expression
+    may refer to are collected from the document for each call, which takes time linear in their number.
+    """
+    if license_expression is None or isinstance(license_expression, (SpdxNoAssertion, SpdxNone)):
         return []
 
     if not context:
@@ -39,58 +53,82 @@ def validate_license_expression(
             parent_id=parent_id, element_type=SpdxElementType.LICENSE_EXPRESSION, full_element=license_expression
         )
 
-    validation_messages = []
-    license_ref_ids: List[str] = [license_ref.license_id for license_ref in document.extracted_licensing_info]
+    extracted_license_ids, external_document_ref_ids = get_license_reference_ids(document, document_index)
+
+    # equal expressions might differ in the order of their arguments, which shows in the messages
+    message_templates = get_license_expression_messages(
+        license_expression, str(license_expression), extracted_license_ids, external_document_ref_ids
+    )
+    return [ValidationMessage(message, context) for message in message_templates]
 
+
+def get_license_reference_ids(
+    document: Document, document_index: Optional[DocumentIndex] = None
+) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """Returns the ids of the extracted licenses and of the external document references of the document."""
+    if document_index is not None:
+        return document_index.extracted_license_ids, document_index.external_document_ref_ids
+    return (
+        frozenset(
+            extracted_licensing_info.license_id for extracted_licensing_info in document.extracted_licensing_info
+        ),
+        frozenset(
+            external_document_ref.document_ref_id
+            for external_document_ref in document.creation_info.external_document_refs
+        ),
+    )
+
+
+@lru_cache(maxsize=LICENSE_EXPRESSION_VALIDATION_CACHE_SIZE)
+def get_license_expression_messages(
+    license_expression: LicenseExpression,
+    license_expression_string: str,
+    extracted_license_ids: FrozenSet[str],
+    external_document_ref_ids: FrozenSet[str],
+) -> Tuple[str, ...]:
+    """
+    Returns the validation messages for the given license expression and its string representation. As these only
+    depend on the license references that are known in the document, they are cached, so that every distinct
+    expression is only validated once.
+    """
+    messages = []
     for non_spdx_token in spdx_licensing.validate(license_expression).invalid_symbols:
         if ":" in non_spdx_token:
             split_token: List[str] = non_spdx_token.split(":")
             if len(split_token) != 2:
-                validation_messages.append(
-                    ValidationMessage(
-                        f"Too many colons in license reference: {non_spdx_token}. "
-                        "A license reference must only contain a single colon to "
-                        "separate an external document reference from the license reference.",
-                        context,
-                    )
+                messages.append(
+                    f"Too many colons in license reference: {non_spdx_token}. "
+                    "A license reference must only contain a single colon to "
+                    "separate an external document reference from the license reference."
                 )
             else:
                 if not split_token[1].startswith("LicenseRef-"):
-                    validation_messages.append(
-                        ValidationMessage(
-                            f'A license reference must start with "LicenseRef-", but is: {split_token[1]} '
-                            f"in external license reference {non_spdx_token}.",
-                            context,
-                        )
+                    messages.append(
+                        f'A license reference must start with "LicenseRef-", but is: {split_token[1]} '
+                        f"in external license reference {non_spdx_token}."
                     )
-                if not is_external_doc_ref_present_in_document(split_token[0], document):
-                    validation_messages.append(
-                        ValidationMessage(
-                            f'Did not find the external document reference "{split_token[0]}" in the SPDX document. '
-                            f"From the external license reference {non_spdx_token}.",
-                            context,
-                        )
+                if split_token[0] not in external_document_ref_ids:
+                    messages.append(
+                        f'Did not find the external document reference "{split_token[0]}" in the SPDX document. '
+                        f"From the external license reference {non_spdx_token}."
                     )
 
-        elif non_spdx_token not in license_ref_ids:
-            validation_messages.append(
-                ValidationMessage(
-                    f"Unrecognized license reference: {non_spdx_token}. license_expression must only use IDs from the "
-                    f"license list or extracted licensing info, but is: {license_expression}",
-                    context,
-                )
+        elif non_spdx_token not in extracted_license_ids:
+            messages.append(
+                f"Unrecognized license reference: {non_spdx_token}. license_expression must only use IDs from the "
+                f"license list or extracted licensing info, but is: {license_expression_string}"
             )
 
     try:
-        spdx_licensing.parse(str(license_expression), validate=True, strict=True)
+        spdx_licensing.parse(license_expression_string, validate=True, strict=True)
     except ExpressionParseError as err:
         # This error is raised when an exception symbol is used as a license symbol and vice versa.
         # So far, it only catches the first such error in the provided string.
-        validation_messages.append(ValidationMessage(f"{err}. for license_expression: {license_expression}", context))
+        messages.append(f"{err}. for license_expression: {license_expression_string}")
     except ExpressionError:
         # This error is raised for invalid symbols within the license_expression, but it provides only a string of
         # these. On the other hand, spdx_licensing.validate() gives an actual list of invalid symbols, so this is
         # handled above.
         pass
 
-    return validation_messages
+    return tuple(messages)
@@ -2,11 +2,10 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-import re
-
 from beartype.typing import List
 
 from spdx_tools.spdx.model import PackageVerificationCode
+from spdx_tools.spdx.validation.regex_patterns import VERIFICATION_CODE_PATTERN
 from spdx_tools.spdx.validation.validation_message import SpdxElementType, ValidationContext, ValidationMessage
 
 
@@ -23,7 +22,7 @@ def validate_verification_code(verification_code: PackageVerificationCode, paren
             )
 
     value: str = verification_code.value
-    if not re.match("^[0-9a-f]{40}$", value):
+    if not VERIFICATION_CODE_PATTERN.match(value):
         validation_messages.append(
             ValidationMessage(
                 f"value of verification_code must consist of 40 lowercase hexadecimal digits, but is: {value} "
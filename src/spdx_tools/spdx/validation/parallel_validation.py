@@ -0,0 +1,119 @@
+# SPDX-FileCopyrightText: 2023 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+import math
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+
+from beartype.typing import Any, Callable, Dict, List, Optional, Tuple
+
+from spdx_tools.spdx.model import Document, RelationshipType
+from spdx_tools.spdx.model.relationship_index import RelationshipIndex
+from spdx_tools.spdx.validation.annotation_validator import validate_annotations
+from spdx_tools.spdx.validation.document_index import DocumentIndex
+from spdx_tools.spdx.validation.file_validator import validate_files
+from spdx_tools.spdx.validation.package_validator import validate_packages
+from spdx_tools.spdx.validation.relationship_validator import validate_relationships
+from spdx_tools.spdx.validation.snippet_validator import validate_snippets
+from spdx_tools.spdx.validation.validation_message import ValidationMessage
+
+# every worker gets several chunks of each element list, so that a chunk with many invalid elements does not leave
+# the other workers idle
+CHUNKS_PER_WORKER = 4
+
+
+@dataclass(frozen=True)
+class ValidationSnapshot:
+    """
+    The part of a document that the validators of its elements look up, which is sent to every worker once instead of
+    the whole document. The document, like the relationship index of the document index, only contains the creation
+    info and the relationships that are needed to check packages with files_analyzed set to False; all other lookups
+    are done in the document index.
+    """
+
+    spdx_version: str
+    document: Document
+    document_index: DocumentIndex
+
+
+ELEMENT_VALIDATORS: Dict[str, Callable[[List[Any], ValidationSnapshot], List[ValidationMessage]]] = {
+    "packages": lambda packages, snapshot: validate_packages(
+        packages, snapshot.spdx_version, snapshot.document, snapshot.document_index
+    ),
+    "files": lambda files, snapshot: validate_files(
+        files, snapshot.spdx_version, snapshot.document, snapshot.document_index
+    ),
+    "snippets": lambda snippets, snapshot: validate_snippets(
+        snippets, snapshot.spdx_version, snapshot.document, snapshot.document_index
+    ),
+    "annotations": lambda annotations, snapshot: validate_annotations(
+        annotations, snapshot.document, snapshot.document_index
+    ),
+    "relationships": lambda relationships, snapshot: validate_relationships(
+        relationships, snapshot.spdx_version, snapshot.document, snapshot.document_index
+    ),
+}
+
+_worker_snapshot: Optional[ValidationSnapshot] = None
+
+
+def build_validation_snapshot(
+    document: Document, spdx_version: str, document_index: DocumentIndex
+) -> ValidationSnapshot:
+    unanalyzed_package_ids = {package.spdx_id for package in document.packages if not package.files_analyzed}
+    relationships = [
+        relationship
+        for relationship in document.relationships
+        if (
+            relationship.relationship_type == RelationshipType.CONTAINS
+            and relationship.spdx_element_id in unanalyzed_package_ids
+        )
+        or (
+            relationship.relationship_type == RelationshipType.CONTAINED_BY
+            and relationship.related_spdx_element_id in unanalyzed_package_ids
+        )
+    ]
+    return ValidationSnapshot(
+        spdx_version=spdx_version,
+        document=Document(creation_info=document.creation_info, relationships=relationships),
+        document_index=replace(document_index, relationship_index=RelationshipIndex(relationships)),
+    )
+
+
+def validate_elements_in_parallel(
+    document: Document, spdx_version: str, document_index: DocumentIndex, workers: int
+) -> List[ValidationMessage]:
+    """
+    Validates the packages, files, snippets, annotations and relationships of the document in a pool of worker
+    processes. The element lists are split into chunks whose messages are merged in the order of the elements, so the
+    result equals that of validating the lists one after another.
+    """
+    chunks: List[Tuple[str, List[Any]]] = []
+    for element_list_name, elements in [
+        ("packages", document.packages),
+        ("files", document.files),
+        ("snippets", document.snippets),
+        ("annotations", document.annotations),
+        ("relationships", document.relationships),
+    ]:
+        chunk_size = max(1, math.ceil(len(elements) / (workers * CHUNKS_PER_WORKER)))
+        for start in range(0, len(elements), chunk_size):
+            chunks.append((element_list_name, elements[start : start + chunk_size]))
+
+    snapshot = build_validation_snapshot(document, spdx_version, document_index)
+    validation_messages: List[ValidationMessage] = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_initialize_worker, initargs=(snapshot,)) as executor:
+        for chunk_messages in executor.map(_validate_chunk, chunks):
+            validation_messages.extend(chunk_messages)
+
+    return validation_messages
+
+
+def _initialize_worker(snapshot: ValidationSnapshot):
+    global _worker_snapshot
+    _worker_snapshot = snapshot
+
+
+def _validate_chunk(chunk: Tuple[str, List[Any]]) -> List[ValidationMessage]:
+    element_list_name, elements = chunk
+    return ELEMENT_VALIDATORS[element_list_name](elements, _worker_snapshot)
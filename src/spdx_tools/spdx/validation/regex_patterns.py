@@ -0,0 +1,85 @@
+# SPDX-FileCopyrightText: 2023 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+import re
+
+from beartype.typing import Dict, Pattern
+
+from spdx_tools.spdx.model import ChecksumAlgorithm
+
+# All regular expressions of the validators are compiled once on import, so that validating a value does not have to
+# build them or look them up in the cache of the re module again.
+SPDX_ID_PATTERN: Pattern = re.compile(r"^SPDXRef-[\da-zA-Z.-]+$")
+EXTERNAL_DOCUMENT_REF_ID_PATTERN: Pattern = re.compile(r"^DocumentRef-[\da-zA-Z.+-]+$")
+LICENSE_REF_ID_PATTERN: Pattern = re.compile(r"^LicenseRef-[\da-zA-Z.-]+$")
+VERIFICATION_CODE_PATTERN: Pattern = re.compile(r"^[0-9a-f]{40}$")
+
+# in hexadecimal digits
+algorithm_length: Dict = {
+    ChecksumAlgorithm.SHA1: "40",
+    ChecksumAlgorithm.SHA224: "56",
+    ChecksumAlgorithm.SHA256: "64",
+    ChecksumAlgorithm.SHA384: "96",
+    ChecksumAlgorithm.SHA512: "128",
+    ChecksumAlgorithm.SHA3_256: "64",
+    ChecksumAlgorithm.SHA3_384: "96",
+    ChecksumAlgorithm.SHA3_512: "128",
+    ChecksumAlgorithm.BLAKE2B_256: "64",
+    ChecksumAlgorithm.BLAKE2B_384: "96",
+    ChecksumAlgorithm.BLAKE2B_512: "128",
+    ChecksumAlgorithm.BLAKE3: "256,",  # at least 256 bits
+    ChecksumAlgorithm.MD2: "32",
+    ChecksumAlgorithm.MD4: "32",
+    ChecksumAlgorithm.MD5: "32",
+    ChecksumAlgorithm.MD6: "0,512",  # between 0 and 512 bits
+    ChecksumAlgorithm.ADLER32: "8",
+}
+
+CHECKSUM_PATTERNS: Dict[ChecksumAlgorithm, Pattern] = {
+    algorithm: re.compile("^[0-9a-f]{" + length + "}$") for algorithm, length in algorithm_length.items()
+}
+
+CPE22TYPE_REGEX = r"^c[pP][eE]:/[AHOaho]?(:[A-Za-z0-9._\-~%]*){0,6}$"
+CPE23TYPE_REGEX = (
+    r'^cpe:2\.3:[aho\*\-](:(((\?*|\*?)([a-zA-Z0-9\-\._]|(\\[\\\*\?!"#$$%&\'\(\)\+,\/:;<=>@\[\]\^'
+    r"`\{\|}~]))+(\?*|\*?))|[\*\-])){5}(:(([a-zA-Z]{2,3}(-([a-zA-Z]{2}|[0-9]{3}))?)|[\*\-]))(:(((\?*"
+    r'|\*?)([a-zA-Z0-9\-\._]|(\\[\\\*\?!"#$$%&\'\(\)\+,\/:;<=>@\[\]\^`\{\|}~]))+(\?*|\*?))|[\*\-])){4}$'
+)
+MAVEN_CENTRAL_REGEX = r"^[^:]+:[^:]+(:[^:]+)?$"
+NPM_REGEX = r"^[^@]+@[^@]+$"
+NUGET_REGEX = r"^[^/]+/[^/]+$"
+BOWER_REGEX = r"^[^#]+#[^#]+$"
+PURL_REGEX = r"^pkg:.+(\/.+)?\/.+(@.+)?(\?.+)?(#.+)?$"
+SWH_REGEX = r"^swh:1:(snp|rel|rev|dir|cnt):[0-9a-fA-F]{40}$"
+GITOID_REGEX = r"^gitoid:(blob|tree|commit|tag):(sha1:[0-9a-fA-F]{40}|sha256:[0-9a-fA-F]{64})$"
+
+TYPE_TO_REGEX: Dict[str, str] = {
+    "cpe22Type": CPE22TYPE_REGEX,
+    "cpe23Type": CPE23TYPE_REGEX,
+    "maven-central": MAVEN_CENTRAL_REGEX,
+    "npm": NPM_REGEX,
+    "nuget": NUGET_REGEX,
+    "bower": BOWER_REGEX,
+    "purl": PURL_REGEX,
+    "swh": SWH_REGEX,
+    "gitoid": GITOID_REGEX,
+}
+
+TYPE_TO_PATTERN: Dict[str, Pattern] = {
+    reference_type: re.compile(regex) for reference_type, regex in TYPE_TO_REGEX.items()
+}
+
+url_pattern = (
+    "(http:\\/\\/www\\.|https:\\/\\/www\\.|http:\\/\\/|https:\\/\\/|ssh:\\/\\/|git:\\/\\/|svn:\\/\\/|sftp:"
+    "\\/\\/|ftp:\\/\\/)?([\\w\\-.!~*'()%;:&=+$,]+@)?[a-z0-9]+([\\-\\.]{1}[a-z0-9]+){0,100}\\.[a-z]{2,5}"
+    "(:[0-9]{1,5})?(\\/.*)?"
+)
+URL_PATTERN: Pattern = re.compile(url_pattern, re.IGNORECASE)
+
+supported_download_repos: str = "(git|hg|svn|bzr)"
+git_pattern = "(git\\+git@[a-zA-Z0-9\\.\\-]+:[a-zA-Z0-9/\\\\.@\\-]+)"
+bazaar_pattern = "(bzr\\+lp:[a-zA-Z0-9\\.\\-]+)"
+download_location_pattern = (
+    "^(((" + supported_download_repos + "\\+)?" + url_pattern + ")|" + git_pattern + "|" + bazaar_pattern + ")$"
+)
+DOWNLOAD_LOCATION_PATTERN: Pattern = re.compile(download_location_pattern, re.IGNORECASE)
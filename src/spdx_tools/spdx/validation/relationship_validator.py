@@ -2,37 +2,47 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-from beartype.typing import List
+from beartype.typing import List, Optional
 
 from spdx_tools.spdx.model import Document, Relationship, RelationshipType, SpdxNoAssertion, SpdxNone
+from spdx_tools.spdx.validation.document_index import DocumentIndex, build_document_index
 from spdx_tools.spdx.validation.spdx_id_validators import validate_spdx_id
 from spdx_tools.spdx.validation.validation_message import SpdxElementType, ValidationContext, ValidationMessage
 
 
 def validate_relationships(
-    relationships: List[Relationship], spdx_version: str, document: Document
+    relationships: List[Relationship],
+    spdx_version: str,
+    document: Document,
+    document_index: Optional[DocumentIndex] = None,
 ) -> List[ValidationMessage]:
     validation_messages = []
+    if document_index is None:
+        document_index = build_document_index(document)
     for relationship in relationships:
-        validation_messages.extend(validate_relationship(relationship, spdx_version, document))
+        validation_messages.extend(validate_relationship(relationship, spdx_version, document, document_index))
 
     return validation_messages
 
 
 def validate_relationship(
-    relationship: Relationship, spdx_version: str, document: Document
+    relationship: Relationship, spdx_version: str, document: Document, document_index: Optional[DocumentIndex] = None
 ) -> List[ValidationMessage]:
     validation_messages = []
     context = ValidationContext(element_type=SpdxElementType.RELATIONSHIP, full_element=relationship)
 
     relationship_type: RelationshipType = relationship.relationship_type
 
-    messages: List[str] = validate_spdx_id(relationship.spdx_element_id, document, check_document=True)
+    messages: List[str] = validate_spdx_id(
+        relationship.spdx_element_id, document, check_document=True, document_index=document_index
+    )
     for message in messages:
         validation_messages.append(ValidationMessage(message, context))
 
     if relationship.related_spdx_element_id not in [SpdxNone(), SpdxNoAssertion()]:
-        messages: List[str] = validate_spdx_id(relationship.related_spdx_element_id, document, check_document=True)
+        messages: List[str] = validate_spdx_id(
+            relationship.related_spdx_element_id, document, check_document=True, document_index=document_index
+        )
         for message in messages:
             validation_messages.append(ValidationMessage(message, context))
 
@@ -2,20 +2,20 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-import re
-
-from beartype.typing import List
+from beartype.typing import List, Optional
 
 from spdx_tools.spdx.document_utils import get_contained_spdx_element_ids
 from spdx_tools.spdx.model import Document, File
+from spdx_tools.spdx.validation.document_index import DocumentIndex
+from spdx_tools.spdx.validation.regex_patterns import EXTERNAL_DOCUMENT_REF_ID_PATTERN, SPDX_ID_PATTERN
 
 
 def is_valid_internal_spdx_id(spdx_id: str) -> bool:
-    return bool(re.match(r"^SPDXRef-[\da-zA-Z.-]+$", spdx_id))
+    return bool(SPDX_ID_PATTERN.match(spdx_id))
 
 
 def is_valid_external_doc_ref_id(external_ref_id: str) -> bool:
-    return bool(re.match(r"^DocumentRef-[\da-zA-Z.+-]+$", external_ref_id))
+    return bool(EXTERNAL_DOCUMENT_REF_ID_PATTERN.match(external_ref_id))
 
 
 def is_spdx_id_present_in_files(spdx_id: str, files: List[File]) -> bool:
@@ -44,11 +44,17 @@ def is_external_doc_ref_present_in_document(external_ref_id: str, document: Docu
 
 
 def validate_spdx_id(
-    spdx_id: str, document: Document, check_document: bool = False, check_files: bool = False
+    spdx_id: str,
+    document: Document,
+    check_document: bool = False,
+    check_files: bool = False,
+    document_index: Optional[DocumentIndex] = None,
 ) -> List[str]:
     """Test that the given spdx_id (and a potential DocumentRef to an external document) is valid
     and, if it is a reference, actually exists in the document. Optionally checks files or the whole document
-    for the existence of the spdx_id (i.e. if it is used as a reference). Returns a list of validation messages."""
+    for the existence of the spdx_id (i.e. if it is used as a reference). Returns a list of validation messages.
+    Without a document_index, the ids are collected from the document for each call, which takes time linear in the
+    size of the document; pass an index built once per document (see build_document_index()) to validate many ids."""
 
     validation_messages: List[str] = []
     split_id: List[str] = spdx_id.split(":")
@@ -72,7 +78,11 @@ def validate_spdx_id(
                 f'the internal SPDX id part of spdx_id must only contain letters, numbers, "." and "-" and must begin '
                 f'with "SPDXRef-", but is: {split_id[1]}'
             )
-        if not is_external_doc_ref_present_in_document(split_id[0], document):
+        if document_index is None:
+            external_document_ref_is_present = is_external_doc_ref_present_in_document(split_id[0], document)
+        else:
+            external_document_ref_is_present = split_id[0] in document_index.external_document_ref_ids
+        if not external_document_ref_is_present:
             validation_messages.append(
                 f'did not find the external document reference "{split_id[0]}" in the SPDX document'
             )
@@ -87,11 +97,19 @@ def validate_spdx_id(
         )
 
     if check_document:
-        if not is_spdx_id_present_in_document(spdx_id, document):
+        if document_index is None:
+            spdx_id_is_present = is_spdx_id_present_in_document(spdx_id, document)
+        else:
+            spdx_id_is_present = spdx_id in document_index.spdx_ids
+        if not spdx_id_is_present:
             validation_messages.append(f'did not find the referenced spdx_id "{spdx_id}" in the SPDX document')
 
     if check_files:
-        if not is_spdx_id_present_in_files(spdx_id, document.files):
+        if document_index is None:
+            spdx_id_is_present_in_files = is_spdx_id_present_in_files(spdx_id, document.files)
+        else:
+            spdx_id_is_present_in_files = spdx_id in document_index.file_spdx_ids
+        if not spdx_id_is_present_in_files:
             validation_messages.append(
                 f'did not find the referenced spdx_id "{spdx_id}" in the SPDX document\'s files'
             )
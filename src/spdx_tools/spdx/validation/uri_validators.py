@@ -2,36 +2,33 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-import re
-
 from beartype.typing import List
 from uritools import isabsuri, urisplit
 
-url_pattern = (
-    "(http:\\/\\/www\\.|https:\\/\\/www\\.|http:\\/\\/|https:\\/\\/|ssh:\\/\\/|git:\\/\\/|svn:\\/\\/|sftp:"
-    "\\/\\/|ftp:\\/\\/)?([\\w\\-.!~*'()%;:&=+$,]+@)?[a-z0-9]+([\\-\\.]{1}[a-z0-9]+){0,100}\\.[a-z]{2,5}"
-    "(:[0-9]{1,5})?(\\/.*)?"
+from spdx_tools.spdx.validation.regex_patterns import (  # noqa: F401, the patterns are kept importable from here
+    DOWNLOAD_LOCATION_PATTERN,
+    URL_PATTERN,
+    bazaar_pattern,
+    download_location_pattern,
+    git_pattern,
+    supported_download_repos,
+    url_pattern,
 )
-url_pattern_ignore_case = re.compile(url_pattern, re.IGNORECASE)
 
-supported_download_repos: str = "(git|hg|svn|bzr)"
-git_pattern = "(git\\+git@[a-zA-Z0-9\\.\\-]+:[a-zA-Z0-9/\\\\.@\\-]+)"
-bazaar_pattern = "(bzr\\+lp:[a-zA-Z0-9\\.\\-]+)"
-download_location_pattern = (
-    "^(((" + supported_download_repos + "\\+)?" + url_pattern + ")|" + git_pattern + "|" + bazaar_pattern + ")$"
-)
-compiled_pattern = re.compile(download_location_pattern, re.IGNORECASE)
+# the former names of the compiled patterns
+url_pattern_ignore_case = URL_PATTERN
+compiled_pattern = DOWNLOAD_LOCATION_PATTERN
 
 
 def validate_url(url: str) -> List[str]:
-    if not url_pattern_ignore_case.match(url):
+    if not URL_PATTERN.match(url):
         return [f"must be a valid URL, but is: {url}"]
 
     return []
 
 
 def validate_download_location(location: str) -> List[str]:
-    if not (validate_url(location) == [] or compiled_pattern.match(location)):
+    if not (validate_url(location) == [] or DOWNLOAD_LOCATION_PATTERN.match(location)):
         return [f"must be a valid URL or download location according to the specification, but is: {location}"]
 
     return []
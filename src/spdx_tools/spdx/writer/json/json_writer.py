@@ -3,12 +3,15 @@
 # SPDX-License-Identifier: Apache-2.0
 import json
 
-from beartype.typing import IO
+from beartype.typing import IO, Any, Iterator, Optional, Tuple
 
+from spdx_tools.common.json_backend import JsonBackend, get_json_backend
 from spdx_tools.spdx.jsonschema.document_converter import DocumentConverter
 from spdx_tools.spdx.model import Document
 from spdx_tools.spdx.writer.write_utils import convert, validate_and_deduplicate
 
+INDENT = " " * 4
+
 
 def write_document_to_stream(
     document: Document,
@@ -16,15 +19,53 @@ def write_document_to_stream(
     validate: bool = True,
     converter: DocumentConverter = None,
     drop_duplicates: bool = True,
+    streaming: bool = False,
+    json_backend: Optional[str] = None,
 ):
     """
     Serializes the provided document to json and writes it to a file with the provided name. Unless validate is set
     to False, validates the document before serialization. Unless a DocumentConverter instance is provided,
-    a new one is created.
+    a new one is created. If streaming is set, packages, files, snippets and relationships are converted and written
+    one at a time instead of converting the whole document first; the output is the same. The json is encoded by the
+    given JSON backend, by default the standard library's json module, all of them produce the same output.
     """
     document = validate_and_deduplicate(document, validate, drop_duplicates)
+    backend: JsonBackend = get_json_backend(json_backend)
+    if streaming:
+        converter = converter or DocumentConverter()
+        write_json_properties(converter.iter_converted_properties(document), stream, backend)
+        return
     document_dict = convert(document, converter)
-    json.dump(document_dict, stream, indent=4)
+    stream.write(backend.dumps(document_dict))
+
+
+def write_json_properties(
+    json_properties: Iterator[Tuple[str, Any]], stream: IO[str], backend: Optional[JsonBackend] = None
+):
+    """
+    Writes the given (name, value) pairs as a json object, formatted exactly like json.dump(..., indent=4) would.
+    Values that are iterators are written as arrays item by item.
+    """
+    backend = backend or get_json_backend()
+    object_separator = "{"
+    for property_name, property_value in json_properties:
+        stream.write(f"{object_separator}\n{INDENT}{json.dumps(property_name)}: ")
+        object_separator = ","
+        if not isinstance(property_value, Iterator):
+            stream.write(indent_json(backend.dumps(property_value), 1))
+            continue
+
+        array_separator = "["
+        for item in property_value:
+            stream.write(f"{array_separator}\n{INDENT * 2}{indent_json(backend.dumps(item), 2)}")
+            array_separator = ","
+        stream.write("[]" if array_separator == "[" else f"\n{INDENT}]")
+    stream.write("{}" if object_separator == "{" else "\n}")
+
+
+def indent_json(json_str: str, level: int) -> str:
+    # line breaks within json strings are escaped, so all line breaks belong to the indentation
+    return json_str.replace("\n", "\n" + INDENT * level)
 
 
 def write_document_to_file(
@@ -33,6 +74,8 @@ def write_document_to_file(
     validate: bool = True,
     converter: DocumentConverter = None,
     drop_duplicates: bool = True,
+    streaming: bool = False,
+    json_backend: Optional[str] = None,
 ):
     with open(file_name, "w", encoding="utf-8") as out:
-        write_document_to_stream(document, out, validate, converter, drop_duplicates)
+        write_document_to_stream(document, out, validate, converter, drop_duplicates, streaming, json_backend)
@@ -2,13 +2,13 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 from beartype.typing import Dict
-from rdflib import RDF, RDFS, BNode, Graph, Literal, URIRef
+from rdflib import RDF, RDFS, Graph, Literal, URIRef
 
 from spdx_tools.spdx.casing_tools import snake_case_to_camel_case
 from spdx_tools.spdx.datetime_conversions import datetime_to_iso_string
 from spdx_tools.spdx.model import Annotation
 from spdx_tools.spdx.rdfschema.namespace import SPDX_NAMESPACE
-from spdx_tools.spdx.writer.rdf.writer_utils import add_namespace_to_spdx_id
+from spdx_tools.spdx.writer.rdf.writer_utils import add_namespace_to_spdx_id, create_stable_bnode
 
 
 def add_annotation_to_graph(
@@ -17,7 +17,15 @@ def add_annotation_to_graph(
     annotation_resource = URIRef(
         add_namespace_to_spdx_id(annotation.spdx_id, doc_namespace, external_doc_ref_to_namespace)
     )
-    annotation_node = BNode()
+    annotation_node = create_stable_bnode(
+        graph,
+        annotation_resource,
+        SPDX_NAMESPACE.annotation,
+        annotation.annotation_type.name,
+        annotation.annotator.to_serialized_string(),
+        datetime_to_iso_string(annotation.annotation_date),
+        annotation.annotation_comment,
+    )
     graph.add((annotation_node, RDF.type, SPDX_NAMESPACE.Annotation))
     graph.add(
         (
@@ -1,14 +1,17 @@
 # SPDX-FileCopyrightText: 2023 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-from rdflib import RDF, BNode, Graph, Literal, URIRef
+from rdflib import RDF, Graph, Literal, URIRef
 
 from spdx_tools.spdx.model import Checksum, ChecksumAlgorithm
 from spdx_tools.spdx.rdfschema.namespace import SPDX_NAMESPACE
+from spdx_tools.spdx.writer.rdf.writer_utils import create_stable_bnode
 
 
 def add_checksum_to_graph(checksum: Checksum, graph: Graph, parent: URIRef):
-    checksum_node = BNode()
+    checksum_node = create_stable_bnode(
+        graph, parent, SPDX_NAMESPACE.checksum, checksum.algorithm.name, checksum.value
+    )
     graph.add((checksum_node, RDF.type, SPDX_NAMESPACE.Checksum))
     graph.add((checksum_node, SPDX_NAMESPACE.algorithm, algorithm_to_rdf_string(checksum.algorithm)))
     graph.add((checksum_node, SPDX_NAMESPACE.checksumValue, Literal(checksum.value)))
@@ -1,13 +1,13 @@
 # SPDX-FileCopyrightText: 2023 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-from rdflib import RDF, RDFS, BNode, Graph, Literal, URIRef
+from rdflib import RDF, RDFS, Graph, Literal, URIRef
 
 from spdx_tools.spdx.datetime_conversions import datetime_to_iso_string
 from spdx_tools.spdx.model import CreationInfo
 from spdx_tools.spdx.rdfschema.namespace import LICENSE_NAMESPACE, SPDX_NAMESPACE
 from spdx_tools.spdx.writer.rdf.external_document_ref_writer import add_external_document_ref_to_graph
-from spdx_tools.spdx.writer.rdf.writer_utils import add_optional_literal
+from spdx_tools.spdx.writer.rdf.writer_utils import add_optional_literal, create_stable_bnode
 
 
 def add_creation_info_to_graph(creation_info: CreationInfo, graph: Graph):
@@ -18,7 +18,7 @@ def add_creation_info_to_graph(creation_info: CreationInfo, graph: Graph):
     graph.add((doc_node, SPDX_NAMESPACE.name, Literal(creation_info.name)))
     add_optional_literal(creation_info.document_comment, graph, doc_node, RDFS.comment)
 
-    creation_info_node = BNode()
+    creation_info_node = create_stable_bnode(graph, doc_node, SPDX_NAMESPACE.creationInfo)
     graph.add((creation_info_node, RDF.type, SPDX_NAMESPACE.CreationInfo))
 
     graph.add((creation_info_node, SPDX_NAMESPACE.created, Literal(datetime_to_iso_string(creation_info.created))))
@@ -1,11 +1,15 @@
 # SPDX-FileCopyrightText: 2023 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-from rdflib import RDF, RDFS, BNode, Graph, Literal, URIRef
+from rdflib import RDF, RDFS, Graph, Literal, URIRef
 
 from spdx_tools.spdx.model import ExtractedLicensingInfo
 from spdx_tools.spdx.rdfschema.namespace import SPDX_NAMESPACE
-from spdx_tools.spdx.writer.rdf.writer_utils import add_literal_or_no_assertion, add_optional_literal
+from spdx_tools.spdx.writer.rdf.writer_utils import (
+    add_literal_or_no_assertion,
+    add_optional_literal,
+    create_stable_bnode,
+)
 
 
 def add_extracted_licensing_info_to_graph(
@@ -15,7 +19,13 @@ def add_extracted_licensing_info_to_graph(
         extracted_licensing_info_resource = URIRef(f"{doc_namespace}#{extracted_licensing_info.license_id}")
         graph.add((extracted_licensing_info_resource, RDF.type, SPDX_NAMESPACE.ExtractedLicensingInfo))
     else:
-        extracted_licensing_info_resource = BNode()
+        extracted_licensing_info_resource = create_stable_bnode(
+            graph,
+            doc_node,
+            SPDX_NAMESPACE.hasExtractedLicensingInfo,
+            extracted_licensing_info.license_name,
+            extracted_licensing_info.extracted_text,
+        )
     add_optional_literal(
         extracted_licensing_info.license_id, graph, extracted_licensing_info_resource, SPDX_NAMESPACE.licenseId
     )
@@ -4,12 +4,13 @@
 from beartype.typing import List, Union
 from boolean import Expression
 from license_expression import AND, OR, ExpressionInfo, LicenseExpression, LicenseSymbol, LicenseWithExceptionSymbol
-from rdflib import RDF, BNode, Graph, URIRef
+from rdflib import RDF, Graph, URIRef
 from rdflib.term import Literal, Node
 
 from spdx_tools.common.spdx_licensing import spdx_licensing
 from spdx_tools.spdx.model import SpdxNoAssertion, SpdxNone
 from spdx_tools.spdx.rdfschema.namespace import LICENSE_NAMESPACE, SPDX_NAMESPACE
+from spdx_tools.spdx.writer.rdf.writer_utils import create_stable_bnode
 
 
 def add_license_expression_or_none_or_no_assertion(
@@ -38,19 +39,19 @@ def add_license_expression_to_graph(
     license_expression: Expression, graph: Graph, parent: Node, predicate: Node, doc_namespace: str
 ):
     if isinstance(license_expression, AND):
-        member_node = BNode()
+        member_node = create_stable_bnode(graph, parent, predicate, license_expression)
         graph.add((member_node, RDF.type, SPDX_NAMESPACE.ConjunctiveLicenseSet))
         graph.add((parent, predicate, member_node))
         for arg in license_expression.args:
             add_license_expression_to_graph(arg, graph, member_node, SPDX_NAMESPACE.member, doc_namespace)
     if isinstance(license_expression, OR):
-        member_node = BNode()
+        member_node = create_stable_bnode(graph, parent, predicate, license_expression)
         graph.add((member_node, RDF.type, SPDX_NAMESPACE.DisjunctiveLicenseSet))
         graph.add((parent, predicate, member_node))
         for arg in license_expression.args:
             add_license_expression_to_graph(arg, graph, member_node, SPDX_NAMESPACE.member, doc_namespace)
     if isinstance(license_expression, LicenseWithExceptionSymbol):
-        member_node = BNode()
+        member_node = create_stable_bnode(graph, parent, predicate, license_expression)
         graph.add((member_node, RDF.type, SPDX_NAMESPACE.WithExceptionOperator))
         graph.add((parent, predicate, member_node))
 
@@ -77,7 +78,7 @@ def add_license_exception_to_graph(license_exception: LicenseSymbol, graph: Grap
         exception_node = LICENSE_NAMESPACE[str(license_exception)]
         graph.add((parent, SPDX_NAMESPACE.licenseException, exception_node))
     else:
-        exception_node = BNode()
+        exception_node = create_stable_bnode(graph, parent, SPDX_NAMESPACE.licenseException, license_exception)
         graph.add((exception_node, SPDX_NAMESPACE.licenseExceptionId, Literal(license_exception)))
         graph.add((parent, SPDX_NAMESPACE.licenseException, exception_node))
 
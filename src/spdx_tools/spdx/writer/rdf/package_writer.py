@@ -2,7 +2,7 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 from beartype.typing import Dict
-from rdflib import DOAP, RDF, RDFS, XSD, BNode, Graph, Literal, URIRef
+from rdflib import DOAP, RDF, RDFS, XSD, Graph, Literal, URIRef
 
 from spdx_tools.spdx.casing_tools import snake_case_to_camel_case
 from spdx_tools.spdx.model import ExternalPackageRef, Package, PackageVerificationCode
@@ -15,6 +15,7 @@ from spdx_tools.spdx.writer.rdf.writer_utils import (
     add_literal_or_no_assertion_or_none,
     add_namespace_to_spdx_id,
     add_optional_literal,
+    create_stable_bnode,
 )
 
 
@@ -76,7 +77,7 @@ def add_package_verification_code_to_graph(
 ):
     if not package_verification_code:
         return
-    package_verification_code_node = BNode()
+    package_verification_code_node = create_stable_bnode(graph, package_node, SPDX_NAMESPACE.packageVerificationCode)
     graph.add((package_verification_code_node, RDF.type, SPDX_NAMESPACE.PackageVerificationCode))
     graph.add(
         (
@@ -100,7 +101,14 @@ def add_package_verification_code_to_graph(
 def add_external_package_ref_to_graph(
     external_package_ref: ExternalPackageRef, graph: Graph, package_node: URIRef, doc_namespace: str
 ):
-    external_package_ref_node = BNode()
+    external_package_ref_node = create_stable_bnode(
+        graph,
+        package_node,
+        SPDX_NAMESPACE.externalRef,
+        external_package_ref.category.name,
+        external_package_ref.reference_type,
+        external_package_ref.locator,
+    )
     graph.add((external_package_ref_node, RDF.type, SPDX_NAMESPACE.ExternalRef))
     graph.add(
         (
@@ -1,7 +1,7 @@
 # SPDX-FileCopyrightText: 2023 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-from beartype.typing import IO, Dict
+from beartype.typing import IO, Any, Callable, Dict
 from rdflib import DOAP, Graph
 from rdflib.compare import to_isomorphic
 
@@ -12,47 +12,94 @@ from spdx_tools.spdx.writer.rdf.creation_info_writer import add_creation_info_to
 from spdx_tools.spdx.writer.rdf.extracted_licensing_info_writer import add_extracted_licensing_info_to_graph
 from spdx_tools.spdx.writer.rdf.file_writer import add_file_to_graph
 from spdx_tools.spdx.writer.rdf.package_writer import add_package_to_graph
+from spdx_tools.spdx.writer.rdf.rdf_xml_emitter import RdfXmlEmitter
 from spdx_tools.spdx.writer.rdf.relationship_writer import add_relationship_to_graph
 from spdx_tools.spdx.writer.rdf.snippet_writer import add_snippet_to_graph
 from spdx_tools.spdx.writer.write_utils import validate_and_deduplicate
 
 
 def write_document_to_stream(
-    document: Document, stream: IO[bytes], validate: bool = True, drop_duplicates: bool = True
+    document: Document,
+    stream: IO[bytes],
+    validate: bool = True,
+    drop_duplicates: bool = True,
+    canonical: bool = False,
+    streaming: bool = False,
 ):
+    """
+    The blank nodes are given ids that are derived from their content and the elements they belong to, so the same
+    document is always written the same way. With canonical=True, the graph is additionally canonicalized with
+    rdflib.compare.to_isomorphic() before it is written, which takes much longer for large documents.
+    With streaming=True, no graph of the whole document is built; every element is written as soon as it has been
+    converted (see RdfXmlEmitter). The output is semantically equivalent, but not canonical.
+    """
+    if canonical and streaming:
+        raise ValueError("Canonical output needs the whole graph and cannot be written while streaming.")
     document = validate_and_deduplicate(document, validate, drop_duplicates)
-    graph = Graph()
+    if streaming:
+        emitter = RdfXmlEmitter(stream)
+        emitter.write_header()
+        add_document_to_graph(document, emitter, on_element_added=emitter.flush)
+        emitter.write_footer()
+        return
+
+    # unlike the default store, this one returns the triples in the order in which they were added
+    graph = Graph(store="SimpleMemory")
+    add_document_to_graph(document, graph)
+    if canonical:
+        graph = to_isomorphic(graph)
+    graph.bind("spdx", SPDX_NAMESPACE)
+    graph.bind("doap", DOAP)
+    graph.bind("ptr", POINTER_NAMESPACE)
+    graph.serialize(stream, "pretty-xml", encoding="UTF-8", max_depth=100)
+
+
+def add_document_to_graph(
+    document: Document, graph: Graph, on_element_added: Callable[[], Any] = lambda: None
+) -> None:
+    """
+    Adds the triples of the whole document to the graph and calls on_element_added after the creation info and after
+    each element.
+    """
     doc_namespace = document.creation_info.document_namespace
     external_doc_ref_to_namespace: Dict[str, str] = {
         external_doc_ref.document_ref_id: external_doc_ref.document_uri
         for external_doc_ref in document.creation_info.external_document_refs
     }
     doc_node = add_creation_info_to_graph(document.creation_info, graph)
+    on_element_added()
     for annotation in document.annotations:
         add_annotation_to_graph(annotation, graph, doc_namespace, external_doc_ref_to_namespace)
+        on_element_added()
 
     for file in document.files:
         add_file_to_graph(file, graph, doc_namespace, external_doc_ref_to_namespace)
+        on_element_added()
 
     for package in document.packages:
         add_package_to_graph(package, graph, doc_namespace, external_doc_ref_to_namespace)
+        on_element_added()
 
     for relationship in document.relationships:
         add_relationship_to_graph(relationship, graph, doc_namespace, external_doc_ref_to_namespace)
+        on_element_added()
 
     for snippet in document.snippets:
         add_snippet_to_graph(snippet, graph, doc_namespace, external_doc_ref_to_namespace)
+        on_element_added()
 
     for extracted_licensing_info in document.extracted_licensing_info:
         add_extracted_licensing_info_to_graph(extracted_licensing_info, graph, doc_node, doc_namespace)
-
-    graph = to_isomorphic(graph)
-    graph.bind("spdx", SPDX_NAMESPACE)
-    graph.bind("doap", DOAP)
-    graph.bind("ptr", POINTER_NAMESPACE)
-    graph.serialize(stream, "pretty-xml", encoding="UTF-8", max_depth=100)
+        on_element_added()
 
 
-def write_document_to_file(document: Document, file_name: str, validate: bool = True, drop_duplicates: bool = True):
+def write_document_to_file(
+    document: Document,
+    file_name: str,
+    validate: bool = True,
+    drop_duplicates: bool = True,
+    canonical: bool = False,
+    streaming: bool = False,
+):
     with open(file_name, "wb") as out:
-        write_document_to_stream(document, out, validate, drop_duplicates)
+        write_document_to_stream(document, out, validate, drop_duplicates, canonical, streaming)
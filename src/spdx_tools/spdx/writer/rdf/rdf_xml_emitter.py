@@ -0,0 +1,143 @@
+# SPDX-FileCopyrightText: 2023 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+from xml.sax.saxutils import escape, quoteattr
+
+from beartype.typing import IO, Dict, List, Optional, Set, Tuple
+from rdflib import DOAP, RDF, RDFS, BNode, Literal
+from rdflib.term import Node
+
+from spdx_tools.spdx.rdfschema.namespace import POINTER_NAMESPACE, SPDX_NAMESPACE
+
+# the namespaces of all types and predicates that the add_*_to_graph() functions write
+RDF_XML_NAMESPACES: Dict[str, str] = {
+    "rdf": str(RDF),
+    "rdfs": str(RDFS),
+    "spdx": str(SPDX_NAMESPACE),
+    "ptr": str(POINTER_NAMESPACE),
+    "doap": str(DOAP),
+}
+# line breaks in literals are kept as they are, carriage returns would be normalized by XML parsers
+TEXT_ENTITIES = {"\r": "&#13;"}
+
+
+class RdfXmlEmitter:
+    """
+    Takes the place of the rdflib Graph that the add_*_to_graph() functions write to, and writes the triples to a
+    stream as RDF/XML instead of keeping them. Whenever flush() is called, the triples that were added since the last
+    call are written as nested node elements and dropped, so that only the triples of one element of the document
+    have to be held in memory at a time. The output is semantically equivalent to that of rdflib's serializers.
+    create_stable_bnode() numbers equal blank nodes like in a whole graph also across flushes, e.g. those of duplicate
+    relationships. Therefore, the ids of all blank nodes that are attached to an element with a URI, like those of
+    checksums, relationships, annotations and license expressions, are kept in used_bnodes until the end of the run,
+    so this part of the memory still grows with the size of the document. Blank nodes below other blank nodes are
+    always written in the same flush and are not kept.
+    """
+
+    def __init__(self, stream: IO[bytes]):
+        self.stream = stream
+        self.predicate_objects: Dict[Node, List[Tuple[Node, Node]]] = {}
+        self.used_bnodes: Set[BNode] = set()
+        self.qnames: Dict[Node, Optional[str]] = {}
+
+    def add(self, triple: Tuple[Node, Node, Node]):
+        subject, predicate, obj = triple
+        if isinstance(obj, BNode) and not isinstance(subject, BNode):
+            self.used_bnodes.add(obj)
+        self.predicate_objects.setdefault(subject, []).append((predicate, obj))
+
+    def __contains__(self, triple: Tuple[Optional[Node], Optional[Node], Optional[Node]]) -> bool:
+        subject, predicate, obj = triple
+        if subject is not None and predicate is None and obj is None:
+            return subject in self.predicate_objects or subject in self.used_bnodes
+        for current_subject, predicate_objects in self.predicate_objects.items():
+            if subject is not None and current_subject != subject:
+                continue
+            for current_predicate, current_object in predicate_objects:
+                if (predicate is None or current_predicate == predicate) and (obj is None or current_object == obj):
+                    return True
+        return False
+
+    def write_header(self):
+        namespace_declarations = "".join(
+            f"\n  xmlns:{prefix}={quoteattr(namespace)}" for prefix, namespace in RDF_XML_NAMESPACES.items()
+        )
+        self.stream.write(f'<?xml version="1.0" encoding="UTF-8"?>\n<rdf:RDF{namespace_declarations}\n>\n'.encode())
+
+    def write_footer(self):
+        self.flush()
+        self.stream.write(b"</rdf:RDF>\n")
+
+    def flush(self):
+        """
+        Writes the added triples with every subject that is not the object of another triple as a top-level node
+        element, in the order in which the subjects were added. Blank nodes and resources that are described by the
+        triples are nested into the elements that refer to them.
+        """
+        referenced_nodes = {
+            obj
+            for predicate_objects in self.predicate_objects.values()
+            for _, obj in predicate_objects
+            if not isinstance(obj, Literal)
+        }
+        written_nodes: Set[Node] = set()
+        lines: List[str] = []
+        for subject in self.predicate_objects:
+            if subject not in referenced_nodes:
+                self._append_node_element(subject, 1, lines, written_nodes)
+        # subjects that are only referenced in a cycle
+        for subject in self.predicate_objects:
+            if subject not in written_nodes:
+                self._append_node_element(subject, 1, lines, written_nodes)
+
+        self.stream.write("".join(lines).encode("utf-8"))
+        self.predicate_objects.clear()
+
+    def _append_node_element(self, subject: Node, depth: int, lines: List[str], written_nodes: Set[Node]):
+        written_nodes.add(subject)
+        predicate_objects = self.predicate_objects[subject]
+        node_type = next((obj for predicate, obj in predicate_objects if predicate == RDF.type), None)
+        element_name = self.get_qname(node_type) if node_type is not None else None
+        if element_name is None:
+            element_name = "rdf:Description"
+            node_type = None
+        indentation = "  " * depth
+        if isinstance(subject, BNode):
+            lines.append(f"{indentation}<{element_name} rdf:nodeID={quoteattr(str(subject))}>\n")
+        else:
+            lines.append(f"{indentation}<{element_name} rdf:about={quoteattr(str(subject))}>\n")
+
+        for predicate, obj in predicate_objects:
+            if predicate == RDF.type and obj == node_type:
+                continue
+            property_name = self.get_qname(predicate)
+            if property_name is None:
+                raise ValueError(f"Cannot write predicate {predicate} in RDF/XML, its namespace is unknown.")
+            if isinstance(obj, Literal):
+                attributes = ""
+                if obj.language:
+                    attributes += f" xml:lang={quoteattr(obj.language)}"
+                if obj.datatype:
+                    attributes += f" rdf:datatype={quoteattr(str(obj.datatype))}"
+                text = escape(str(obj), TEXT_ENTITIES)
+                lines.append(f"{indentation}  <{property_name}{attributes}>{text}</{property_name}>\n")
+            elif obj in self.predicate_objects and obj not in written_nodes:
+                lines.append(f"{indentation}  <{property_name}>\n")
+                self._append_node_element(obj, depth + 2, lines, written_nodes)
+                lines.append(f"{indentation}  </{property_name}>\n")
+            elif isinstance(obj, BNode):
+                lines.append(f"{indentation}  <{property_name} rdf:nodeID={quoteattr(str(obj))}/>\n")
+            else:
+                lines.append(f"{indentation}  <{property_name} rdf:resource={quoteattr(str(obj))}/>\n")
+
+        lines.append(f"{indentation}</{element_name}>\n")
+
+    def get_qname(self, uri: Node) -> Optional[str]:
+        if uri not in self.qnames:
+            self.qnames[uri] = None
+            for prefix, namespace in RDF_XML_NAMESPACES.items():
+                local_name = str(uri)[len(namespace) :]
+                if str(uri).startswith(namespace) and local_name.isidentifier():
+                    self.qnames[uri] = f"{prefix}:{local_name}"
+                    break
+        return self.qnames[uri]
@@ -2,12 +2,16 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 from beartype.typing import Dict, Optional, Tuple
-from rdflib import RDF, RDFS, BNode, Graph, Literal, URIRef
+from rdflib import RDF, RDFS, Graph, Literal, URIRef
 
 from spdx_tools.spdx.model import Snippet
 from spdx_tools.spdx.rdfschema.namespace import POINTER_NAMESPACE, SPDX_NAMESPACE
 from spdx_tools.spdx.writer.rdf.license_expression_writer import add_license_expression_or_none_or_no_assertion
-from spdx_tools.spdx.writer.rdf.writer_utils import add_namespace_to_spdx_id, add_optional_literal
+from spdx_tools.spdx.writer.rdf.writer_utils import (
+    add_namespace_to_spdx_id,
+    add_optional_literal,
+    create_stable_bnode,
+)
 
 
 def add_snippet_to_graph(
@@ -47,13 +51,15 @@ def add_range_to_graph(
     snippet_from_file_ref: URIRef,
     pointer_class: URIRef,
 ):
-    start_end_pointer = BNode()
+    start_end_pointer = create_stable_bnode(
+        graph, snippet_node, SPDX_NAMESPACE.range, pointer_class, *range_information
+    )
     graph.add((start_end_pointer, RDF.type, POINTER_NAMESPACE.StartEndPointer))
     for predicate, value in [
         (POINTER_NAMESPACE.startPointer, range_information[0]),
         (POINTER_NAMESPACE.endPointer, range_information[1]),
     ]:
-        pointer_node = BNode()
+        pointer_node = create_stable_bnode(graph, start_end_pointer, predicate, value)
         graph.add((pointer_node, RDF.type, pointer_class))
         graph.add((start_end_pointer, predicate, pointer_node))
         graph.add((pointer_node, POINTER_NAMESPACE.reference, snippet_from_file_ref))
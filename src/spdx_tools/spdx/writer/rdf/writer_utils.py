@@ -1,11 +1,12 @@
 # SPDX-FileCopyrightText: 2023 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
+import hashlib
 import logging
 from datetime import datetime
 
 from beartype.typing import Any, Dict, Optional
-from rdflib import Graph, Literal
+from rdflib import BNode, Graph, Literal
 from rdflib.term import Node
 
 from spdx_tools.spdx.datetime_conversions import datetime_to_iso_string
@@ -59,3 +60,21 @@ def add_namespace_to_spdx_id(spdx_id: str, doc_namespace: str, external_doc_name
         return f"{doc_namespace}#{spdx_id}"
 
     return spdx_id
+
+
+def create_stable_bnode(graph: Graph, parent: Node, predicate: Node, *content: Any) -> BNode:
+    """
+    Returns a blank node that is added to the graph below parent with the given predicate. Its id is derived from
+    these and from the string representations of the content, so that the same document is always written with the
+    same blank node ids and no expensive canonicalization of the graph is needed. Blank nodes with equal ids are
+    numbered in the order of their creation, which requires that each node has been added to the graph before the
+    next one is created.
+    """
+    id_source = "|".join(str(part) for part in (parent, predicate) + content)
+    node_id = "N" + hashlib.sha256(id_source.encode("utf-8")).hexdigest()[:32]
+    node = BNode(node_id)
+    number = 1
+    while (node, None, None) in graph:
+        number += 1
+        node = BNode(f"{node_id}_{number}")
+    return node
@@ -0,0 +1,60 @@
+# SPDX-FileCopyrightText: 2023 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+from unittest import mock
+
+from spdx_tools.spdx.jsonschema.conversion_context import (
+    ConversionContext,
+    active_conversion_context,
+    get_conversion_context,
+)
+from spdx_tools.spdx.jsonschema.document_converter import DocumentConverter
+from tests.spdx.fixtures import annotation_fixture, document_fixture, file_fixture, package_fixture
+
+
+def test_conversion_context():
+    package_annotation = annotation_fixture(spdx_id="SPDXRef-Package")
+    file_annotations = [annotation_fixture(spdx_id="SPDXRef-File"), annotation_fixture(spdx_id="SPDXRef-File")]
+    document = document_fixture(
+        packages=[package_fixture(spdx_id="SPDXRef-Package")],
+        files=[file_fixture(spdx_id="SPDXRef-File")],
+        snippets=[],
+        annotations=[file_annotations[0], package_annotation, file_annotations[1]],
+    )
+
+    context = ConversionContext(document)
+
+    assert context.contained_spdx_element_ids == {"SPDXRef-Package", "SPDXRef-File"}
+    assert context.get_annotations("SPDXRef-Package") == [package_annotation]
+    assert context.get_annotations("SPDXRef-File") == file_annotations
+    assert context.get_annotations("SPDXRef-DOCUMENT") == []
+
+
+def test_get_conversion_context_returns_active_context_of_the_document():
+    document = document_fixture()
+    other_document = document_fixture()
+    context = ConversionContext(document)
+
+    with active_conversion_context(context):
+        assert get_conversion_context(document) is context
+        assert get_conversion_context(other_document).document is other_document
+
+    assert get_conversion_context(document) is not context
+
+
+def test_context_is_built_once_per_document_conversion():
+    document = document_fixture()
+
+    with (
+        mock.patch(
+            "spdx_tools.spdx.jsonschema.document_converter.ConversionContext", wraps=ConversionContext
+        ) as context_class,
+        mock.patch(
+            "spdx_tools.spdx.jsonschema.conversion_context.ConversionContext", wraps=ConversionContext
+        ) as fallback_context_class,
+    ):
+        converted_document = DocumentConverter().convert(document)
+
+    assert converted_document["files"][0]["annotations"]
+    context_class.assert_called_once_with(document)
+    fallback_context_class.assert_not_called()
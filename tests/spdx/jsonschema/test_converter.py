@@ -8,9 +8,14 @@ import pytest
 
 from spdx_tools.common.typing.dataclass_with_properties import dataclass_with_properties
 from spdx_tools.common.typing.type_checks import check_types_and_set_values
+from spdx_tools.spdx.casing_tools import snake_case_to_camel_case
+from spdx_tools.spdx.jsonschema.conversion_context import ConversionContext, active_conversion_context
 from spdx_tools.spdx.jsonschema.converter import TypedConverter
 from spdx_tools.spdx.jsonschema.json_property import JsonProperty
-from spdx_tools.spdx.model import Checksum, ChecksumAlgorithm, Document
+from spdx_tools.spdx.jsonschema.package_converter import PackageConverter
+from spdx_tools.spdx.jsonschema.package_properties import PackageProperty
+from spdx_tools.spdx.model import Checksum, ChecksumAlgorithm, Document, Package, SpdxNoAssertion
+from tests.spdx.fixtures import document_fixture, package_fixture
 
 
 class TestPropertyType(JsonProperty):
@@ -70,3 +75,39 @@ def test_wrong_type():
     assert TestConverter.__name__ in error_message
     assert TestDataModelType.__name__ in error_message
     assert Checksum.__name__ in error_message
+
+
+def test_conversion_table_is_built_once():
+    converter = TestConverter()
+
+    conversion_table = converter.get_conversion_table()
+
+    assert [json_property_name for json_property_name, _ in conversion_table] == ["jsonFirstName", "jsonSecondName"]
+    assert converter.get_conversion_table() is conversion_table
+
+
+def test_table_driven_conversion_matches_per_property_dispatch():
+    converter = PackageConverter()
+    document = document_fixture()
+    packages = [Package("SPDXRef-Package", "package", SpdxNoAssertion()), package_fixture()]
+    property_accessors = converter._get_property_accessors()
+
+    def convert_per_property(package: Package) -> dict:
+        # resolves the name and the accessor of every property for every package, like the converters used to
+        result = {}
+        for package_property in PackageProperty:
+            property_accessor = property_accessors.get(package_property)
+            property_value = property_accessor(package, document) if property_accessor else None
+            if property_value is None:
+                continue
+            if package_property == PackageProperty.SPDX_ID:
+                result["SPDXID"] = property_value
+            else:
+                result[snake_case_to_camel_case.__wrapped__(package_property.name)] = property_value
+        return result
+
+    with active_conversion_context(ConversionContext(document)):
+        expected_packages = [convert_per_property(package) for package in packages]
+        converted_packages = [converter.convert(package, document) for package in packages]
+
+    assert converted_packages == expected_packages
@@ -0,0 +1,54 @@
+# SPDX-FileCopyrightText: 2023 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+from spdx_tools.spdx.model import Relationship, RelationshipType, SpdxNoAssertion, SpdxNone
+from spdx_tools.spdx.model.relationship_index import RelationshipIndex
+
+DESCRIBES_PACKAGE = Relationship("SPDXRef-DOCUMENT", RelationshipType.DESCRIBES, "SPDXRef-Package")
+DESCRIBES_FILE = Relationship("SPDXRef-DOCUMENT", RelationshipType.DESCRIBES, "SPDXRef-File")
+PACKAGE_CONTAINS_FILE = Relationship("SPDXRef-Package", RelationshipType.CONTAINS, "SPDXRef-File")
+FILE_CONTAINED_BY_PACKAGE = Relationship("SPDXRef-File", RelationshipType.CONTAINED_BY, "SPDXRef-Package")
+PACKAGE_DEPENDS_ON_NONE = Relationship("SPDXRef-Package", RelationshipType.DEPENDS_ON, SpdxNone())
+RELATIONSHIPS = [
+    DESCRIBES_PACKAGE,
+    PACKAGE_CONTAINS_FILE,
+    DESCRIBES_FILE,
+    FILE_CONTAINED_BY_PACKAGE,
+    PACKAGE_DEPENDS_ON_NONE,
+]
+
+
+def test_filter_by_type_and_origin():
+    relationship_index = RelationshipIndex(RELATIONSHIPS)
+
+    assert relationship_index.filter_by_type_and_origin(RelationshipType.DESCRIBES, "SPDXRef-DOCUMENT") == [
+        DESCRIBES_PACKAGE,
+        DESCRIBES_FILE,
+    ]
+    assert relationship_index.filter_by_type_and_origin(RelationshipType.CONTAINS, "SPDXRef-Package") == [
+        PACKAGE_CONTAINS_FILE
+    ]
+    assert relationship_index.filter_by_type_and_origin(RelationshipType.CONTAINS, "SPDXRef-File") == []
+
+
+def test_filter_by_type_and_target():
+    relationship_index = RelationshipIndex(RELATIONSHIPS)
+
+    assert relationship_index.filter_by_type_and_target(RelationshipType.CONTAINED_BY, "SPDXRef-Package") == [
+        FILE_CONTAINED_BY_PACKAGE
+    ]
+    assert relationship_index.filter_by_type_and_target(RelationshipType.DEPENDS_ON, SpdxNone()) == [
+        PACKAGE_DEPENDS_ON_NONE
+    ]
+    assert relationship_index.filter_by_type_and_target(RelationshipType.DEPENDS_ON, SpdxNoAssertion()) == []
+
+
+def test_adjacency():
+    relationship_index = RelationshipIndex(RELATIONSHIPS)
+
+    assert relationship_index.get_relationships_from("SPDXRef-Package") == [
+        PACKAGE_CONTAINS_FILE,
+        PACKAGE_DEPENDS_ON_NONE,
+    ]
+    assert relationship_index.get_relationships_to("SPDXRef-File") == [PACKAGE_CONTAINS_FILE, DESCRIBES_FILE]
+    assert relationship_index.get_relationships_to("SPDXRef-DOCUMENT") == []
@@ -1,5 +1,12 @@
+import io
+import json
 import os
+from unittest import TestCase
 
+import pytest
+
+from spdx_tools.spdx.model import Annotation, ExtractedLicensingInfo, File, Package, Relationship, Snippet
+from spdx_tools.spdx.parser.error import SPDXParsingError
 from spdx_tools.spdx.parser.json import json_parser
 
 
@@ -9,3 +16,88 @@ def test_parse_control_characters():
     )
     assert doc.creation_info.creators[0].name == "Nisha  K"
     assert doc.extracted_licensing_info[0].extracted_text == 'Golang BSD plus Patents "\\/\n\r\t'
+
+
+@pytest.mark.parametrize("chunk_size", [3, json_parser.DEFAULT_CHUNK_SIZE])
+def test_iter_top_level_members(chunk_size):
+    json_str = (
+        '{"name": "doc", "packages": [{"SPDXID": "SPDXRef-1"}, {"SPDXID": "SPDXRef-2"}], "files": [], '
+        '"snippets": null, "number": 12345, "text": "with\\bcontrol"}'
+    )
+
+    members = list(
+        json_parser.iter_top_level_members(io.StringIO(json_str), ["packages", "files", "snippets"], chunk_size)
+    )
+
+    assert members == [
+        ("name", "doc"),
+        ("packages", {"SPDXID": "SPDXRef-1"}),
+        ("packages", {"SPDXID": "SPDXRef-2"}),
+        ("number", 12345),
+        ("text", "withcontrol"),
+    ]
+
+
+@pytest.mark.parametrize("chunk_size", range(1, 8))
+def test_iter_top_level_members_removes_control_chars_split_across_chunks(chunk_size):
+    json_str = r'{"text": "a\bb\\b\\\fc\u0008\u000Cd\\", "list": ["\f", "e\\\\\b"]}'
+
+    members = list(json_parser.iter_top_level_members(io.StringIO(json_str), ["list"], chunk_size))
+
+    assert members == [("text", "ab\\b\\cd\\"), ("list", ""), ("list", "e\\\\")]
+
+
+@pytest.mark.parametrize(
+    "json_str", ['{"name": "doc" "packages": []}', '{"packages": [{}, ]}', '{"name": "doc"}\n{', '{"name": "doc",}']
+)
+def test_iter_top_level_members_raises_like_json(json_str):
+    with pytest.raises(json.JSONDecodeError) as err:
+        json.loads(json_str)
+    with pytest.raises(json.JSONDecodeError) as streaming_err:
+        list(json_parser.iter_top_level_members(io.StringIO(json_str), ["packages"], 2))
+
+    assert (streaming_err.value.lineno, streaming_err.value.colno) == (err.value.lineno, err.value.colno)
+
+
+@pytest.mark.parametrize("file_name", ["SPDXJSONExample-v2.3.spdx.json", "SPDXJSONExample-v2.2.spdx.json"])
+def test_iter_elements_from_file(file_name):
+    file_path = os.path.join(os.path.dirname(__file__), "../../data", file_name)
+    document = json_parser.parse_from_file(file_path)
+    elements = []
+
+    assert json_parser.parse_from_file(file_path, on_element=elements.append) is None
+
+    assert elements[-1] == document.creation_info
+    assert [element for element in elements if isinstance(element, Package)] == document.packages
+    assert [element for element in elements if isinstance(element, File)] == document.files
+    assert [element for element in elements if isinstance(element, Snippet)] == document.snippets
+    assert [element for element in elements if isinstance(element, ExtractedLicensingInfo)] == (
+        document.extracted_licensing_info
+    )
+    TestCase().assertCountEqual(
+        [element for element in elements if isinstance(element, Relationship)], document.relationships
+    )
+    TestCase().assertCountEqual(
+        [element for element in elements if isinstance(element, Annotation)], document.annotations
+    )
+
+
+def test_iter_elements_raises_same_errors_at_the_end(tmp_path):
+    file_path = tmp_path / "invalid.spdx.json"
+    file_path.write_text(
+        json.dumps(
+            {
+                "SPDXID": "SPDXRef-DOCUMENT",
+                "packages": [{"SPDXID": "SPDXRef-Package", "name": "package", "downloadLocation": "NONE"}, {}],
+                "relationships": [{"spdxElementId": "SPDXRef-DOCUMENT", "relationshipType": "INVALID"}],
+            }
+        )
+    )
+    with pytest.raises(SPDXParsingError) as err:
+        json_parser.parse_from_file(str(file_path))
+    elements = json_parser.iter_elements_from_file(str(file_path))
+
+    assert isinstance(next(elements), Package)
+    with pytest.raises(SPDXParsingError) as streaming_err:
+        next(elements)
+    assert streaming_err.value.get_messages() == err.value.get_messages()
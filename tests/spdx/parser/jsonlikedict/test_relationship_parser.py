@@ -60,7 +60,7 @@ def test_parse_document_describes():
     relationships = relationship_parser.parse_document_describes(
         doc_spdx_id=DOCUMENT_SPDX_ID,
         described_spdx_ids=document_dict.get("documentDescribes"),
-        existing_relationships=[],
+        existing_relationship_keys=set(),
     )
 
     assert len(relationships) == 3
@@ -146,7 +146,9 @@ def test_parse_has_files():
     relationship_parser = RelationshipParser()
     document_dict = {"packages": [{"SPDXID": "SPDXRef-Package", "hasFiles": ["SPDXRef-File1", "SPDXRef-File2"]}]}
 
-    relationships = relationship_parser.parse_has_files(document_dict.get("packages"), existing_relationships=[])
+    relationships = relationship_parser.parse_has_files(
+        document_dict.get("packages"), existing_relationship_keys=set()
+    )
 
     assert len(relationships) == 2
     TestCase().assertCountEqual(
@@ -169,7 +171,6 @@ def test_parse_has_files():
 @pytest.mark.parametrize(
     "has_files,existing_relationships,contains_relationships",
     [
-        # pre-requisite for parse_has_files requires that comments in relationships are stripped
         (
             ["SPDXRef-File1", "SPDXRef-File2"],
             [
@@ -208,8 +209,42 @@ def test_parse_has_files_without_duplicating_relationships(has_files, existing_r
     relationship_parser = RelationshipParser()
     document_dict = {"packages": [{"SPDXID": "SPDXRef-Package", "hasFiles": has_files}]}
     relationships = relationship_parser.parse_has_files(
-        document_dict.get("packages"), existing_relationships=existing_relationships
+        document_dict.get("packages"),
+        existing_relationship_keys=relationship_parser.get_canonical_relationship_keys(existing_relationships),
     )
 
     assert len(relationships) == len(contains_relationships)
     TestCase().assertCountEqual(relationships, contains_relationships)
+
+
+def test_get_canonical_relationship_key():
+    relationship_parser = RelationshipParser()
+
+    assert relationship_parser.get_canonical_relationship_key(
+        Relationship("SPDXRef-File", RelationshipType.CONTAINED_BY, "SPDXRef-Package", comment="comment")
+    ) == relationship_parser.get_canonical_relationship_key(
+        Relationship("SPDXRef-Package", RelationshipType.CONTAINS, "SPDXRef-File")
+    )
+    assert relationship_parser.get_canonical_relationship_key(
+        Relationship("SPDXRef-Package", RelationshipType.DEPENDS_ON, SpdxNoAssertion())
+    ) == ("SPDXRef-Package", RelationshipType.DEPENDS_ON, SpdxNoAssertion())
+
+
+def test_parse_implied_relationships_of_many_files():
+    relationship_parser = RelationshipParser()
+    file_ids = [f"SPDXRef-File{index}" for index in range(50_000)]
+    document_dict = {
+        "SPDXID": DOCUMENT_SPDX_ID,
+        "documentDescribes": ["SPDXRef-Package"] + file_ids[::2],
+        "packages": [{"SPDXID": "SPDXRef-Package", "hasFiles": file_ids}],
+        "relationships": [
+            {"spdxElementId": file_id, "relatedSpdxElement": "SPDXRef-Package", "relationshipType": "CONTAINED_BY"}
+            for file_id in file_ids[::2]
+        ],
+    }
+
+    relationships = relationship_parser.parse_all_relationships(document_dict)
+
+    # 25,000 given relationships, 25,001 implied by documentDescribes and 25,000 by hasFiles
+    assert len(relationships) == 75_001
+    assert relationships[-1] == Relationship("SPDXRef-Package", RelationshipType.CONTAINS, file_ids[-1])
@@ -0,0 +1,100 @@
+# SPDX-FileCopyrightText: 2023 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+import io
+import os
+from unittest import TestCase
+from xml.parsers import expat
+
+import pytest
+
+from spdx_tools.spdx.model import Annotation, ExtractedLicensingInfo, File, Package, Relationship, Snippet
+from spdx_tools.spdx.parser.error import SPDXParsingError
+from spdx_tools.spdx.parser.xml import xml_parser
+
+
+@pytest.mark.parametrize(
+    "xml_str, expected_dict",
+    [
+        ("<Document/>", {"Document": None}),
+        (
+            "<Document><name>doc</name><creators>Tool: x</creators><files/></Document>",
+            {"Document": {"name": "doc", "creators": ["Tool: x"], "files": []}},
+        ),
+        (
+            "<Document><files/><files/><packages><checksums/><name> a  b </name></packages></Document>",
+            {"Document": {"files": [None, None], "packages": [{"checksums": [], "name": "a  b"}]}},
+        ),
+        (
+            '<Document><comment lang="en">text</comment><comment>more</comment><files><n>1</n>tail</files></Document>',
+            {
+                "Document": {
+                    "comment": [{"@lang": "en", "#text": "text"}, "more"],
+                    "files": [{"n": "1", "#text": "tail"}],
+                }
+            },
+        ),
+    ],
+)
+def test_parse_xml_to_dict(xml_str, expected_dict):
+    assert xml_parser.parse_xml_to_dict(xml_str) == expected_dict
+
+
+def test_parse_xml_to_dict_does_not_expand_entities():
+    with pytest.raises(ValueError):
+        xml_parser.parse_xml_to_dict('<!DOCTYPE Document [<!ENTITY name "doc">]><Document>&name;</Document>')
+
+
+@pytest.mark.parametrize("chunk_size", [3, xml_parser.DEFAULT_CHUNK_SIZE])
+def test_iter_top_level_members(chunk_size):
+    xml_str = (
+        "<Document><name>doc</name><packages><SPDXID>SPDXRef-1</SPDXID></packages><files/><snippets/><snippets/>"
+        "<packages><SPDXID>SPDXRef-2</SPDXID></packages><documentDescribes>SPDXRef-1</documentDescribes></Document>"
+    )
+
+    members = list(
+        xml_parser.iter_top_level_members(io.StringIO(xml_str), ["packages", "files", "snippets"], chunk_size)
+    )
+
+    assert members == [
+        ("packages", {"SPDXID": "SPDXRef-1"}),
+        ("snippets", None),
+        ("snippets", None),
+        ("packages", {"SPDXID": "SPDXRef-2"}),
+        ("name", "doc"),
+        ("documentDescribes", ["SPDXRef-1"]),
+    ]
+
+
+@pytest.mark.parametrize("xml_str", ["<Other><packages/></Other>", "<Document/>"])
+def test_iter_top_level_members_without_document_tag(xml_str):
+    with pytest.raises(SPDXParsingError):
+        list(xml_parser.iter_top_level_members(io.StringIO(xml_str), ["packages"]))
+
+
+def test_iter_top_level_members_raises_on_malformed_xml():
+    with pytest.raises(expat.ExpatError):
+        list(xml_parser.iter_top_level_members(io.StringIO("<Document><name>doc</Document>"), ["packages"], 4))
+
+
+@pytest.mark.parametrize("file_name", ["SPDXXMLExample-v2.3.spdx.xml", "SPDXXMLExample-v2.2.spdx.xml"])
+def test_iter_elements_from_file(file_name):
+    file_path = os.path.join(os.path.dirname(__file__), "../../data", file_name)
+    document = xml_parser.parse_from_file(file_path)
+    elements = []
+
+    assert xml_parser.parse_from_file(file_path, on_element=elements.append) is None
+
+    assert elements[-1] == document.creation_info
+    assert [element for element in elements if isinstance(element, Package)] == document.packages
+    assert [element for element in elements if isinstance(element, File)] == document.files
+    assert [element for element in elements if isinstance(element, Snippet)] == document.snippets
+    assert [element for element in elements if isinstance(element, ExtractedLicensingInfo)] == (
+        document.extracted_licensing_info
+    )
+    TestCase().assertCountEqual(
+        [element for element in elements if isinstance(element, Relationship)], document.relationships
+    )
+    TestCase().assertCountEqual(
+        [element for element in elements if isinstance(element, Annotation)], document.annotations
+    )
@@ -2,9 +2,20 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 import pytest
-from rdflib import Graph, Namespace, URIRef
+from rdflib import RDF, Graph, Literal, Namespace, URIRef
 
-from spdx_tools.spdx.parser.rdf.graph_parsing_functions import parse_spdx_id, remove_prefix
+from spdx_tools.spdx.parser.logger import Logger
+from spdx_tools.spdx.parser.rdf.graph_parsing_functions import (
+    SubjectIndexedGraph,
+    get_unique_value,
+    index_graph_by_subject,
+    parse_spdx_id,
+    remove_prefix,
+)
+from spdx_tools.spdx.rdfschema.namespace import SPDX_NAMESPACE
+
+SUBJECT = URIRef("docNamespace#SPDXRef-File")
+OTHER_SUBJECT = URIRef("docNamespace#SPDXRef-Package")
 
 
 @pytest.mark.parametrize(
@@ -36,3 +47,59 @@ def test_remove_prefix(string, prefix, expected):
     shorten_string = remove_prefix(string, prefix)
 
     assert expected == shorten_string
+
+
+def add_test_triples(graph: Graph):
+    graph.add((SUBJECT, RDF.type, SPDX_NAMESPACE.File))
+    for creator in ["c", "a", "b"]:
+        graph.add((SUBJECT, SPDX_NAMESPACE.creator, Literal(creator)))
+    graph.add((SUBJECT, SPDX_NAMESPACE.fileName, Literal("./file")))
+    graph.add((OTHER_SUBJECT, SPDX_NAMESPACE.name, Literal("package")))
+
+
+@pytest.mark.parametrize("index_while_adding", [True, False])
+def test_subject_indexed_graph_finds_triples_like_graph(index_while_adding):
+    graph = Graph()
+    if index_while_adding:
+        indexed_graph = SubjectIndexedGraph(graph.store, graph.identifier)
+        add_test_triples(indexed_graph)
+    else:
+        add_test_triples(graph)
+        indexed_graph = index_graph_by_subject(graph)
+
+    for pattern in [
+        (SUBJECT, SPDX_NAMESPACE.creator, None),
+        (SUBJECT, None, None),
+        (None, SPDX_NAMESPACE.name, None),
+        (SUBJECT, SPDX_NAMESPACE.name, None),
+        (URIRef("docNamespace#SPDXRef-Unknown"), None, None),
+    ]:
+        assert list(indexed_graph.triples(pattern)) == list(graph.triples(pattern))
+    assert [str(creator) for creator in indexed_graph.objects(SUBJECT, SPDX_NAMESPACE.creator)] == ["c", "a", "b"]
+
+
+def test_subject_indexed_graph_keeps_index_up_to_date():
+    graph = SubjectIndexedGraph()
+    add_test_triples(graph)
+
+    graph.add((SUBJECT, SPDX_NAMESPACE.fileName, Literal("./file")))
+    graph.remove((SUBJECT, SPDX_NAMESPACE.creator, Literal("a")))
+    graph.add((SUBJECT, SPDX_NAMESPACE.creator, Literal("a")))
+    assert list(graph.objects(SUBJECT, SPDX_NAMESPACE.creator)) == [Literal("c"), Literal("b"), Literal("a")]
+    assert list(graph.objects(SUBJECT, SPDX_NAMESPACE.fileName)) == [Literal("./file")]
+
+    graph.remove((SUBJECT, None, None))
+    assert list(graph.triples((SUBJECT, None, None))) == []
+    assert graph.value(OTHER_SUBJECT, SPDX_NAMESPACE.name) == Literal("package")
+
+
+@pytest.mark.parametrize("graph", [Graph(), SubjectIndexedGraph()])
+def test_get_unique_value(graph):
+    add_test_triples(graph)
+    logger = Logger()
+
+    assert get_unique_value(logger, graph, SUBJECT, SPDX_NAMESPACE.fileName, None) == Literal("./file")
+    assert get_unique_value(logger, graph, SUBJECT, SPDX_NAMESPACE.name, "default") == "default"
+    assert logger.get_messages() == []
+    assert get_unique_value(logger, graph, SUBJECT, SPDX_NAMESPACE.creator, None) is None
+    assert logger.get_messages() == [f"Multiple values for unique value {SPDX_NAMESPACE.creator} found."]
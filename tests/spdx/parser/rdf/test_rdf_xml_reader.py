@@ -0,0 +1,106 @@
+# SPDX-FileCopyrightText: 2023 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+import io
+import os
+from unittest import TestCase
+
+import pytest
+from rdflib import Graph
+
+from spdx_tools.spdx.model import Document
+from spdx_tools.spdx.parser.error import SPDXParsingError
+from spdx_tools.spdx.parser.rdf import rdf_parser, rdf_xml_reader
+from spdx_tools.spdx.writer.rdf.rdf_writer import write_document_to_file
+from tests.spdx.fixtures import document_fixture
+
+DATA_DIRECTORY = os.path.join(os.path.dirname(__file__), "../../data")
+RDF_XML_HEADER = (
+    '<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#" xmlns:spdx="http://spdx.org/rdf/terms#">'
+)
+
+
+@pytest.fixture
+def temporary_file_path() -> str:
+    temporary_file_path = "temp_test_rdf_xml_reader_output.rdf.xml"
+    yield temporary_file_path
+    os.remove(temporary_file_path)
+
+
+def assert_documents_are_equal(document: Document, expected_document: Document):
+    # the rdflib graph does not keep the order of the elements
+    assert document.creation_info == expected_document.creation_info
+    for field in ["packages", "files", "snippets", "annotations", "relationships", "extracted_licensing_info"]:
+        TestCase().assertCountEqual(getattr(document, field), getattr(expected_document, field))
+
+
+@pytest.mark.parametrize(
+    "file_path, encoding",
+    [
+        (os.path.join(DATA_DIRECTORY, "SPDXRdfExample-v2.3.spdx.rdf.xml"), "utf-8"),
+        (os.path.join(DATA_DIRECTORY, "SPDXRdfExample-v2.2.spdx.rdf.xml"), "utf-8"),
+        (os.path.join(DATA_DIRECTORY, "SPDXRdfExample-UTF-16.spdx.rdf.xml"), "utf-16"),
+        (os.path.join(os.path.dirname(__file__), "data/file_to_test_rdf_parser.rdf.xml"), "utf-8"),
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [17, rdf_xml_reader.DEFAULT_CHUNK_SIZE])
+def test_parse_from_file_like_rdf_parser(file_path, encoding, chunk_size):
+    document = rdf_xml_reader.parse_from_file(file_path, encoding, chunk_size=chunk_size)
+
+    assert_documents_are_equal(document, rdf_parser.parse_from_file(file_path, encoding))
+
+
+@pytest.mark.parametrize("streaming", [True, False])
+def test_parse_written_document(temporary_file_path, streaming):
+    # the streaming writer describes the relationships of an element apart from it
+    write_document_to_file(document_fixture(), temporary_file_path, False, streaming=streaming)
+
+    document = rdf_xml_reader.parse_from_file(temporary_file_path)
+
+    assert_documents_are_equal(document, rdf_parser.parse_from_file(temporary_file_path))
+
+
+def test_rdf_parser_falls_back_to_graph(temporary_file_path):
+    # rdflib's plain RDF/XML serializer writes one rdf:Description per node and refers to blank nodes by their ids
+    graph = Graph().parse(os.path.join(DATA_DIRECTORY, "SPDXRdfExample-v2.3.spdx.rdf.xml"))
+    graph.serialize(temporary_file_path, format="xml")
+
+    with pytest.raises(rdf_xml_reader.UnsupportedSerializationError):
+        rdf_xml_reader.parse_from_file(temporary_file_path)
+    document = rdf_parser.parse_from_file(temporary_file_path, streaming=True)
+
+    assert_documents_are_equal(document, rdf_parser.parse_from_file(temporary_file_path))
+
+
+@pytest.mark.parametrize(
+    "rdf_xml_body",
+    [
+        '<spdx:File rdf:about="https://namespace#SPDXRef-File" spdx:fileName="./file"/>',
+        '<spdx:File rdf:about="https://namespace#SPDXRef-File"><spdx:checksum rdf:parseType="Resource"/></spdx:File>',
+        '<rdf:Bag rdf:about="https://namespace#bag"><rdf:li>value</rdf:li></rdf:Bag>',
+        '<spdx:File rdf:about="#SPDXRef-File"/>',
+        "<spdx:File><spdx:fileName>./file</spdx:fileName></spdx:File>",
+        '<spdx:File rdf:about="https://namespace#SPDXRef-File"><spdx:fileName>./file</spdx:fileName></spdx:File>'
+        '<rdf:Description rdf:about="https://namespace#SPDXRef-File"><spdx:noticeText>text</spdx:noticeText>'
+        "</rdf:Description>",
+        '<spdx:File rdf:about="https://namespace#SPDXRef-File"><spdx:checksum rdf:nodeID="checksum"/></spdx:File>'
+        '<spdx:Checksum rdf:nodeID="checksum"/>',
+    ],
+)
+def test_unsupported_serializations(rdf_xml_body):
+    with pytest.raises(rdf_xml_reader.UnsupportedSerializationError):
+        rdf_xml_reader.RdfXmlReader().read(io.StringIO(f"{RDF_XML_HEADER}{rdf_xml_body}</rdf:RDF>"))
+
+
+@pytest.mark.parametrize(
+    "file_name, error_message",
+    [
+        ("invalid_creation_info.rdf.xml", "Error while parsing CreationInfo: ['No creators provided.']"),
+        ("invalid_creation_info_with_snippet.rdf.xml", "Error while parsing CreationInfo: ['No creators provided.']"),
+    ],
+)
+def test_parse_invalid_document(file_name, error_message):
+    with pytest.raises(SPDXParsingError) as err:
+        rdf_xml_reader.parse_from_file(os.path.join(os.path.dirname(__file__), "data/invalid_documents", file_name))
+
+    assert err.value.get_messages() == [error_message]
@@ -0,0 +1,151 @@
+# SPDX-FileCopyrightText: 2023 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+import os
+
+import pytest
+
+from spdx_tools.spdx.model import CreationInfo, File, Package, Relationship, RelationshipType
+from spdx_tools.spdx.parser.error import SPDXParsingError
+from spdx_tools.spdx.parser.tagvalue.parser import Parser
+from spdx_tools.spdx.parser.tagvalue.tagvalue_parser import (
+    iter_elements_from_file,
+    parse_from_file,
+    split_into_chunks,
+)
+from tests.spdx.parser.tagvalue.test_creation_info_parser import DOCUMENT_STR
+
+PACKAGE_WITH_FILE_STR = "\n".join(
+    [
+        "PackageName: Package",
+        "SPDXID: SPDXRef-Package",
+        "PackageDownloadLocation: https://download.com",
+        "FileName: File in package",
+        "SPDXID: SPDXRef-File",
+        "FileChecksum: SHA1: d6a770ba38583ed4bb4525bd96e50461655d2759",
+        "Relationship: SPDXRef-DOCUMENT DESCRIBES SPDXRef-Package",
+        "RelationshipComment: This is a comment.",
+    ]
+)
+
+
+def test_split_into_chunks():
+    lines = [
+        "PackageName: Package\n",
+        "PackageComment: <text>first line\n",
+        "second line</text>\n",
+        "PackageSummary:\n",
+        "\n",
+        "<text>summary</text>\n",
+        "Relationship: SPDXRef-DOCUMENT DESCRIBES SPDXRef-Package\n",
+        "\n",
+        "RelationshipComment: comment\n",
+        "FileName: File\n",
+    ]
+
+    chunks = list(split_into_chunks(lines, chunk_size=1))
+
+    assert chunks == [
+        "PackageName: Package\n",
+        "PackageComment: <text>first line\nsecond line</text>\n",
+        "PackageSummary:\n\n<text>summary</text>\n",
+        "Relationship: SPDXRef-DOCUMENT DESCRIBES SPDXRef-Package\n\nRelationshipComment: comment\n",
+        "FileName: File\n",
+    ]
+    assert list(split_into_chunks(lines)) == ["".join(lines)]
+
+
+def test_split_into_chunks_with_text_after_tag_line():
+    lines = [
+        "PackageName: Package\n",
+        "PackageComment:\n",
+        "\n",
+        "<text>Copyright: someone\n",
+        "PackageName: not a tag\n",
+        "</text>\n",
+        "PackageSummary: summary\n",
+    ]
+
+    chunks = list(split_into_chunks(lines, chunk_size=1))
+
+    assert chunks == [
+        "PackageName: Package\n",
+        "PackageComment:\n\n<text>Copyright: someone\nPackageName: not a tag\n</text>\n",
+        "PackageSummary: summary\n",
+    ]
+
+
+def test_parse_chunks_with_text_after_tag_line():
+    document_str = "\n".join(
+        [
+            DOCUMENT_STR,
+            "PackageName: Package",
+            "SPDXID: SPDXRef-Package",
+            "PackageDownloadLocation: https://download.com",
+            "PackageComment:",
+            "<text>first line",
+            "PackageVersion: 1.0",
+            "FileName: not a file</text>",
+            "PackageSummary: summary",
+        ]
+    )
+    document = Parser().parse(document_str)
+
+    streamed_document = Parser().parse_chunks(split_into_chunks(document_str.splitlines(keepends=True), chunk_size=1))
+
+    assert document.packages[0].comment == "first line\nPackageVersion: 1.0\nFileName: not a file"
+    assert document.packages[0].version is None
+    assert document.files == []
+    assert streamed_document == document
+
+
+@pytest.mark.parametrize("chunk_size", [1, 100])
+def test_parse_chunks_equals_parse(chunk_size):
+    file_path = os.path.join(os.path.dirname(__file__), "../../data/SPDXTagExample-v2.3.spdx")
+    with open(file_path) as file:
+        document = Parser().parse(file.read())
+    with open(file_path) as file:
+        streamed_document = Parser().parse_chunks(split_into_chunks(file, chunk_size))
+
+    assert streamed_document == document
+    assert parse_from_file(file_path, streaming=True) == document
+
+
+def test_iter_elements():
+    parser = Parser()
+    document_str = "\n".join([DOCUMENT_STR, PACKAGE_WITH_FILE_STR])
+
+    elements = list(parser.iter_elements(split_into_chunks(document_str.splitlines(keepends=True), chunk_size=1)))
+
+    assert [type(element) for element in elements] == [Package, File, Relationship, Relationship, CreationInfo]
+    assert elements[2] == Relationship("SPDXRef-Package", RelationshipType.CONTAINS, "SPDXRef-File")
+    assert elements[3].comment == "This is a comment."
+    assert parser.elements_built["packages"] == [elements[0]]
+    assert elements[4] == parser.parse(document_str).creation_info
+
+
+def test_iter_elements_raises_at_the_end():
+    document_str = "\n".join(
+        [DOCUMENT_STR, PACKAGE_WITH_FILE_STR, "UnknownTag: This is an example for an unknown tag."]
+    )
+    elements = Parser().iter_elements(split_into_chunks(document_str.splitlines(keepends=True), chunk_size=1))
+
+    assert [type(element) for element in [next(elements) for _ in range(4)]] == [
+        Package,
+        File,
+        Relationship,
+        Relationship,
+    ]
+    with pytest.raises(SPDXParsingError, match="Unknown tag"):
+        next(elements)
+
+
+def test_iter_elements_from_file():
+    file_path = os.path.join(os.path.dirname(__file__), "../../data/SPDXTagExample-v2.3.spdx")
+    document = parse_from_file(file_path)
+
+    elements = list(iter_elements_from_file(file_path, trusted=True))
+
+    assert elements[-1] == document.creation_info
+    assert [element for element in elements if isinstance(element, Package)] == document.packages
+    assert [element for element in elements if isinstance(element, Relationship)] == document.relationships
@@ -162,3 +162,40 @@ def test_parse_none_or_no_assertion_as_text():
     assert package.summary == "NONE"
     assert package.license_concluded == SpdxNone()
     assert package.license_declared == SpdxNoAssertion()
+
+
+def test_parser_instances_share_tables_but_not_state():
+    first_parser = Parser()
+    second_parser = Parser()
+
+    assert first_parser.yacc is not second_parser.yacc
+    assert first_parser.yacc.action is second_parser.yacc.action
+    assert first_parser.yacc.productions is second_parser.yacc.productions
+
+    first_document = first_parser.parse(DOCUMENT_STR)
+    with pytest.raises(SPDXParsingError, match="Unknown tag"):
+        second_parser.parse("UnknownTag: This is an example for an unknown tag.")
+
+    assert second_parser.parse(DOCUMENT_STR) == first_document
+
+
+def test_reused_parser_starts_from_scratch():
+    parser = Parser()
+    document_str = "\n".join(
+        [
+            DOCUMENT_STR,
+            "PackageName: Package",
+            "SPDXID: SPDXRef-Package",
+            "PackageDownloadLocation: https://download.com",
+        ]
+    )
+    with pytest.raises(SPDXParsingError) as err:
+        parser.parse("\n" + "PackageDownloadLocation: https://download.com")
+    assert err.value.get_messages()[0].endswith("Line: 2")
+
+    document = parser.parse(document_str)
+
+    assert len(document.packages) == 1
+    with pytest.raises(SPDXParsingError) as err:
+        parser.parse("\n" + "PackageDownloadLocation: https://download.com")
+    assert err.value.get_messages()[0].endswith("Line: 2")
@@ -1,12 +1,17 @@
 # SPDX-FileCopyrightText: 2023 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
+import subprocess
+import sys
 from importlib import resources
 
 import pytest
 from click.testing import CliRunner
 
 from spdx_tools.spdx.clitools.pyspdxtools import main
+from spdx_tools.spdx.model import RelationshipType
+from spdx_tools.spdx.writer.json.json_writer import write_document_to_file
+from tests.spdx.fixtures import document_fixture, relationship_fixture
 
 
 @pytest.mark.parametrize(
@@ -22,6 +27,12 @@ from spdx_tools.spdx.clitools.pyspdxtools import main
             "SPDX-2.3",
         ),
         ("-i", str(resources.files("tests.spdx.data").joinpath("SPDXJSONExample-v2.3.spdx.json")), "-o", "-"),
+        (
+            "-i",
+            str(resources.files("tests.spdx.data").joinpath("SPDXJSONExample-v2.3.spdx.json")),
+            "--max-errors",
+            "1",
+        ),
     ],
 )
 def test_cli_with_system_exit_code_0(options):
@@ -44,6 +55,17 @@ def test_cli_with_system_exit_code_0(options):
                 )
             ),
         ),
+        (
+            "-i",
+            str(
+                resources.files("tests.spdx.data.invalid").joinpath(
+                    "spdx-trivy-vmware_log-intelligence-fluentd-"
+                    "sha256_086af034f561f343f633be9d9f9e95f65ae6c61b8ddb2c6755ef5bb25b40f53a.json"
+                )
+            ),
+            "--max-errors",
+            "1",
+        ),
         ("-i", "non_existent_file.spdx"),
     ],
 )
@@ -61,6 +83,12 @@ def test_cli_with_system_exit_code_1(options):
         (),
         ("-i", str(resources.files("tests.spdx.data").joinpath("SPDXJSONExample-v2.3.spdx.json")), "--version"),
         ("-i", str(resources.files("tests.spdx.data").joinpath("SPDXJSONExample-v2.3.spdx.json")), "-o"),
+        (
+            "-i",
+            str(resources.files("tests.spdx.data").joinpath("SPDXJSONExample-v2.3.spdx.json")),
+            "--max-errors",
+            "0",
+        ),
     ],
 )
 def test_cli_with_system_exit_code_2(options):
@@ -69,3 +97,47 @@ def test_cli_with_system_exit_code_2(options):
     result = runner.invoke(main, options)
 
     assert result.exit_code == 2
+
+
+@pytest.mark.parametrize(
+    "max_errors, expected_issues_found, expected_number_of_messages",
+    [
+        ("2", "Validation stopped after the first 2 issues:", 2),
+        ("3", "The following issues have been found:", 3),
+        ("4", "The following issues have been found:", 3),
+    ],
+)
+def test_cli_reports_stopped_validation_only_if_issues_were_left_out(
+    tmp_path, caplog, max_errors, expected_issues_found, expected_number_of_messages
+):
+    document = document_fixture(
+        relationships=[
+            relationship_fixture("SPDXRef-DOCUMENT", RelationshipType.DESCRIBES, f"SPDXRef-Unknown{index}")
+            for index in range(3)
+        ]
+    )
+    file_name = str(tmp_path / "invalid.spdx.json")
+    write_document_to_file(document, file_name, validate=False)
+    runner = CliRunner()
+
+    result = runner.invoke(main, ["-i", file_name, "--max-errors", max_errors])
+
+    assert result.exit_code == 1
+    log_lines = caplog.records[-1].getMessage().splitlines()
+    assert log_lines[0] == f"The document is invalid. {expected_issues_found}"
+    assert len(log_lines) == 1 + expected_number_of_messages
+
+
+def test_cli_import_does_not_load_format_specific_dependencies():
+    # every invocation of the command line tool pays for the imports, whatever the format of the input file
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import spdx_tools.spdx.clitools.pyspdxtools"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imported_modules = {line.split("|")[-1].strip() for line in result.stderr.splitlines() if "|" in line}
+
+    assert "spdx_tools.spdx.clitools.pyspdxtools" in imported_modules
+    for module in ["rdflib", "ply", "xmltodict", "networkx", "spdx_tools.spdx.parser.json.json_parser"]:
+        assert module not in imported_modules
@@ -6,13 +6,16 @@ from unittest import TestCase
 import pytest
 
 from spdx_tools.spdx.document_utils import (
+    SpdxIdLocation,
     create_document_without_duplicates,
     create_list_without_duplicates,
     get_contained_spdx_element_ids,
     get_contained_spdx_elements,
     get_element_from_spdx_id,
+    get_spdx_id_locations,
 )
-from spdx_tools.spdx.model import FileType, SpdxNoAssertion, SpdxNone
+from spdx_tools.spdx.model import Document, File, FileType, Package, Snippet, SpdxNoAssertion, SpdxNone
+from spdx_tools.spdx.spdx_element_utils import get_element_type_from_spdx_id
 from tests.spdx.fixtures import (
     actor_fixture,
     checksum_fixture,
@@ -54,6 +57,41 @@ def test_get_contained_spdx_elements(variables):
     assert contained_elements[snippet.spdx_id] == snippet
 
 
+def test_get_spdx_id_locations():
+    document = document_fixture(
+        packages=[package_fixture(spdx_id="SPDXRef-Package"), package_fixture(spdx_id="SPDXRef-Shared")],
+        files=[file_fixture(spdx_id="SPDXRef-Shared")],
+        snippets=[snippet_fixture(spdx_id="SPDXRef-Shared"), snippet_fixture(spdx_id="SPDXRef-Snippet")],
+    )
+
+    assert get_spdx_id_locations(document) == {
+        document.creation_info.spdx_id: [SpdxIdLocation(Document, 0)],
+        "SPDXRef-Package": [SpdxIdLocation(Package, 0)],
+        "SPDXRef-Shared": [SpdxIdLocation(File, 0), SpdxIdLocation(Package, 1), SpdxIdLocation(Snippet, 0)],
+        "SPDXRef-Snippet": [SpdxIdLocation(Snippet, 1)],
+    }
+
+
+def test_get_element_type_from_spdx_id():
+    document = document_fixture(
+        packages=[package_fixture(spdx_id="SPDXRef-Package")],
+        files=[file_fixture(spdx_id="SPDXRef-File"), file_fixture(spdx_id="SPDXRef-Shared")],
+        snippets=[snippet_fixture(spdx_id="SPDXRef-Shared"), snippet_fixture(spdx_id="SPDXRef-Snippet")],
+    )
+    spdx_id_locations = get_spdx_id_locations(document)
+
+    for spdx_id, expected_type in [
+        ("SPDXRef-Package", Package),
+        ("SPDXRef-File", File),
+        ("SPDXRef-Shared", File),
+        ("SPDXRef-Snippet", Snippet),
+        (document.creation_info.spdx_id, None),
+        ("SPDXRef-Unknown", None),
+    ]:
+        assert get_element_type_from_spdx_id(spdx_id, document) == expected_type
+        assert get_element_type_from_spdx_id(spdx_id, document, spdx_id_locations) == expected_type
+
+
 def test_create_list_without_duplicates():
     list_with_duplicates = [1, 2, 3, 5, 1, 67, 9, 67]
 
@@ -123,3 +161,40 @@ def test_create_document_without_duplicates():
     document_without_duplicates = create_document_without_duplicates(document)
 
     assert document_without_duplicates == expected_document
+    assert document != expected_document
+
+
+def test_create_document_without_duplicates_shares_unchanged_elements():
+    package_with_duplicates = package_fixture(spdx_id="SPDXRef-Package1", attribution_texts=["text", "text"])
+    package_without_duplicates = package_fixture(spdx_id="SPDXRef-Package2")
+    file = file_fixture()
+    document = document_fixture(packages=[package_with_duplicates, package_without_duplicates], files=[file])
+
+    document_without_duplicates = create_document_without_duplicates(document)
+
+    assert document_without_duplicates is not document
+    assert document_without_duplicates.creation_info is document.creation_info
+    assert document_without_duplicates.files is document.files
+    assert document_without_duplicates.relationships is document.relationships
+    assert document_without_duplicates.packages[0] is not package_with_duplicates
+    assert document_without_duplicates.packages[0].attribution_texts == ["text"]
+    assert package_with_duplicates.attribution_texts == ["text", "text"]
+    assert document_without_duplicates.packages[1] is package_without_duplicates
+
+
+def test_create_list_without_duplicates_with_unhashable_elements():
+    list_with_duplicates = [
+        checksum_fixture(),
+        actor_fixture(name="first"),
+        checksum_fixture(value="other"),
+        actor_fixture(name="first"),
+        checksum_fixture(),
+    ]
+
+    list_without_duplicates = create_list_without_duplicates(list_with_duplicates)
+
+    assert list_without_duplicates == [
+        checksum_fixture(),
+        actor_fixture(name="first"),
+        checksum_fixture(value="other"),
+    ]
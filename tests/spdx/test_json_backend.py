@@ -0,0 +1,80 @@
+# SPDX-FileCopyrightText: 2023 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+import json
+import os
+from glob import glob
+
+import pytest
+
+from spdx_tools.common.json_backend import get_json_backend, get_json_backend_names
+from spdx_tools.spdx.parser.json import json_parser
+
+JSON_FILES = [
+    file_name
+    for file_name in sorted(glob(os.path.join(os.path.dirname(__file__), "data", "*.json")))
+    if "UTF-16" not in file_name
+]
+
+
+@pytest.mark.parametrize("backend_name", get_json_backend_names())
+@pytest.mark.parametrize(
+    "value",
+    [
+        {},
+        [],
+        {"empty": [], "nested": [{"a": [1, "\n", None, True, {}]}], "float": 1.5},
+        {"unicode": "äöü € \U0001f600 \x7f \x00", "big": 2**70},
+        {"spaces": ["a  b", "   ", {"  c  ": " d "}]},
+        {"floats": [1e16, 1e-7, 0.1, float("nan"), float("inf"), -float("inf")]},
+        [-(2**63) - 1, 2**64],
+    ],
+)
+def test_backends_dump_like_json(backend_name, value):
+    assert get_json_backend(backend_name).dumps(value) == json.dumps(value, indent=4)
+
+
+@pytest.mark.parametrize("backend_name", get_json_backend_names())
+@pytest.mark.parametrize(
+    "json_str", ["[1e16, 1.5, 1e400, NaN, Infinity, -Infinity]", '{"number": -9223372036854775808, "float": 1.0}']
+)
+def test_backends_load_like_json(backend_name, json_str):
+    # NaN is not equal to itself, so the representations are compared
+    assert repr(get_json_backend(backend_name).loads(json_str)) == repr(json.loads(json_str))
+
+
+def test_default_backend_is_json():
+    backend = get_json_backend()
+
+    assert backend.name == "json"
+    assert backend.loads("[123456789012345678901234567890]") == [123456789012345678901234567890]
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        get_json_backend("unknown")
+
+
+@pytest.mark.parametrize("backend_name", get_json_backend_names())
+def test_backends_raise_json_decode_error(backend_name):
+    with pytest.raises(json.JSONDecodeError):
+        get_json_backend(backend_name).loads('{"name": "doc",}')
+
+
+@pytest.mark.parametrize("backend_name", get_json_backend_names())
+def test_parse_from_file_with_backend(backend_name):
+    file_name = os.path.join(os.path.dirname(__file__), "data", "ControlCharacters.spdx.json")
+
+    assert json_parser.parse_from_file(file_name, json_backend=backend_name) == json_parser.parse_from_file(
+        file_name, json_backend="json"
+    )
+
+
+@pytest.mark.parametrize("backend_name", get_json_backend_names())
+def test_backends_dump_test_data_like_json(backend_name):
+    backend = get_json_backend(backend_name)
+    for file_name in JSON_FILES:
+        with open(file_name, encoding="utf-8") as file:
+            document = json.load(file)
+
+        assert backend.dumps(document) == json.dumps(document, indent=4)
@@ -0,0 +1,123 @@
+# SPDX-FileCopyrightText: 2023 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+import copy
+import io
+import pickle
+
+import pytest
+from license_expression import ExpressionError
+from rdflib import Literal
+
+from spdx_tools.common.spdx_licensing import (
+    LazySpdxLicensing,
+    clear_license_expression_cache,
+    get_license_expression_cache_info,
+    parse_spdx_license_expression,
+    spdx_licensing,
+)
+from spdx_tools.spdx.parser.jsonlikedict.license_expression_parser import LicenseExpressionParser
+from spdx_tools.spdx.parser.tagvalue.parser import Parser
+from spdx_tools.spdx.validation.document_validator import validate_full_spdx_document
+from spdx_tools.spdx.writer.json import json_writer
+from spdx_tools.spdx.writer.rdf import rdf_writer
+from spdx_tools.spdx.writer.tagvalue import tagvalue_writer
+from tests.spdx.fixtures import document_fixture, package_fixture
+from tests.spdx.parser.tagvalue.test_creation_info_parser import DOCUMENT_STR
+
+
+def test_lazy_spdx_licensing_is_created_on_first_use():
+    lazy_spdx_licensing = LazySpdxLicensing()
+    assert lazy_spdx_licensing._licensing is None
+
+    assert lazy_spdx_licensing.parse("MIT OR Apache-2.0") == spdx_licensing.parse("MIT OR Apache-2.0")
+    licensing = lazy_spdx_licensing._licensing
+    assert licensing is not None
+    assert lazy_spdx_licensing.validate("MIT").invalid_symbols == []
+    assert lazy_spdx_licensing.get_licensing() is licensing
+
+
+@pytest.mark.parametrize("copy_function", [copy.copy, copy.deepcopy, lambda obj: pickle.loads(pickle.dumps(obj))])
+def test_lazy_spdx_licensing_can_be_copied(copy_function):
+    lazy_spdx_licensing = LazySpdxLicensing()
+
+    copied_lazy_spdx_licensing = copy_function(lazy_spdx_licensing)
+
+    assert copied_lazy_spdx_licensing._licensing is None
+    assert copied_lazy_spdx_licensing.parse("MIT OR Apache-2.0") == spdx_licensing.parse("MIT OR Apache-2.0")
+    with pytest.raises(AttributeError):
+        lazy_spdx_licensing._unknown_attribute
+
+
+def test_parse_spdx_license_expression_returns_cached_expression():
+    clear_license_expression_cache()
+
+    license_expression = parse_spdx_license_expression("MIT OR Apache-2.0")
+
+    assert license_expression == spdx_licensing.parse("MIT OR Apache-2.0")
+    assert parse_spdx_license_expression("MIT OR Apache-2.0") is license_expression
+    assert parse_spdx_license_expression(Literal("MIT OR Apache-2.0")) is license_expression
+    cache_info = get_license_expression_cache_info()
+    assert (cache_info.hits, cache_info.misses, cache_info.currsize) == (2, 1, 1)
+
+
+@pytest.mark.parametrize("invalid_expression", ["MIT OR", 5])
+def test_parse_spdx_license_expression_raises_every_time(invalid_expression):
+    clear_license_expression_cache()
+
+    for _ in range(2):
+        with pytest.raises(ExpressionError):
+            parse_spdx_license_expression(invalid_expression)
+
+    assert get_license_expression_cache_info().currsize == 0
+
+
+def test_parsers_share_the_cache():
+    clear_license_expression_cache()
+    tag_value_str = "\n".join(
+        [
+            DOCUMENT_STR,
+            "PackageName: Package",
+            "SPDXID: SPDXRef-Package",
+            "PackageDownloadLocation: https://download.com",
+            "PackageLicenseConcluded: MIT AND GPL-2.0-only",
+        ]
+    )
+
+    package = Parser().parse(tag_value_str).packages[0]
+
+    assert LicenseExpressionParser.parse_license_expression("MIT AND GPL-2.0-only") is package.license_concluded
+    assert get_license_expression_cache_info().hits == 1
+
+
+def test_shared_expression_is_not_modified_by_the_model_validation_and_writers():
+    clear_license_expression_cache()
+    tag_value_str = "\n".join(
+        [
+            DOCUMENT_STR,
+            "PackageName: Package",
+            "SPDXID: SPDXRef-Package",
+            "PackageDownloadLocation: https://download.com",
+            "PackageLicenseConcluded: MIT AND (Apache-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0)",
+        ]
+    )
+    license_expression = Parser().parse(tag_value_str).packages[0].license_concluded
+    expected_license_expression = copy.deepcopy(license_expression)
+    expected_repr = repr(license_expression)
+
+    assert Parser().parse(tag_value_str).packages[0].license_concluded is license_expression
+    package = package_fixture(
+        license_concluded=license_expression,
+        license_info_from_files=[license_expression],
+        license_declared=license_expression,
+    )
+    document = document_fixture(packages=[package])
+    validate_full_spdx_document(document)
+    json_writer.write_document_to_stream(document, io.StringIO(), validate=False)
+    tagvalue_writer.write_document_to_stream(document, io.StringIO(), validate=False)
+    rdf_writer.write_document_to_stream(document, io.BytesIO(), validate=False)
+
+    assert package.license_concluded is license_expression
+    assert license_expression == expected_license_expression
+    assert repr(license_expression) == expected_repr
+    assert parse_spdx_license_expression(str(license_expression)) is license_expression
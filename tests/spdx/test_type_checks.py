@@ -0,0 +1,78 @@
+# SPDX-FileCopyrightText: 2023 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+import os
+
+import pytest
+
+from spdx_tools.common.typing.constructor_type_errors import ConstructorTypeErrors
+from spdx_tools.common.typing.type_checks import check_types, is_trusted_construction_active, trusted_construction
+from spdx_tools.spdx.model import Checksum, ChecksumAlgorithm, Relationship, RelationshipType
+from spdx_tools.spdx.parser.parse_anything import parse_file
+from tests.spdx.fixtures import document_fixture, file_fixture
+
+
+def test_trusted_construction_skips_type_checks():
+    with pytest.raises(ConstructorTypeErrors):
+        Relationship("SPDXRef-File", RelationshipType.OTHER, 42)
+
+    with trusted_construction():
+        assert is_trusted_construction_active()
+        relationship = Relationship("SPDXRef-File", RelationshipType.OTHER, 42)
+
+    assert not is_trusted_construction_active()
+    assert relationship.related_spdx_element_id == 42
+    assert relationship.comment is None
+    with pytest.raises(TypeError):
+        relationship.comment = 42
+
+
+def test_disabled_trusted_construction_keeps_outer_mode():
+    with trusted_construction():
+        with trusted_construction(False):
+            assert is_trusted_construction_active()
+
+    with trusted_construction(False):
+        assert not is_trusted_construction_active()
+
+
+def test_trusted_construction_equals_checked_construction():
+    document = document_fixture()
+    with trusted_construction():
+        trusted_document = document_fixture()
+
+    assert trusted_document == document
+    check_types(trusted_document, recursive=True)
+
+
+def test_check_types():
+    with trusted_construction():
+        checksum = Checksum(ChecksumAlgorithm.SHA1, 42)
+        document = document_fixture(files=[file_fixture(checksums=[checksum])])
+
+    check_types(document)
+    with pytest.raises(ConstructorTypeErrors) as err:
+        check_types(document, recursive=True)
+
+    assert len(err.value.get_messages()) == 1
+    assert err.value.get_messages()[0].startswith("SetterError Checksum:")
+
+
+@pytest.mark.parametrize(
+    "file_name",
+    [
+        "SPDXJSONExample-v2.3.spdx.json",
+        "SPDXYAMLExample-v2.3.spdx.yaml",
+        "SPDXXMLExample-v2.3.spdx.xml",
+        "SPDXTagExample-v2.3.spdx",
+        "SPDXRdfExample-v2.3.spdx.rdf.xml",
+    ],
+)
+def test_trusted_parsing(file_name):
+    file_path = os.path.join(os.path.dirname(__file__), "data", file_name)
+
+    document = parse_file(file_path, trusted=True)
+
+    assert not is_trusted_construction_active()
+    assert document == parse_file(file_path)
+    check_types(document, recursive=True)
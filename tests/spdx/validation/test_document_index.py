@@ -0,0 +1,55 @@
+# SPDX-FileCopyrightText: 2023 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+from spdx_tools.spdx.constants import DOCUMENT_SPDX_ID
+from spdx_tools.spdx.model import File, Package, Snippet
+from spdx_tools.spdx.validation.document_index import build_document_index
+from tests.spdx.fixtures import (
+    creation_info_fixture,
+    document_fixture,
+    external_document_ref_fixture,
+    extracted_licensing_info_fixture,
+    file_fixture,
+    package_fixture,
+    snippet_fixture,
+)
+
+
+def test_build_document_index():
+    document = document_fixture(
+        creation_info=creation_info_fixture(
+            external_document_refs=[external_document_ref_fixture(document_ref_id="DocumentRef-external")]
+        ),
+        packages=[package_fixture(spdx_id="SPDXRef-Package")],
+        files=[file_fixture(spdx_id="SPDXRef-File1"), file_fixture(spdx_id="SPDXRef-File2")],
+        snippets=[snippet_fixture(spdx_id="SPDXRef-Snippet")],
+        extracted_licensing_info=[extracted_licensing_info_fixture(license_id="LicenseRef-1")],
+    )
+
+    document_index = build_document_index(document)
+
+    assert document_index.document_spdx_id == DOCUMENT_SPDX_ID
+    assert document_index.spdx_ids == {
+        DOCUMENT_SPDX_ID,
+        "SPDXRef-Package",
+        "SPDXRef-File1",
+        "SPDXRef-File2",
+        "SPDXRef-Snippet",
+    }
+    assert document_index.file_spdx_ids == {"SPDXRef-File1", "SPDXRef-File2"}
+    assert document_index.external_document_ref_ids == {"DocumentRef-external"}
+    assert document_index.extracted_license_ids == {"LicenseRef-1"}
+    assert document_index.get_element_type("SPDXRef-Package") == Package
+    assert document_index.get_element_type("SPDXRef-File2") == File
+    assert document_index.get_element_type("SPDXRef-Snippet") == Snippet
+    assert document_index.get_element_type(DOCUMENT_SPDX_ID) is None
+
+
+def test_element_type_precedence_for_duplicated_ids():
+    document = document_fixture(
+        packages=[package_fixture(spdx_id="SPDXRef-Duplicate")],
+        files=[file_fixture(spdx_id="SPDXRef-Duplicate")],
+        snippets=[snippet_fixture(spdx_id="SPDXRef-Duplicate")],
+    )
+
+    assert build_document_index(document).get_element_type("SPDXRef-Duplicate") == Package
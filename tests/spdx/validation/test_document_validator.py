@@ -3,15 +3,23 @@
 # SPDX-License-Identifier: Apache-2.0
 import os
 from typing import List, Optional
+from unittest import mock
 
 import pytest
 
 from spdx_tools.spdx.constants import DOCUMENT_SPDX_ID
 from spdx_tools.spdx.model import CreationInfo, Document, Relationship, RelationshipType
 from spdx_tools.spdx.parser.parse_anything import parse_file
-from spdx_tools.spdx.validation.document_validator import validate_full_spdx_document
+from spdx_tools.spdx.validation.document_validator import iter_validation_messages, validate_full_spdx_document
 from spdx_tools.spdx.validation.validation_message import SpdxElementType, ValidationContext, ValidationMessage
-from tests.spdx.fixtures import creation_info_fixture, document_fixture, file_fixture, package_fixture, snippet_fixture
+from tests.spdx.fixtures import (
+    annotation_fixture,
+    creation_info_fixture,
+    document_fixture,
+    file_fixture,
+    package_fixture,
+    snippet_fixture,
+)
 
 
 def test_valid_document():
@@ -146,7 +154,93 @@ def test_duplicated_spdx_ids():
     assert validation_messages == [
         ValidationMessage(
             "every spdx_id must be unique within the document, but found the following duplicates: ['SPDXRef-2', "
-            f"'SPDXRef-3', '{DOCUMENT_SPDX_ID}']",
+            f"'SPDXRef-3', '{DOCUMENT_SPDX_ID}'] (used by SPDXRef-2: files[1], packages[0], snippets[0]; SPDXRef-3: "
+            f"files[2], snippets[1]; {DOCUMENT_SPDX_ID}: creation_info, packages[1])",
             context,
         )
     ]
+
+
+def test_parallel_validation_equals_sequential_validation():
+    document = document_fixture(
+        packages=[
+            package_fixture(spdx_id="SPDXRef-Package", files_analyzed=False, verification_code=None),
+            package_fixture(spdx_id="SPDXRef-invalid_package"),
+        ]
+        + [package_fixture(spdx_id=f"SPDXRef-Package{index}") for index in range(10)],
+        files=[file_fixture(spdx_id=f"SPDXRef-File{index}") for index in range(10)],
+        snippets=[snippet_fixture(spdx_id="SPDXRef-Snippet", file_spdx_id="SPDXRef-unknown")],
+        annotations=[annotation_fixture(spdx_id="SPDXRef-unknown"), annotation_fixture(spdx_id="SPDXRef-File1")],
+        relationships=[
+            Relationship(DOCUMENT_SPDX_ID, RelationshipType.DESCRIBES, "SPDXRef-Package"),
+            Relationship("SPDXRef-Package", RelationshipType.CONTAINS, "SPDXRef-File1"),
+            Relationship("SPDXRef-File2", RelationshipType.CONTAINED_BY, "SPDXRef-Package"),
+            Relationship("SPDXRef-Package1", RelationshipType.CONTAINS, "SPDXRef-unknown"),
+        ],
+    )
+    validation_messages: List[ValidationMessage] = validate_full_spdx_document(document)
+
+    parallel_validation_messages: List[ValidationMessage] = validate_full_spdx_document(document, workers=2)
+
+    assert len(validation_messages) == 6
+    assert parallel_validation_messages == validation_messages
+
+
+def test_validation_of_relationships_replaced_in_place():
+    document = document_fixture(
+        packages=[
+            package_fixture(
+                spdx_id="SPDXRef-Package", files_analyzed=False, license_info_from_files=[], verification_code=None
+            )
+        ],
+        files=[file_fixture(spdx_id="SPDXRef-File")],
+        snippets=[],
+        annotations=[],
+        relationships=[
+            Relationship(DOCUMENT_SPDX_ID, RelationshipType.DESCRIBES, "SPDXRef-Package"),
+            Relationship("SPDXRef-Package", RelationshipType.CONTAINS, "SPDXRef-File"),
+        ],
+    )
+    assert len(validate_full_spdx_document(document)) == 1
+
+    document.relationships[1] = Relationship("SPDXRef-Package", RelationshipType.DEPENDS_ON, "SPDXRef-File")
+    assert validate_full_spdx_document(document) == []
+
+    document.relationships[1] = Relationship("SPDXRef-File", RelationshipType.CONTAINED_BY, "SPDXRef-Package")
+    assert len(validate_full_spdx_document(document)) == 1
+
+
+@pytest.mark.parametrize("max_messages, fail_fast, expected_count", [(None, False, 3), (2, False, 2), (None, True, 1)])
+def test_validation_with_message_limit(max_messages, fail_fast, expected_count):
+    document = document_fixture(
+        packages=[package_fixture(spdx_id="SPDXRef-invalid_package"), package_fixture()],
+        files=[file_fixture(spdx_id="SPDXRef-invalid_file"), file_fixture()],
+        snippets=[snippet_fixture(spdx_id="SPDXRef-invalid_snippet")],
+    )
+    all_validation_messages: List[ValidationMessage] = validate_full_spdx_document(document)
+
+    validation_messages: List[ValidationMessage] = validate_full_spdx_document(
+        document, max_messages=max_messages, fail_fast=fail_fast
+    )
+
+    assert len(all_validation_messages) == 3
+    assert validation_messages == all_validation_messages[:expected_count]
+
+
+@pytest.mark.parametrize("max_messages", [0, -1])
+def test_validation_with_message_limit_below_one(max_messages):
+    with pytest.raises(ValueError):
+        validate_full_spdx_document(document_fixture(), max_messages=max_messages)
+
+
+def test_iter_validation_messages_validates_lazily():
+    document = document_fixture(packages=[package_fixture(spdx_id="SPDXRef-invalid_package")])
+
+    with mock.patch(
+        "spdx_tools.spdx.validation.document_validator.validate_file_within_document"
+    ) as validate_file_mock:
+        validation_messages = iter_validation_messages(document)
+        first_message = next(validation_messages)
+
+    assert first_message.context.spdx_id == "SPDXRef-invalid_package"
+    validate_file_mock.assert_not_called()
@@ -8,6 +8,7 @@ from unittest import TestCase
 import pytest
 
 from spdx_tools.spdx.model import Checksum, ChecksumAlgorithm
+from spdx_tools.spdx.validation.document_index import build_document_index
 from spdx_tools.spdx.validation.file_validator import validate_file, validate_file_within_document
 from spdx_tools.spdx.validation.validation_message import SpdxElementType, ValidationContext, ValidationMessage
 from tests.spdx.fixtures import document_fixture, file_fixture
@@ -15,7 +16,10 @@ from tests.spdx.fixtures import document_fixture, file_fixture
 
 def test_valid_file():
     file = file_fixture()
-    validation_messages: List[ValidationMessage] = validate_file_within_document(file, "SPDX-2.3", document_fixture())
+    document = document_fixture()
+    validation_messages: List[ValidationMessage] = validate_file_within_document(
+        file, "SPDX-2.3", document, build_document_index(document)
+    )
 
     assert validation_messages == []
 
@@ -36,8 +40,9 @@ def test_valid_file():
     ],
 )
 def test_invalid_file(file_input, spdx_id, expected_message):
+    document = document_fixture()
     validation_messages: List[ValidationMessage] = validate_file_within_document(
-        file_input, "SPDX-2.3", document_fixture()
+        file_input, "SPDX-2.3", document, build_document_index(document)
     )
 
     expected = ValidationMessage(
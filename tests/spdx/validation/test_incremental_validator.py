@@ -0,0 +1,143 @@
+# SPDX-FileCopyrightText: 2023 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+from unittest import mock
+
+import pytest
+
+from spdx_tools.common.spdx_licensing import spdx_licensing
+from spdx_tools.spdx.model import RelationshipType
+from spdx_tools.spdx.validation.document_validator import validate_full_spdx_document
+from spdx_tools.spdx.validation.incremental_validator import IncrementalValidator
+from tests.spdx.fixtures import (
+    document_fixture,
+    file_fixture,
+    package_fixture,
+    relationship_fixture,
+    snippet_fixture,
+)
+
+
+def build_document():
+    return document_fixture(
+        packages=[package_fixture(), package_fixture(spdx_id="SPDXRef-Unanalyzed", files_analyzed=False)],
+        files=[
+            file_fixture(),
+            file_fixture(spdx_id="SPDXRef-OtherFile", license_concluded=spdx_licensing.parse("LicenseRef-1")),
+        ],
+        snippets=[
+            snippet_fixture(),
+            snippet_fixture(spdx_id="SPDXRef-OtherSnippet", file_spdx_id="SPDXRef-OtherFile"),
+        ],
+        relationships=[
+            relationship_fixture(),
+            relationship_fixture("SPDXRef-Package", RelationshipType.CONTAINS, "SPDXRef-File"),
+        ],
+    )
+
+
+def rename_file(document):
+    document.files[1].spdx_id = "SPDXRef-RenamedFile"
+    return [document.files[1]]
+
+
+def add_file_to_unanalyzed_package(document):
+    document.relationships[1].spdx_element_id = "SPDXRef-Unanalyzed"
+    return [document.relationships[1]]
+
+
+def replace_relationship_in_place(document):
+    # keeps the length of the list, and the new relationship is not reported as dirty
+    document.relationships[1] = relationship_fixture("SPDXRef-Unanalyzed", RelationshipType.CONTAINS, "SPDXRef-File")
+    return []
+
+
+def add_relationship_to_unanalyzed_package(document):
+    document.relationships.append(
+        relationship_fixture("SPDXRef-OtherFile", RelationshipType.CONTAINED_BY, "SPDXRef-Unanalyzed")
+    )
+    return []
+
+
+def analyze_package(document):
+    document.packages[1].files_analyzed = True
+    return [document.packages[1]]
+
+
+def remove_file(document):
+    del document.files[1]
+    return []
+
+
+def remove_describes_relationship(document):
+    del document.relationships[0]
+    return []
+
+
+def rename_extracted_licensing_info(document):
+    document.extracted_licensing_info[0].license_id = "LicenseRef-Renamed"
+    return document.extracted_licensing_info
+
+
+def add_invalid_license_to_file(document):
+    document.files[0].license_concluded = spdx_licensing.parse("LicenseRef-Unknown")
+    return [document.files[0]]
+
+
+def add_duplicate_package(document):
+    document.packages.append(package_fixture(spdx_id="SPDXRef-OtherFile"))
+    return []
+
+
+@pytest.mark.parametrize(
+    "modify_document",
+    [
+        rename_file,
+        add_file_to_unanalyzed_package,
+        replace_relationship_in_place,
+        add_relationship_to_unanalyzed_package,
+        analyze_package,
+        remove_file,
+        remove_describes_relationship,
+        rename_extracted_licensing_info,
+        add_invalid_license_to_file,
+        add_duplicate_package,
+    ],
+)
+def test_incremental_validation_equals_full_validation(modify_document):
+    document = build_document()
+    validator = IncrementalValidator(document)
+    assert validator.validate() == validate_full_spdx_document(document)
+
+    validator.mark_dirty(*modify_document(document))
+    validation_messages = validator.validate()
+
+    assert validation_messages == validate_full_spdx_document(document)
+    assert validation_messages != validate_full_spdx_document(build_document())
+
+    # restoring the document restores the messages of the first run
+    validator.document = document = build_document()
+    assert validator.validate() == validate_full_spdx_document(document)
+
+
+def test_only_dirty_elements_are_validated_again():
+    document = build_document()
+    validator = IncrementalValidator(document)
+    validator.validate()
+
+    with (
+        mock.patch(
+            "spdx_tools.spdx.validation.incremental_validator.validate_file_within_document"
+        ) as validate_file_mock,
+        mock.patch(
+            "spdx_tools.spdx.validation.incremental_validator.validate_package_within_document"
+        ) as validate_package_mock,
+    ):
+        validate_file_mock.return_value = []
+        document.files[0].comment = "changed comment"
+        validator.mark_dirty(document.files[0])
+        validator.validate()
+
+        validate_file_mock.assert_called_once()
+        assert validate_file_mock.call_args.args[0] is document.files[0]
+        validate_package_mock.assert_not_called()
@@ -3,19 +3,26 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from typing import List
-from unittest import TestCase
+from unittest import TestCase, mock
 
 import pytest
 from license_expression import LicenseExpression
 
 from spdx_tools.common.spdx_licensing import spdx_licensing
 from spdx_tools.spdx.model import Document, SpdxNoAssertion, SpdxNone
+from spdx_tools.spdx.validation.document_index import build_document_index
 from spdx_tools.spdx.validation.license_expression_validator import (
+    get_license_expression_messages,
     validate_license_expression,
     validate_license_expressions,
 )
 from spdx_tools.spdx.validation.validation_message import SpdxElementType, ValidationContext, ValidationMessage
-from tests.spdx.fixtures import document_fixture, external_document_ref_fixture, extracted_licensing_info_fixture
+from tests.spdx.fixtures import (
+    document_fixture,
+    external_document_ref_fixture,
+    extracted_licensing_info_fixture,
+    file_fixture,
+)
 
 FIXTURE_LICENSE_ID = extracted_licensing_info_fixture().license_id
 EXTERNAL_DOCUMENT_ID = external_document_ref_fixture().document_ref_id
@@ -173,3 +180,48 @@ def test_invalid_license_expression_with_external_reference(expression_string, e
     expected_messages = [ValidationMessage(expected_message, context)]
 
     assert validation_messages == expected_messages
+
+
+def test_license_expression_is_validated_once_per_document():
+    get_license_expression_messages.cache_clear()
+    document: Document = document_fixture()
+    document_index = build_document_index(document)
+    license_expression = spdx_licensing.parse(f"MIT AND {FIXTURE_LICENSE_ID} AND LicenseRef-unknown")
+
+    with mock.patch(
+        "spdx_tools.spdx.validation.license_expression_validator.spdx_licensing", wraps=spdx_licensing
+    ) as licensing_mock:
+        validation_messages = [
+            validate_license_expression(license_expression, document, parent_id, document_index=document_index)
+            for parent_id in ["SPDXRef-File", "SPDXRef-Package"]
+        ]
+
+    licensing_mock.validate.assert_called_once_with(license_expression)
+    assert [message.context.parent_id for messages in validation_messages for message in messages] == [
+        "SPDXRef-File",
+        "SPDXRef-Package",
+    ]
+    assert validation_messages[0][0].validation_message == validation_messages[1][0].validation_message
+
+
+def test_license_expression_validation_depends_on_extracted_licensing_infos():
+    license_expression = spdx_licensing.parse(FIXTURE_LICENSE_ID)
+    document: Document = document_fixture()
+    document_without_extracted_licensing_info = document_fixture(
+        files=[file_fixture()], snippets=[], extracted_licensing_info=[]
+    )
+
+    assert validate_license_expression(license_expression, document, parent_id="SPDXRef-File") == []
+    assert validate_license_expression(
+        license_expression, document_without_extracted_licensing_info, parent_id="SPDXRef-File"
+    ) == [
+        ValidationMessage(
+            f"Unrecognized license reference: {FIXTURE_LICENSE_ID}. license_expression must only use IDs from the "
+            f"license list or extracted licensing info, but is: {FIXTURE_LICENSE_ID}",
+            ValidationContext(
+                parent_id="SPDXRef-File",
+                element_type=SpdxElementType.LICENSE_EXPRESSION,
+                full_element=license_expression,
+            ),
+        )
+    ]
@@ -0,0 +1,36 @@
+# SPDX-FileCopyrightText: 2023 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+import pytest
+
+from spdx_tools.spdx.model import ChecksumAlgorithm
+from spdx_tools.spdx.validation.regex_patterns import (
+    CHECKSUM_PATTERNS,
+    TYPE_TO_PATTERN,
+    TYPE_TO_REGEX,
+    algorithm_length,
+)
+
+
+@pytest.mark.parametrize(
+    "algorithm, valid_value, invalid_value",
+    [
+        (
+            ChecksumAlgorithm.SHA1,
+            "71c4025dd9897b364f3ebbb42c484ff43d00791c",
+            "71c4025dd9897b364f3ebbb42c484ff43d00791",
+        ),
+        (ChecksumAlgorithm.BLAKE3, "a" * 300, "a" * 255),
+        (ChecksumAlgorithm.MD6, "", "a" * 513),
+    ],
+)
+def test_checksum_patterns(algorithm, valid_value, invalid_value):
+    assert CHECKSUM_PATTERNS[algorithm].match(valid_value)
+    assert not CHECKSUM_PATTERNS[algorithm].match(invalid_value)
+    assert CHECKSUM_PATTERNS.keys() == algorithm_length.keys()
+
+
+def test_external_package_ref_patterns_are_compiled_from_the_regexes():
+    assert TYPE_TO_PATTERN.keys() == TYPE_TO_REGEX.keys()
+    for reference_type, regex in TYPE_TO_REGEX.items():
+        assert TYPE_TO_PATTERN[reference_type].pattern == regex
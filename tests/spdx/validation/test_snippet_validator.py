@@ -7,6 +7,7 @@ from unittest import TestCase
 
 import pytest
 
+from spdx_tools.spdx.validation.document_index import build_document_index
 from spdx_tools.spdx.validation.snippet_validator import validate_snippet, validate_snippet_within_document
 from spdx_tools.spdx.validation.validation_message import SpdxElementType, ValidationContext, ValidationMessage
 from tests.spdx.fixtures import document_fixture, snippet_fixture
@@ -14,8 +15,9 @@ from tests.spdx.fixtures import document_fixture, snippet_fixture
 
 def test_valid_snippet():
     snippet = snippet_fixture()
+    document = document_fixture()
     validation_messages: List[ValidationMessage] = validate_snippet_within_document(
-        snippet, "SPDX-2.3", document_fixture()
+        snippet, "SPDX-2.3", document, build_document_index(document)
     )
 
     assert validation_messages == []
@@ -43,8 +45,9 @@ def test_valid_snippet():
     ],
 )
 def test_invalid_ranges(snippet_input, expected_message):
+    document = document_fixture()
     validation_messages: List[ValidationMessage] = validate_snippet_within_document(
-        snippet_input, "SPDX-2.3", document_fixture()
+        snippet_input, "SPDX-2.3", document, build_document_index(document)
     )
 
     expected = ValidationMessage(
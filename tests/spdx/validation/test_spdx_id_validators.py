@@ -6,6 +6,7 @@ from unittest import TestCase
 import pytest
 
 from spdx_tools.spdx.constants import DOCUMENT_SPDX_ID
+from spdx_tools.spdx.validation.document_index import build_document_index
 from spdx_tools.spdx.validation.spdx_id_validators import (
     get_list_of_all_spdx_ids,
     is_external_doc_ref_present_in_document,
@@ -170,3 +171,16 @@ def test_invalid_spdx_id_with_check_files():
     assert validation_messages == [
         'did not find the referenced spdx_id "SPDXRef-Package1" in the SPDX document\'s files'
     ]
+
+
+@pytest.mark.parametrize(
+    "spdx_id",
+    ["DocumentRef-unknown:SPDXRef-File", "DocumentRef-external:SPDXRef-File", "SPDXRef-Package1", "SPDXRef-Filet"],
+)
+@pytest.mark.parametrize("check_document, check_files", [(True, False), (False, True)])
+def test_validate_spdx_id_with_document_index(spdx_id, check_document, check_files):
+    validation_messages = validate_spdx_id(
+        spdx_id, DOCUMENT, check_document, check_files, document_index=build_document_index(DOCUMENT)
+    )
+
+    assert validation_messages == validate_spdx_id(spdx_id, DOCUMENT, check_document, check_files)
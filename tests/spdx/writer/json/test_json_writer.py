@@ -1,12 +1,18 @@
 # SPDX-FileCopyrightText: 2022 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
+import io
 import json
 import os
 
 import pytest
 
-from spdx_tools.spdx.writer.json.json_writer import write_document_to_file
+from spdx_tools.spdx.parser.parse_anything import parse_file
+from spdx_tools.spdx.writer.json.json_writer import (
+    write_document_to_file,
+    write_document_to_stream,
+    write_json_properties,
+)
 from tests.spdx.fixtures import document_fixture
 
 
@@ -46,3 +52,33 @@ def test_document_validation_can_be_overridden(temporary_file_path: str):
     document.creation_info.spdx_id = "InvalidId"
 
     write_document_to_file(document, temporary_file_path, validate=False)
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        document_fixture(),
+        document_fixture(packages=[], files=[], snippets=[], relationships=[], annotations=[]),
+        parse_file(os.path.join(os.path.dirname(__file__), "../../data/SPDXJSONExample-v2.3.spdx.json")),
+    ],
+)
+def test_streaming_output_equals_regular_output(document):
+    output = io.StringIO()
+    streamed_output = io.StringIO()
+
+    write_document_to_stream(document, output, validate=False)
+    write_document_to_stream(document, streamed_output, validate=False, streaming=True)
+
+    assert streamed_output.getvalue() == output.getvalue()
+
+
+def test_write_json_properties():
+    streamed_output = io.StringIO()
+
+    write_json_properties(iter([("empty", iter([])), ("list", iter([{"a": [1, "\n"]}, 2]))]), streamed_output)
+
+    assert streamed_output.getvalue() == json.dumps({"empty": [], "list": [{"a": [1, "\n"]}, 2]}, indent=4)
+
+    empty_output = io.StringIO()
+    write_json_properties(iter([]), empty_output)
+    assert empty_output.getvalue() == json.dumps({}, indent=4)
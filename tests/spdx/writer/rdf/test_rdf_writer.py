@@ -1,13 +1,18 @@
 # SPDX-FileCopyrightText: 2023 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
+import io
 import os
 
 import pytest
+from rdflib import Graph
+from rdflib.compare import isomorphic
 
-from spdx_tools.spdx.model import Document
-from spdx_tools.spdx.writer.rdf.rdf_writer import write_document_to_file
-from tests.spdx.fixtures import document_fixture
+from spdx_tools.common.spdx_licensing import spdx_licensing
+from spdx_tools.spdx.model import Document, RelationshipType
+from spdx_tools.spdx.parser.parse_anything import parse_file
+from spdx_tools.spdx.writer.rdf.rdf_writer import write_document_to_file, write_document_to_stream
+from tests.spdx.fixtures import document_fixture, file_fixture, relationship_fixture
 
 
 @pytest.fixture
@@ -21,3 +26,61 @@ def test_write_document_to_file(temporary_file_path: str):
     document: Document = document_fixture()
 
     write_document_to_file(document, temporary_file_path, False)
+
+
+def document_with_files(number_of_files: int) -> Document:
+    license_expression = spdx_licensing.parse("MIT AND (Apache-2.0 OR GPL-2.0-only WITH Classpath-exception-2.0)")
+    files = [
+        file_fixture(
+            spdx_id=f"SPDXRef-File{index}",
+            name=f"./file{index}",
+            license_concluded=license_expression,
+            license_info_in_file=[license_expression],
+        )
+        for index in range(number_of_files)
+    ]
+    relationships = [
+        relationship_fixture("SPDXRef-Package", RelationshipType.CONTAINS, file.spdx_id) for file in files
+    ]
+    return document_fixture(files=files, relationships=relationships)
+
+
+def write_document_to_bytes(document: Document, canonical: bool = False, streaming: bool = False) -> bytes:
+    stream = io.BytesIO()
+    write_document_to_stream(document, stream, False, canonical=canonical, streaming=streaming)
+    return stream.getvalue()
+
+
+def test_write_document_is_deterministic():
+    document = document_with_files(3)
+    # identical blank nodes below the same parent have to stay distinct
+    document.files[0].license_concluded = spdx_licensing.parse("(MIT OR Apache-2.0) AND (MIT OR Apache-2.0)")
+
+    rdf_bytes = write_document_to_bytes(document)
+
+    assert write_document_to_bytes(document) == rdf_bytes
+    assert isomorphic(
+        Graph().parse(data=rdf_bytes, format="xml"),
+        Graph().parse(data=write_document_to_bytes(document, canonical=True), format="xml"),
+    )
+
+
+@pytest.mark.parametrize(
+    "file_name",
+    ["SPDXJSONExample-v2.3.spdx.json", "SPDXJSONExample-v2.2.spdx.json", "SPDXRdfExample-v2.3.spdx.rdf.xml"],
+)
+def test_streamed_document_equals_graph_output(file_name):
+    document = parse_file(os.path.join(os.path.dirname(__file__), "../../data", file_name))
+
+    streamed_bytes = write_document_to_bytes(document, streaming=True)
+
+    assert write_document_to_bytes(document, streaming=True) == streamed_bytes
+    assert isomorphic(
+        Graph().parse(data=streamed_bytes, format="xml"),
+        Graph().parse(data=write_document_to_bytes(document), format="xml"),
+    )
+
+
+def test_canonical_output_cannot_be_streamed():
+    with pytest.raises(ValueError):
+        write_document_to_bytes(document_fixture(), canonical=True, streaming=True)
@@ -0,0 +1,67 @@
+# SPDX-FileCopyrightText: 2023 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+import io
+
+import pytest
+from rdflib import RDF, RDFS, XSD, BNode, Graph, Literal, URIRef
+from rdflib.compare import isomorphic
+
+from spdx_tools.spdx.rdfschema.namespace import SPDX_NAMESPACE
+from spdx_tools.spdx.writer.rdf.rdf_xml_emitter import RdfXmlEmitter
+
+FILE_NODE = URIRef("https://namespace#SPDXRef-File")
+CHECKSUM_NODE = BNode("checksum")
+TRIPLES = [
+    (FILE_NODE, RDF.type, SPDX_NAMESPACE.File),
+    (FILE_NODE, SPDX_NAMESPACE.fileName, Literal('./<file> & "name"\r\n')),
+    (CHECKSUM_NODE, RDF.type, SPDX_NAMESPACE.Checksum),
+    (CHECKSUM_NODE, SPDX_NAMESPACE.checksumValue, Literal("71c4025dd9897b364f3ebbb42c484ff43d00791c")),
+    (FILE_NODE, SPDX_NAMESPACE.checksum, CHECKSUM_NODE),
+    (FILE_NODE, RDFS.comment, Literal("comment", lang="en")),
+    (URIRef("https://namespace#SPDXRef-Package"), SPDX_NAMESPACE.filesAnalyzed, Literal(True, datatype=XSD.boolean)),
+    (BNode("relationship"), SPDX_NAMESPACE.relatedSpdxElement, FILE_NODE),
+    (BNode("relationship"), RDF.type, SPDX_NAMESPACE.Relationship),
+    (FILE_NODE, SPDX_NAMESPACE.relationship, BNode("relationship")),
+]
+
+
+@pytest.mark.parametrize("flushes", [[], [2, 5], range(len(TRIPLES))])
+def test_emitted_rdf_xml_contains_all_triples(flushes):
+    stream = io.BytesIO()
+    emitter = RdfXmlEmitter(stream)
+    emitter.write_header()
+    for index, triple in enumerate(TRIPLES):
+        emitter.add(triple)
+        if index in flushes:
+            emitter.flush()
+    emitter.write_footer()
+
+    expected_graph = Graph()
+    for triple in TRIPLES:
+        expected_graph.add(triple)
+    assert isomorphic(Graph().parse(data=stream.getvalue(), format="xml"), expected_graph)
+
+
+def test_emitter_remembers_blank_nodes_of_flushed_elements():
+    emitter = RdfXmlEmitter(io.BytesIO())
+    emitter.add((CHECKSUM_NODE, RDF.type, SPDX_NAMESPACE.Checksum))
+    emitter.add((FILE_NODE, SPDX_NAMESPACE.checksum, CHECKSUM_NODE))
+    emitter.add((BNode("member"), RDF.type, SPDX_NAMESPACE.ConjunctiveLicenseSet))
+
+    assert (FILE_NODE, SPDX_NAMESPACE.checksum, None) in emitter
+    assert (FILE_NODE, RDF.type, None) not in emitter
+
+    emitter.flush()
+
+    assert (CHECKSUM_NODE, None, None) in emitter
+    assert (BNode("member"), None, None) not in emitter
+    assert (FILE_NODE, None, None) not in emitter
+
+
+def test_emitter_rejects_unknown_predicates():
+    emitter = RdfXmlEmitter(io.BytesIO())
+    emitter.add((FILE_NODE, URIRef("https://unknown.namespace/predicate"), Literal("value")))
+
+    with pytest.raises(ValueError):
+        emitter.flush()
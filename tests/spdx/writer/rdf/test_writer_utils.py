@@ -2,8 +2,10 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 import pytest
+from rdflib import RDF, BNode, Graph, URIRef
 
-from spdx_tools.spdx.writer.rdf.writer_utils import add_namespace_to_spdx_id
+from spdx_tools.spdx.rdfschema.namespace import SPDX_NAMESPACE
+from spdx_tools.spdx.writer.rdf.writer_utils import add_namespace_to_spdx_id, create_stable_bnode
 
 
 @pytest.mark.parametrize(
@@ -24,3 +26,20 @@ def test_add_namespace_to_spdx_id(spdx_id, namespace, expected, external_namespa
     extended_spdx_id = add_namespace_to_spdx_id(spdx_id, namespace, external_namespaces)
 
     assert extended_spdx_id == expected
+
+
+def test_create_stable_bnode():
+    graph = Graph()
+    parent = URIRef("parentNode")
+
+    node = create_stable_bnode(graph, parent, SPDX_NAMESPACE.checksum, "SHA1", "value")
+
+    assert node == create_stable_bnode(Graph(), parent, SPDX_NAMESPACE.checksum, "SHA1", "value")
+    assert node != create_stable_bnode(graph, parent, SPDX_NAMESPACE.checksum, "SHA1", "other value")
+    assert node != create_stable_bnode(graph, URIRef("otherNode"), SPDX_NAMESPACE.checksum, "SHA1", "value")
+    assert node == create_stable_bnode(graph, parent, SPDX_NAMESPACE.checksum, "SHA1", "value")
+
+    graph.add((node, RDF.type, SPDX_NAMESPACE.Checksum))
+    second_node = create_stable_bnode(graph, parent, SPDX_NAMESPACE.checksum, "SHA1", "value")
+
+    assert second_node == BNode(f"{node}_2")